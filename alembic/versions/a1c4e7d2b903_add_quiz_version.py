@@ -0,0 +1,33 @@
+"""add quiz content version
+
+Revision ID: a1c4e7d2b903
+Revises: 3f9fc13a9af7
+Create Date: 2026-10-17 09:12:41.208311
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1c4e7d2b903'
+down_revision = '3f9fc13a9af7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 테이블은 앱 시작 시 create_all로 생성되므로, 기존 DB에만 컬럼을 추가
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('quizzes'):
+        return
+    columns = {column['name'] for column in inspector.get_columns('quizzes')}
+    if 'version' not in columns:
+        op.add_column(
+            'quizzes',
+            sa.Column('version', sa.Integer(), nullable=False, server_default='1'),
+        )
+
+
+def downgrade() -> None:
+    op.drop_column('quizzes', 'version')
@@ -0,0 +1,99 @@
+"""add submission_answers table
+
+Revision ID: b7d4e2f8a631
+Revises: f1a7c3e9b254
+Create Date: 2026-10-17 18:32:10.418205
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d4e2f8a631'
+down_revision = 'f1a7c3e9b254'
+branch_labels = None
+depends_on = None
+
+
+# 기존 submissions.answers(JSONB)의 {question_id: option_id}를 행으로 옮김
+# 숫자가 아닌 키/값이나 문제에 속하지 않는 선택지는 건너뜀
+BACKFILL_SQL = """
+INSERT INTO submission_answers (submission_id, question_id, option_id, answered_at)
+SELECT kv.submission_id, kv.question_id, kv.option_id, kv.answered_at
+FROM (
+    SELECT s.id AS submission_id,
+           e.key::int AS question_id,
+           e.value::int AS option_id,
+           coalesce(s.updated_at, s.created_at, now()) AS answered_at
+    FROM submissions s
+    CROSS JOIN LATERAL jsonb_each_text(s.answers) e
+    WHERE jsonb_typeof(s.answers) = 'object'
+      AND e.key ~ '^[0-9]{1,9}$'
+      AND e.value ~ '^[0-9]{1,9}$'
+) kv
+JOIN options o ON o.id = kv.option_id AND o.question_id = kv.question_id
+ON CONFLICT (submission_id, question_id) DO NOTHING
+"""
+
+# 되돌릴 때 행으로 저장된 답변을 다시 submissions.answers에 합침
+RESTORE_SQL = """
+UPDATE submissions s
+SET answers = coalesce(s.answers, '{}'::jsonb) || a.answers
+FROM (
+    SELECT submission_id, jsonb_object_agg(question_id::text, option_id) AS answers
+    FROM submission_answers
+    GROUP BY submission_id
+) a
+WHERE a.submission_id = s.id
+"""
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('submissions'):
+        return
+
+    # 앱 시작 시 create_all이 테이블을 먼저 만들었을 수 있으므로 없는 것만 만들고, 백필은 항상 실행 (ON CONFLICT로 멱등)
+    if not inspector.has_table('submission_answers'):
+        op.create_table(
+            'submission_answers',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('submission_id', sa.Integer(), nullable=False),
+            sa.Column('question_id', sa.Integer(), nullable=False),
+            sa.Column('option_id', sa.Integer(), nullable=False),
+            sa.Column('answered_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['submission_id'], ['submissions.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+            sa.ForeignKeyConstraint(['option_id'], ['options.id'], ondelete='CASCADE'),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint(
+                'submission_id', 'question_id', name='uq_submission_answers_submission_id_question_id'
+            ),
+        )
+    indexes = {index['name'] for index in sa.inspect(op.get_bind()).get_indexes('submission_answers')}
+    if op.f('ix_submission_answers_id') not in indexes:
+        op.create_index(op.f('ix_submission_answers_id'), 'submission_answers', ['id'], unique=False)
+    if 'ix_submission_answers_question_id_option_id' not in indexes:
+        op.create_index(
+            'ix_submission_answers_question_id_option_id',
+            'submission_answers',
+            ['question_id', 'option_id'],
+            unique=False,
+        )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('submission_answers'):
+        return
+
+    if inspector.has_table('submissions'):
+        op.execute(RESTORE_SQL)
+    indexes = {index['name'] for index in inspector.get_indexes('submission_answers')}
+    if 'ix_submission_answers_question_id_option_id' in indexes:
+        op.drop_index('ix_submission_answers_question_id_option_id', table_name='submission_answers')
+    if op.f('ix_submission_answers_id') in indexes:
+        op.drop_index(op.f('ix_submission_answers_id'), table_name='submission_answers')
+    op.drop_table('submission_answers')
@@ -0,0 +1,51 @@
+"""add composite and partial indexes for hot queries
+
+Revision ID: c3d8f1a4b527
+Revises: a1c4e7d2b903
+Create Date: 2026-10-17 14:03:27.551902
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3d8f1a4b527'
+down_revision = 'a1c4e7d2b903'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 테이블, 컬럼, 부분 인덱스 조건)
+INDEXES = [
+    ('ix_submissions_user_id_quiz_id_is_completed', 'submissions', ['user_id', 'quiz_id', 'is_completed'], None),
+    ('ix_submissions_in_progress', 'submissions', ['user_id', 'quiz_id'], 'is_completed = false'),
+    ('ix_submissions_quiz_id_created_at', 'submissions', ['quiz_id', 'created_at'], None),
+    ('ix_questions_quiz_id_order_index', 'questions', ['quiz_id', 'order_index'], None),
+    ('ix_options_question_id_order_index', 'options', ['question_id', 'order_index'], None),
+]
+
+
+def upgrade() -> None:
+    # 테이블은 앱 시작 시 create_all로 생성되므로(인덱스 포함), 기존 DB에만 인덱스를 추가
+    inspector = sa.inspect(op.get_bind())
+    # 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행해야 함)
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            if not inspector.has_table(table):
+                continue
+            if name in {index['name'] for index in inspector.get_indexes(table)}:
+                continue
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
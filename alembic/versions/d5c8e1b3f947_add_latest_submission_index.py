@@ -0,0 +1,41 @@
+"""add index for latest submission per user and quiz
+
+Revision ID: d5c8e1b3f947
+Revises: b7d4e2f8a631
+Create Date: 2026-10-17 19:05:42.260913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd5c8e1b3f947'
+down_revision = 'b7d4e2f8a631'
+branch_labels = None
+depends_on = None
+
+
+INDEX_NAME = 'ix_submissions_user_id_quiz_id_created_at'
+
+
+def upgrade() -> None:
+    # 테이블은 앱 시작 시 create_all로 생성되므로(인덱스 포함), 기존 DB에만 인덱스를 추가
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('submissions'):
+        return
+    if INDEX_NAME in {index['name'] for index in inspector.get_indexes('submissions')}:
+        return
+    # WHERE user_id = ? AND quiz_id = ? ORDER BY created_at DESC, id DESC LIMIT 1 용
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX_NAME,
+            'submissions',
+            ['user_id', 'quiz_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(INDEX_NAME, table_name='submissions', postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""add indexes for keyset pagination
+
+Revision ID: e6b2a9c4d718
+Revises: c3d8f1a4b527
+Create Date: 2026-10-17 16:21:08.734415
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6b2a9c4d718'
+down_revision = 'c3d8f1a4b527'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 테이블, 컬럼) - WHERE (created_at, id) < (...) ORDER BY created_at DESC, id DESC 용
+INDEXES = [
+    ('ix_users_created_at_id', 'users', ['created_at', 'id']),
+    ('ix_quizzes_created_by_created_at_id', 'quizzes', ['created_by', 'created_at', 'id']),
+    ('ix_submissions_user_id_created_at_id', 'submissions', ['user_id', 'created_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    # 테이블은 앱 시작 시 create_all로 생성되므로(인덱스 포함), 기존 DB에만 인덱스를 추가
+    inspector = sa.inspect(op.get_bind())
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            if not inspector.has_table(table):
+                continue
+            if name in {index['name'] for index in inspector.get_indexes(table)}:
+                continue
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,55 @@
+"""convert submission json columns to jsonb
+
+Revision ID: f1a7c3e9b254
+Revises: e6b2a9c4d718
+Create Date: 2026-10-17 17:48:55.102637
+
+"""
+from typing import Any, Dict
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'f1a7c3e9b254'
+down_revision = 'e6b2a9c4d718'
+branch_labels = None
+depends_on = None
+
+
+COLUMNS = ['answers', 'question_order', 'option_orders']
+
+
+def _column_types() -> Dict[str, Any]:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('submissions'):
+        return {}
+    return {column['name']: column['type'] for column in inspector.get_columns('submissions')}
+
+
+def upgrade() -> None:
+    # JSONB로 바꾸면 answers || :patch 부분 갱신을 UPDATE 한 번으로 처리할 수 있음
+    # (ALTER COLUMN TYPE은 테이블을 다시 쓰므로 실행 중에는 submissions 테이블이 잠김)
+    types = _column_types()
+    for name in COLUMNS:
+        if name in types and not isinstance(types[name], postgresql.JSONB):
+            op.alter_column(
+                'submissions',
+                name,
+                type_=postgresql.JSONB(),
+                postgresql_using=f'{name}::jsonb',
+            )
+
+
+def downgrade() -> None:
+    types = _column_types()
+    for name in COLUMNS:
+        if name in types and isinstance(types[name], postgresql.JSONB):
+            op.alter_column(
+                'submissions',
+                name,
+                type_=sa.JSON(),
+                postgresql_using=f'{name}::json',
+            )
@@ -1,15 +1,26 @@
-from typing import Generator, Dict
+from typing import Any, AsyncGenerator, Generator, Dict, Optional
 from fastapi import Depends, HTTPException, status, Query
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.core.security import decode_access_token
+from app.db.session import (
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    SessionLocal,
+    run_in_async_session,
+    use_primary,
+)
+from app.services.caching_service import get_async_cache, get_cache
 from app.schemas.token import TokenPayload
-from app.crud.user import user
+from app.crud.base import Cursor, decode_cursor
+from app.crud.user import async_user, user
 
 # User 임포트 추가
 from app.models.user import User
@@ -27,28 +38,114 @@ def get_db() -> Generator:
     finally:
         db.close()
 
-# 현재 로그인한 유저를 토큰에서 추출해 반환
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
+# 비동기 엔드포인트용 데이터베이스 세션 의존성 함수
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 최근에 쓰기를 한 사용자를 기억하는 캐시 키 (읽기를 주 DB로 보내 복제 지연을 피함)
+def _recent_write_key(user_id: int) -> str:
+    return f"recent-write:user:{user_id}"
+
+def _token_user_id(token: str) -> Optional[int]:
+    claims = decode_access_token(token)
+    return int(claims["sub"]) if claims else None
+
+def mark_recent_write(user_id: int) -> None:
+    """
+    응시 생성/제출, 관리자의 퀴즈/문제 생성·수정·삭제 직후 호출합니다. DB_READ_YOUR_WRITES_SECONDS 동안 이 사용자의
+    읽기 전용 세션(get_read_db, get_async_read_db)이 복제본 대신 주 DB를 사용합니다.
+    복제 지연 중에도 사용자가 방금 쓴 내용(새 응시 기록, 관리자가 수정한 퀴즈/문제)을 바로 다시 읽을 수 있게 합니다.
+    """
+    get_cache().set(_recent_write_key(user_id), True, expire=settings.DB_READ_YOUR_WRITES_SECONDS)
+
+# 응답 캐시가 토큰 주체의 현재 상태(활성 여부, 역할)를 확인할 때 사용하는 캐시 키
+def user_status_key(user_id: int) -> str:
+    return f"user-status:{user_id}"
+
+async def _load_user_status(db: AsyncSession, user_id: int) -> Dict[str, Any]:
+    db_user = await async_user.get(db, id=user_id)
+    if db_user is None:
+        # 삭제된 사용자도 기억하여 매 요청마다 DB를 조회하지 않음
+        return {"is_active": False, "role": None}
+    return {"is_active": db_user.is_active, "role": "admin" if db_user.is_admin else "user"}
+
+async def load_user_status(user_id: int) -> Dict[str, Any]:
+    """
+    사용자의 활성 여부와 현재 역할을 DB에서 읽어 CACHE_USER_STATUS_TTL 동안 캐시합니다.
+    CacheMiddleware가 토큰 클레임만 믿고 캐시된 응답을 내주지 않도록 확인할 때 사용하며,
+    캐시된 상태는 미들웨어가 응답 캐시와 함께 한 번에 읽습니다. (user_status_key)
+    """
+    user_status: Dict[str, Any] = await run_in_async_session(_load_user_status, user_id)
+    await get_async_cache().set(
+        user_status_key(user_id), user_status, expire=settings.CACHE_USER_STATUS_TTL
+    )
+    return user_status
+
+def clear_user_status(user_id: int) -> None:
+    """
+    사용자의 활성 여부나 권한을 바꾼 직후 호출합니다. (다음 요청부터 DB 기준 상태로 다시 확인)
+    """
+    get_cache().delete(user_status_key(user_id))
+
+# 읽기 전용 엔드포인트용 세션 (복제본 사용, 최근 쓰기를 한 사용자는 주 DB 사용)
+def get_read_db(token: str = Depends(oauth2_scheme)) -> Generator:
+    db = ReadSessionLocal()
+    try:
+        user_id = _token_user_id(token)
+        if user_id is not None and get_cache().get(_recent_write_key(user_id)):
+            use_primary(db)
+        yield db
+    finally:
+        db.close()
+
+# get_read_db의 비동기 버전
+async def get_async_read_db(
+    token: str = Depends(oauth2_scheme),
+) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncReadSessionLocal() as db:
+        user_id = _token_user_id(token)
+        if user_id is not None and await get_async_cache().get(_recent_write_key(user_id)):
+            use_primary(db)
+        yield db
+
+# 토큰을 검증하고 페이로드를 반환
+def _decode_token(token: str) -> TokenPayload:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
         if "sub" not in payload:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN, detail="토큰에 사용자 정보가 없습니다."
             )
-        token_data = TokenPayload(**payload)
+        return TokenPayload(**payload)
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="자격 증명을 확인할 수 없습니다."
         )
 
+# 현재 로그인한 유저를 토큰에서 추출해 반환
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    token_data = _decode_token(token)
+
     # 사용자 정보 조회
     current_user = user.get(db, id=token_data.sub)
     if not current_user:
         raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
     return current_user
 
+# get_current_user의 비동기 버전 (비동기 엔드포인트에서 스레드풀을 사용하지 않음)
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    token_data = _decode_token(token)
+
+    current_user = await async_user.get(db, id=int(token_data.sub))
+    if not current_user:
+        raise HTTPException(status_code=404, detail="유저를 찾을 수 없습니다.")
+    return current_user
+
 # 현재 유저가 활성 상태인지 확인
 def get_current_active_user(
     current_user: models.User = Depends(get_current_user),
@@ -68,14 +165,29 @@ def get_current_admin_user(
         )
     return current_user
 
-# 페이지네이션 파라미터(skip, limit)를 쿼리에서 받아오는 의존성 함수
+# 커서 페이지네이션 파라미터를 검증하고 (created_at, id)로 변환하는 의존성 함수
+def get_cursor(
+    cursor: Optional[str] = Query(
+        None, description="이전 응답의 X-Next-Cursor 헤더 값 (지정하면 offset 대신 사용)"
+    ),
+) -> Optional[Cursor]:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+# 페이지네이션 파라미터(skip, limit, cursor)를 쿼리에서 받아오는 의존성 함수
 def get_pagination_params(
     skip: int = Query(0, alias="offset", ge=0, description="건너뛸 항목 수"),
     limit: int = Query(10, le=100, description="가져올 항목 수 (최대 100)"),
-) -> Dict[str, int]:
+    cursor: Optional[Cursor] = Depends(get_cursor),
+) -> Dict[str, Any]:
     """
     페이지네이션을 위한 쿼리 파라미터를 반환합니다.
-    - offset: 건너뛸 항목 수 (기본값 0)
+    - offset: 건너뛸 항목 수 (기본값 0, 하위 호환용)
     - limit: 반환할 항목 수 (기본값 10, 최대 100)
+    - cursor: 다음 페이지 커서 (응답의 X-Next-Cursor 헤더), 깊은 페이지도 일정한 속도로 조회됨
     """
-    return {"skip": skip, "limit": limit}
\ No newline at end of file
+    return {"skip": skip, "limit": limit, "cursor": cursor}
\ No newline at end of file
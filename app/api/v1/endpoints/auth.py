@@ -33,7 +33,9 @@ def login_for_access_token(
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
         "access_token": security.create_access_token(
-            db_user.id, expires_delta=access_token_expires
+            db_user.id,
+            expires_delta=access_token_expires,
+            role="admin" if db_user.is_admin else "user",
         ),
         "token_type": "bearer",
     }
@@ -11,7 +11,8 @@ from app.schemas.question import (
     QuestionRead
 )
 from app.crud.question import question_crud
-from app.crud.quiz import quiz_crud
+from app.services.caching_service import get_cache, cache_response, CacheScope
+from app.services.quiz_service import create_question_with_quiz, get_question, get_quiz
 
 router = APIRouter()
 
@@ -28,20 +29,28 @@ def create_question(
     관리자만 문제를 생성할 수 있습니다.
     """
     # 퀴즈가 존재하는지 확인
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = get_quiz(db=db, quiz_id=quiz_id)
     if not quiz:
         raise HTTPException(
             status_code=404,
             detail="퀴즈를 찾을 수 없습니다"
         )
     
-    return question_crud.create_with_quiz(db=db, obj_in=question_in, quiz_id=quiz_id)
+    question = create_question_with_quiz(db=db, obj_in=question_in, quiz_id=quiz_id)
+
+    get_cache().invalidate_tags(f"quiz:{quiz_id}", "quizzes:list")
+    deps.mark_recent_write(current_user.id)
+
+    return question
 
 
 @router.get("/{quiz_id}/questions/", response_model=List[QuestionRead])
+@cache_response(  # 관리자/일반 사용자에 따라 조회 방식만 다름
+    CacheScope.ROLE, tags=("quiz:{quiz_id}",)
+)
 def read_questions(
     quiz_id: int,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_user),
@@ -50,7 +59,7 @@ def read_questions(
     특정 퀴즈에 대한 문제들을 가져옵니다.
     """
     # 퀴즈가 존재하는지 확인
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = get_quiz(db=db, quiz_id=quiz_id)
     if not quiz:
         raise HTTPException(
             status_code=404,
@@ -67,7 +76,7 @@ def read_questions(
             limit=limit
         )
     else:
-        questions = question_crud.get_questions_by_quiz(
+        questions = question_crud.get_by_quiz_with_options(
             db=db, 
             quiz_id=quiz_id, 
             skip=skip, 
@@ -78,16 +87,19 @@ def read_questions(
 
 
 @router.get("/{quiz_id}/questions/{question_id}", response_model=QuestionRead)
+@cache_response(  # 문제 메타데이터는 모든 사용자가 공유
+    CacheScope.PUBLIC, tags=("quiz:{quiz_id}",)
+)
 def read_question(
     quiz_id: int,
     question_id: int,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
     특정 문제를 ID로 조회합니다.
     """
-    question = question_crud.get_question_for_quiz(db=db, quiz_id=quiz_id, question_id=question_id)
+    question = get_question(db=db, quiz_id=quiz_id, question_id=question_id)
     if not question:
         raise HTTPException(
             status_code=404,
@@ -107,16 +119,21 @@ def update_question(
 ) -> Any:
     """
     문제를 업데이트합니다.
+    선택지는 기존 행을 순서대로 수정하므로 저장된 답변이 유지되며, 정답은 반드시 하나여야 합니다.
     관리자만 문제를 수정할 수 있습니다.
     """
-    question = question_crud.get_question_for_quiz(db=db, quiz_id=quiz_id, question_id=question_id)
+    question = get_question(db=db, quiz_id=quiz_id, question_id=question_id)
     if not question:
         raise HTTPException(
             status_code=404,
             detail="문제를 찾을 수 없습니다"
         )
     
-    question = question_crud.update(db=db, db_obj=question, obj_in=question_in)
+    question = question_crud.update_with_options(db=db, db_obj=question, obj_in=question_in)
+
+    get_cache().invalidate_tags(f"quiz:{quiz_id}")
+    deps.mark_recent_write(current_user.id)
+
     return question
 
 
@@ -131,7 +148,7 @@ def delete_question(
     문제를 삭제합니다.
     관리자만 문제를 삭제할 수 있습니다.
     """
-    question = question_crud.get_question_for_quiz(db=db, quiz_id=quiz_id, question_id=question_id)
+    question = get_question(db=db, quiz_id=quiz_id, question_id=question_id)
     if not question:
         raise HTTPException(
             status_code=404,
@@ -139,4 +156,8 @@ def delete_question(
         )
     
     question = question_crud.remove(db=db, id=question_id)
+
+    get_cache().invalidate_tags(f"quiz:{quiz_id}", "quizzes:list")
+    deps.mark_recent_write(current_user.id)
+
     return question
\ No newline at end of file
@@ -1,5 +1,6 @@
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
@@ -10,13 +11,23 @@ from app.schemas.quiz import (
     QuizRead,
     QuizWithQuestions
 )
-from app.services.quiz_service import get_quiz_with_questions, get_quizzes_for_user
-from app.services.caching_service import get_cache
+from app.services.quiz_service import (
+    create_quiz_with_owner,
+    get_quiz,
+    get_quiz_with_questions_async,
+    get_quizzes_for_user,
+)
+from app.services.caching_service import get_cache, cache_response, CacheScope
+from app.crud.base import Cursor, next_cursor
 from app.crud.quiz import quiz_crud
+from app.db.session import run_in_session
 from random import shuffle
 
 router = APIRouter()
 
+# 목록 캐시 값의 형식이 바뀌면 올려서 이전 형식의 키를 읽지 않도록 함
+QUIZ_LIST_CACHE_VERSION = 3
+
 @router.post("/", response_model=QuizRead)
 def create_quiz(
     quiz_in: QuizCreate,
@@ -27,48 +38,76 @@ def create_quiz(
     새로운 퀴즈 생성
     관리자만 퀴즈를 생성할 수 있습니다.
     """
-    quiz = quiz_crud.create_with_owner(db=db, obj_in=quiz_in, owner_id=current_user.id)
+    quiz = create_quiz_with_owner(db=db, obj_in=quiz_in, owner_id=current_user.id)
+
+    get_cache().invalidate_tags("quizzes:list")
+    deps.mark_recent_write(current_user.id)
+
     return quiz
 
 @router.get("/", response_model=List[QuizRead])
 def read_quizzes(
     response: Response,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[Cursor] = Depends(deps.get_cursor),
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
     퀴즈 목록 조회
-    일반 사용자는 자신의 상태가 포함된 퀴즈 목록을, 관리자는 전체 목록을 조회할 수 있습니다.
+    일반 사용자는 자신의 상태가 포함된 퀴즈 목록을, 관리자는 전체 목록을 최신순으로 조회할 수 있습니다.
+    관리자 목록만 커서 페이징을 지원하며, 다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
+    일반 사용자 목록은 skip/limit으로만 페이징하고 cursor는 무시하며 X-Next-Cursor 헤더도 보내지 않습니다.
+    목록은 stale-while-revalidate가 동작하도록 응답 캐시(cache_response) 없이 여기서만 캐시합니다.
     """
     cache = get_cache()
-    cache_key = f"quizzes:list:user:{current_user.id}:skip:{skip}:limit:{limit}"
-    cached_result = cache.get(cache_key)
-
-    if cached_result:
-        return cached_result
-
+    page = f"cursor:{cursor[0].isoformat()}:{cursor[1]}" if cursor else f"skip:{skip}"
+    cache_key = f"quizzes:list:v{QUIZ_LIST_CACHE_VERSION}:user:{current_user.id}:{page}:limit:{limit}"
+
+    # 만료 후에도 stale 허용 시간 동안은 기존 목록을 바로 반환하고 백그라운드에서 갱신
+    page_data = cache.get_or_set(
+        cache_key,
+        lambda: _load_quiz_list(db, current_user, skip, limit, cursor),
+        expire=300,  # 5분 캐싱
+        tags=["quizzes:list", f"quizzes:list:user:{current_user.id}"],
+        background_loader=lambda: run_in_session(_load_quiz_list, current_user, skip, limit, cursor),
+    )
+    # 커서는 목록과 함께 캐시되므로 캐시된(stale일 수 있는) 페이지와 항상 짝이 맞음
+    if page_data["next"]:
+        response.headers["X-Next-Cursor"] = page_data["next"]
+    return page_data["items"]
+
+def _load_quiz_list(
+    db: Session, current_user: User, skip: int, limit: int, cursor: Optional[Cursor] = None
+) -> Dict[str, Any]:
+    """
+    캐시에 저장할 퀴즈 목록 페이지({"items": 목록, "next": 다음 페이지 커서})를 DB에서 읽어옵니다.
+    (백그라운드 갱신에서는 새 세션으로 호출됨)
+    """
     if current_user.is_admin:
-        quizzes = quiz_crud.get_multi_by_owner(db, owner_id=current_user.id, skip=skip, limit=limit)
-    else:
-        quizzes = get_quizzes_for_user(db, current_user, skip=skip, limit=limit)
-
-    cache.set(cache_key, quizzes, expire=300)  # 5분 캐싱
-    return quizzes
+        quizzes = quiz_crud.get_multi_by_owner(
+            db, owner_id=current_user.id, skip=skip, limit=limit, cursor=cursor
+        )
+        items = [QuizRead.model_validate(quiz, from_attributes=True) for quiz in quizzes]
+        return {"items": items, "next": next_cursor(quizzes, limit)}
+    return {"items": get_quizzes_for_user(db, current_user, skip=skip, limit=limit), "next": None}
 
 @router.get("/{quiz_id}", response_model=QuizWithQuestions)
-def read_quiz(
+@cache_response(  # 사용자마다 문제/선택지가 무작위로 출제됨
+    CacheScope.USER, tags=("quiz:{quiz_id}",)
+)
+async def read_quiz(
     quiz_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: User = Depends(deps.get_current_user_async),
     page: int = Query(1, ge=1),
     items_per_page: int = Query(10, ge=1, le=100),
 ) -> Any:
     """
     퀴즈 상세 조회 (관리자는 고정된 순서, 사용자는 랜덤 출제 + 페이징)
     """
-    quiz = get_quiz_with_questions(db, quiz_id)
+    quiz = await get_quiz_with_questions_async(db, quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
 
@@ -130,15 +169,14 @@ def update_quiz(
     퀴즈 수정
     관리자만 수정할 수 있습니다.
     """
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = get_quiz(db=db, quiz_id=quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
 
     quiz = quiz_crud.update(db=db, db_obj=quiz, obj_in=quiz_in)
 
-    cache = get_cache()
-    cache.clear_prefix(f"quiz:{quiz_id}")
-    cache.clear_prefix("quizzes:list")
+    get_cache().invalidate_tags(f"quiz:{quiz_id}", "quizzes:list")
+    deps.mark_recent_write(current_user.id)
 
     return quiz
 
@@ -152,14 +190,13 @@ def delete_quiz(
     퀴즈 삭제
     관리자만 삭제할 수 있습니다.
     """
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = get_quiz(db=db, quiz_id=quiz_id)
     if not quiz:
         raise HTTPException(status_code=404, detail="퀴즈를 찾을 수 없습니다.")
 
     quiz = quiz_crud.remove(db=db, id=quiz_id)
 
-    cache = get_cache()
-    cache.clear_prefix(f"quiz:{quiz_id}")
-    cache.clear_prefix("quizzes:list")
+    get_cache().invalidate_tags(f"quiz:{quiz_id}", "quizzes:list")
+    deps.mark_recent_write(current_user.id)
 
     return quiz
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Any, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.api import deps
@@ -13,10 +14,16 @@ from app.schemas.submission import (
     AnswerSubmit
 )
 from app.schemas.question import QuestionForUser
-from app.crud.submission import submission_crud
-from app.crud.quiz import quiz_crud
+from app.crud.base import Cursor, next_cursor
+from app.crud.submission import async_submission_crud, submission_crud
 from app.services.grading_service import grade_submission
-from app.services.quiz_service import get_quiz_with_questions
+from app.services.caching_service import get_cache
+from app.services.quiz_service import (
+    get_quiz,
+    get_quiz_async,
+    get_submission_async,
+    start_submission,
+)
 
 router = APIRouter()
 
@@ -32,7 +39,7 @@ def create_submission(
     (응답에는 아직 답안은 포함되지 않습니다)
     """
     # 퀴즈가 존재하는지 확인
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = get_quiz(db=db, quiz_id=quiz_id)
     if not quiz:
         raise HTTPException(
             status_code=404,
@@ -56,22 +63,32 @@ def create_submission(
         score=0
     )
     
-    return submission_crud.create(db=db, obj_in=submission_in)
+    submission = start_submission(db=db, obj_in=submission_in)
+
+    # 퀴즈 목록의 응시 상태가 바뀌므로 해당 사용자의 목록 캐시 무효화
+    get_cache().invalidate_tags(f"quizzes:list:user:{current_user.id}")
+    # 복제 지연 중에도 방금 만든 응시 기록이 조회되도록 잠시 주 DB에서 읽음
+    deps.mark_recent_write(current_user.id)
+
+    return submission
 
 
 @router.get("/{quiz_id}/submissions/", response_model=List[SubmissionRead])
-def read_submissions(
+async def read_submissions(
     quiz_id: int,
-    db: Session = Depends(deps.get_db),
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
     skip: int = 0,
     limit: int = 100,
-    current_user: User = Depends(deps.get_current_user),
+    cursor: Optional[Cursor] = Depends(deps.get_cursor),
+    current_user: User = Depends(deps.get_current_user_async),
 ) -> Any:
     """
-    특정 퀴즈에 대한 모든 응시 기록을 조회합니다.
+    특정 퀴즈에 대한 모든 응시 기록을 최신순으로 조회합니다.
     일반 사용자는 본인의 응시 기록만 조회 가능하고, 관리자는 전체 조회가 가능합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
     """
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = await get_quiz_async(db, quiz_id=quiz_id)
     if not quiz:
         raise HTTPException(
             status_code=404,
@@ -79,29 +96,32 @@ def read_submissions(
         )
     
     if current_user.is_admin:
-        submissions = submission_crud.get_by_quiz(
-            db=db, quiz_id=quiz_id, skip=skip, limit=limit
+        submissions = await async_submission_crud.get_by_quiz(
+            db=db, quiz_id=quiz_id, skip=skip, limit=limit, cursor=cursor
         )
     else:
         # `user_id`는 `current_user.id`에서 가져와야 합니다.
-        submissions = submission_crud.get_by_user_and_quiz(
-            db=db, user_id=current_user.id, quiz_id=quiz_id, skip=skip, limit=limit
+        submissions = await async_submission_crud.get_by_user_and_quiz(
+            db=db, user_id=current_user.id, quiz_id=quiz_id, skip=skip, limit=limit, cursor=cursor
         )
     
+    next_page = next_cursor(submissions, limit)
+    if next_page:
+        response.headers["X-Next-Cursor"] = next_page
     return submissions
 
 
 @router.get("/{quiz_id}/submissions/{submission_id}", response_model=SubmissionWithDetails)
-def read_submission(
+async def read_submission(
     quiz_id: int,
     submission_id: int,
-    db: Session = Depends(deps.get_db),
-    current_user: User = Depends(deps.get_current_user),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: User = Depends(deps.get_current_user_async),
 ) -> Any:
     """
     특정 응시 기록을 ID로 조회합니다.
     """
-    submission = submission_crud.get_by_quiz_and_submission_id(
+    submission = await get_submission_async(
         db=db, quiz_id=quiz_id, submission_id=submission_id
     )
     if not submission:
@@ -154,36 +174,38 @@ def submit_answers(
 ) -> Any:
     """
     퀴즈 응시 도중 여러 문제에 대한 답변을 제출합니다.
+    본인 소유이고 완료되지 않은 응시 기록이면 UPDATE 한 번으로 답변을 병합하여 저장합니다.
     """
-    submission = submission_crud.get(db=db, id=submission_id)
-    if not submission or submission.quiz_id != quiz_id:
+    submission = submission_crud.add_answers(
+        db=db,
+        submission_id=submission_id,
+        answers_in=answers_in,  # 여러 문제에 대한 답을 한 번에 전달
+        user_id=current_user.id,
+        quiz_id=quiz_id,
+    )
+    if submission is not None:
+        return submission
+
+    # 갱신되지 않았으면 어떤 조건 때문인지 확인하여 알맞은 오류를 반환
+    existing = submission_crud.get(db=db, id=submission_id)
+    if not existing or existing.quiz_id != quiz_id:
         raise HTTPException(
             status_code=404,
             detail="응시 기록을 찾을 수 없습니다."
         )
     
     # 본인 응시 기록인지 확인
-    if submission.user_id != current_user.id:
+    if existing.user_id != current_user.id:
         raise HTTPException(
             status_code=403,
             detail="이 응시 기록을 수정할 권한이 없습니다."
         )
     
     # 이미 제출 완료된 응시 기록은 수정 불가
-    if submission.is_completed:
-        raise HTTPException(
-            status_code=400,
-            detail="이미 제출된 퀴즈는 수정할 수 없습니다."
-        )
-    
-    # 여러 답안 저장
-    submission = submission_crud.add_answers(  # 수정된 add_answers 사용
-        db=db, 
-        submission_id=submission_id, 
-        answers_in=answers_in  # 여러 문제에 대한 답을 한 번에 전달
+    raise HTTPException(
+        status_code=400,
+        detail="이미 제출된 퀴즈는 수정할 수 없습니다."
     )
-    
-    return submission
 
 
 @router.put("/{quiz_id}/submissions/{submission_id}/submit", response_model=SubmissionWithDetails)
@@ -215,17 +237,19 @@ def submit_quiz(
             detail="이미 제출된 퀴즈입니다."
         )
     
-    # 퀴즈 정보와 문제 불러오기
-    quiz = get_quiz_with_questions(db=db, quiz_id=quiz_id)
-
-    # 채점 수행
-    graded_submission = grade_submission(db=db, submission=submission, quiz=quiz)
+    # 채점 수행 (문항을 불러오지 않고 DB에서 바로 집계)
+    graded_submission = grade_submission(db=db, submission=submission)
     
     # 제출 완료 처리
     update_data = {"is_completed": True, "score": graded_submission.score}
     updated_submission = submission_crud.update(
         db=db, db_obj=submission, obj_in=update_data
     )
+
+    # 퀴즈 목록의 응시 상태가 바뀌므로 해당 사용자의 목록 캐시 무효화
+    get_cache().invalidate_tags(f"quizzes:list:user:{current_user.id}")
+    # 제출 직후 결과 조회가 복제본의 이전 상태를 보지 않도록 잠시 주 DB에서 읽음
+    deps.mark_recent_write(current_user.id)
     
     return updated_submission
 
@@ -234,7 +258,7 @@ def submit_quiz(
 def get_submission_result(
     quiz_id: int,
     submission_id: int,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     current_user: User = Depends(deps.get_current_user),
 ) -> Any:
     """
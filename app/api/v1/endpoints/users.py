@@ -1,10 +1,11 @@
 from typing import Any, List, Dict
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
 from app.api import deps
+from app.crud.base import next_cursor
 
 router = APIRouter()
 
@@ -32,18 +33,24 @@ def update_user_me(
             user_in.is_admin = current_user.is_admin
 
     user = crud.user.update(db, db_obj=current_user, obj_in=user_in)
+    deps.clear_user_status(user.id)
     return user
 
 @router.get("/", response_model=List[schemas.User])
 def read_users(
+    response: Response,
     db: Session = Depends(deps.get_db),
-    pagination: Dict[str, int] = Depends(deps.get_pagination_params),
+    pagination: Dict[str, Any] = Depends(deps.get_pagination_params),
     current_user: models.User = Depends(deps.get_current_admin_user),
 ) -> Any:
     """
-    사용자 목록을 조회합니다. 관리자만 접근 가능합니다.
+    사용자 목록을 최신 가입순으로 조회합니다. 관리자만 접근 가능합니다.
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환합니다.
     """
     users = crud.user.get_multi(db, **pagination)
+    cursor = next_cursor(users, pagination["limit"])
+    if cursor:
+        response.headers["X-Next-Cursor"] = cursor
     return users
 
 @router.post("/", response_model=schemas.User)
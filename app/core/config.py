@@ -1,6 +1,6 @@
 import os
 from pydantic_settings import BaseSettings
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 class Settings(BaseSettings):
     API_V1_STR: str = "/api/v1"
@@ -11,11 +11,56 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str
     POSTGRES_DB: str
     SQLALCHEMY_DATABASE_URI: Optional[str] = None
+    SQLALCHEMY_ASYNC_DATABASE_URI: Optional[str] = None  # 비동기 엔진(asyncpg)용, 없으면 동기 URI에서 생성
+    # 읽기 전용 복제본 (없으면 읽기 요청도 주 DB 사용)
+    SQLALCHEMY_REPLICA_DATABASE_URI: Optional[str] = None
+    SQLALCHEMY_ASYNC_REPLICA_DATABASE_URI: Optional[str] = None  # 없으면 복제본 URI에서 생성
+    DB_READ_YOUR_WRITES_SECONDS: int = 10  # 응시 생성/제출 후 이 시간(초) 동안 해당 사용자의 읽기를 주 DB로 보냄
+    # DB 커넥션 풀 (동기/비동기 엔진에 각각 적용, 워커당 최대 DB_POOL_SIZE + DB_MAX_OVERFLOW개)
+    DB_POOL_SIZE: int = 10  # 항상 유지하는 커넥션 수
+    DB_MAX_OVERFLOW: int = 20  # 풀이 가득 찼을 때 추가로 열 수 있는 커넥션 수
+    DB_POOL_TIMEOUT: float = 5.0  # 커넥션을 얻기 위해 기다리는 최대 시간(초), 초과 시 오류
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(초)보다 오래된 커넥션은 다시 연결
+    DB_STATEMENT_TIMEOUT_MS: int = 5000  # 서버 측 쿼리 시간 제한(밀리초), 0이면 제한 없음
 
     BACKEND_CORS_ORIGINS: List[str] = []
 
     REDIS_HOST: str
     REDIS_PORT: int = 6379
+    REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50  # 워커당 Redis 커넥션 풀 크기
+    REDIS_POOL_TIMEOUT: float = 1.0  # 풀이 가득 찼을 때 커넥션을 기다리는 최대 시간(초)
+    REDIS_SOCKET_TIMEOUT: float = 1.0  # 캐시 명령 시간 초과(초), 초과 시 서킷 브레이커 실패로 집계
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 2.0
+    REDIS_HEALTH_CHECK_INTERVAL: int = 30  # 유휴 커넥션 상태 확인 주기(초)
+
+    # 워커 프로세스 내부 L1 캐시 (Redis 앞단)
+    CACHE_LOCAL_ENABLED: bool = True
+    CACHE_LOCAL_MAX_ITEMS: int = 1024  # L1에 보관할 최대 키 개수
+    CACHE_LOCAL_TTL: int = 30  # L1 최대 보관 시간(초), Redis TTL보다 길어지지 않음
+    CACHE_INVALIDATION_CHANNEL: str = "cache:invalidate"  # 워커 간 무효화 pub/sub 채널
+    CACHE_LOCK_TIMEOUT: float = 5.0  # 캐시 재계산 시 워커 간 Redis 락 유지 시간(초)
+    CACHE_EARLY_REFRESH_BETA: float = 1.0  # 확률적 조기 갱신 강도 (0이면 사용 안 함)
+    # 키 접두사(네임스페이스)별 stale-while-revalidate 허용 시간(초)
+    # 만료(soft TTL) 후 이 시간 동안은 기존 값을 바로 반환하고 백그라운드에서 갱신함
+    CACHE_STALE_TTL: Dict[str, int] = {"quiz:": 300, "quizzes:list:": 120}
+    CACHE_REFRESH_WORKERS: int = 4  # 백그라운드 갱신 스레드 수
+    CACHE_TAG_PRUNE_PROBABILITY: float = 0.01  # 태그를 단 저장 중 태그 집합의 만료된 멤버를 정리하는 비율
+    # 캐시 값 압축: 직렬화된 값이 임계값(바이트) 이상일 때만 압축 (zlib, zstd 또는 none)
+    # zstd는 선택 의존성(zstandard, poetry install -E zstd)이며 설치되지 않았으면 zlib을 사용함
+    CACHE_COMPRESSION: str = "zlib"
+    CACHE_COMPRESSION_THRESHOLD: int = 1024
+    CACHE_COMPRESSION_LEVEL: int = 3  # 높을수록 더 작게 압축하지만 CPU를 더 사용
+    CACHE_NEGATIVE_TTL: int = 30  # 존재하지 않는 퀴즈/문제/제출 조회 결과를 기억하는 시간(초)
+    CACHE_USER_STATUS_TTL: int = 30  # 응답 캐시가 확인하는 사용자 활성 여부/역할을 기억하는 시간(초)
+    CACHE_QUIZ_SNAPSHOT_TTL: int = 86400  # 버전별 퀴즈 스냅샷 보관 시간(초), 내용은 버전으로 검증
+    # Redis 장애 시 캐시를 우회하는 서킷 브레이커
+    CACHE_BREAKER_FAILURE_THRESHOLD: int = 5  # 연속 실패(연결 오류/시간 초과) 횟수가 이 값에 도달하면 차단
+    CACHE_BREAKER_RESET_TIMEOUT: float = 10.0  # 차단 후 시험 요청(half-open)을 보내기까지의 시간(초)
+    # 워커 시작 시 활성 퀴즈 캐시 워밍업
+    CACHE_WARMUP_ENABLED: bool = True
+    CACHE_WARMUP_BATCH_SIZE: int = 50  # 한 번의 DB 조회로 불러올 퀴즈 수
+    CACHE_WARMUP_CONCURRENCY: int = 4  # 동시에 실행할 배치 수 (DB 커넥션 사용량 상한)
 
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 720  # 나중에 기본값 60분 으로 변경
     SECRET_KEY: str
@@ -37,4 +82,14 @@ if settings.SQLALCHEMY_DATABASE_URI is None:
     settings.SQLALCHEMY_DATABASE_URI = (
         f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}"
         f"@{postgres_server}:5432/{settings.POSTGRES_DB}"
+    )
+
+if settings.SQLALCHEMY_ASYNC_DATABASE_URI is None:
+    settings.SQLALCHEMY_ASYNC_DATABASE_URI = settings.SQLALCHEMY_DATABASE_URI.replace(
+        "postgresql://", "postgresql+asyncpg://", 1
+    )
+
+if settings.SQLALCHEMY_REPLICA_DATABASE_URI and settings.SQLALCHEMY_ASYNC_REPLICA_DATABASE_URI is None:
+    settings.SQLALCHEMY_ASYNC_REPLICA_DATABASE_URI = settings.SQLALCHEMY_REPLICA_DATABASE_URI.replace(
+        "postgresql://", "postgresql+asyncpg://", 1
     )
\ No newline at end of file
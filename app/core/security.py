@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
-from typing import Any, Union, Optional
+from typing import Any, Dict, Union, Optional
 
-from jose import jwt  # JWT 토큰 생성을 위한 라이브러리
+from jose import jwt, JWTError  # JWT 토큰 생성을 위한 라이브러리
 from passlib.context import CryptContext  # 비밀번호 해시화를 위한 라이브러리
 from fastapi.security import OAuth2PasswordBearer  # OAuth2 인증을 위한 FastAPI 클래스
 
@@ -14,7 +14,9 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
 def create_access_token(
-    subject: Union[str, Any], expires_delta: Optional[timedelta] = None
+    subject: Union[str, Any],
+    expires_delta: Optional[timedelta] = None,
+    role: Optional[str] = None,
 ) -> str:
     """
     액세스 토큰(JWT)을 생성하는 함수
@@ -22,6 +24,7 @@ def create_access_token(
     Args:
         subject: 토큰에 담을 사용자 식별자 (예: user_id 또는 email)
         expires_delta: 토큰 만료 기간 (지정하지 않으면 기본값 사용)
+        role: 사용자 역할 ("admin" 또는 "user"), 역할별 응답 캐시 키에 사용
 
     Returns:
         JWT 문자열
@@ -36,11 +39,31 @@ def create_access_token(
 
     # 토큰에 담을 데이터 (만료 시간, 사용자 정보)
     to_encode = {"exp": expire, "sub": str(subject)}
+    if role is not None:
+        to_encode["role"] = role
 
     # JWT 토큰 생성 (HS256 알고리즘 사용)
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm="HS256")
     return encoded_jwt
 
+def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
+    """
+    액세스 토큰을 검증하고 클레임을 반환하는 함수 (DB 조회 없음)
+
+    Args:
+        token: JWT 문자열
+
+    Returns:
+        클레임 딕셔너리, 서명이 유효하지 않거나 만료되었거나 sub가 없으면 None
+    """
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+    except JWTError:
+        return None
+    if "sub" not in payload:
+        return None
+    return payload
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     입력된 비밀번호와 해시된 비밀번호가 일치하는지 검증하는 함수
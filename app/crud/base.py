@@ -1,8 +1,14 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import base64
+import json
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import desc, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import Select
 
 from app.models.base import Base
 
@@ -10,6 +16,62 @@ from app.models.base import Base
 ModelType = TypeVar("ModelType", bound=Base)  # SQLAlchemy 모델
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)  # 생성 시 사용되는 Pydantic 스키마
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)  # 업데이트 시 사용되는 Pydantic 스키마
+QueryType = TypeVar("QueryType", bound=Union[Query, Select])  # Query(동기) 또는 Select(비동기)
+
+# 키셋 페이지네이션 커서: 이전 페이지 마지막 항목의 (created_at, id)
+Cursor = Tuple[datetime, int]
+
+
+def encode_cursor(created_at: Union[datetime, str], id: int) -> str:
+    """
+    (created_at, id)를 클라이언트에 전달할 불투명한 커서 문자열로 변환합니다.
+    """
+    if isinstance(created_at, datetime):
+        created_at = created_at.isoformat()
+    raw = json.dumps([created_at, id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    커서 문자열을 (created_at, id)로 복원합니다. 형식이 잘못되면 ValueError가 발생합니다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(id)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("잘못된 커서입니다.") from exc
+
+
+def next_cursor(items: Sequence[Any], limit: int) -> Optional[str]:
+    """
+    페이지가 가득 찼으면 마지막 항목으로 다음 페이지 커서를 만듭니다. (ORM 객체, 스키마, dict 모두 지원)
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    if isinstance(last, dict):
+        return encode_cursor(last["created_at"], last["id"])
+    return encode_cursor(last.created_at, last.id)
+
+
+def paginate(
+    query: QueryType, model: Any, *, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
+) -> QueryType:
+    """
+    최신순(created_at, id 내림차순)으로 정렬하고 페이지를 자릅니다.
+    커서가 있으면 OFFSET 대신 WHERE (created_at, id) < 커서 조건을 사용하므로
+    (…, created_at, id) 인덱스를 따라 읽어 깊은 페이지도 첫 페이지와 같은 비용으로 조회됩니다.
+    """
+    query = query.order_by(desc(model.created_at), desc(model.id))
+    if cursor is not None:
+        query = query.filter(tuple_(model.created_at, model.id) < tuple_(*cursor))
+    else:
+        query = query.offset(skip)
+    query = query.limit(limit)
+    return query
+
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
@@ -34,19 +96,22 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         return db.query(self.model).filter(self.model.id == id).first()
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[ModelType]:
+    def get_multi(
+        self, db: Session, *, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
+    ) -> List[ModelType]:
         """
-        여러 객체를 페이징하여 조회합니다.
+        여러 객체를 최신순으로 페이징하여 조회합니다.
 
         Args:
             db: DB 세션
-            skip: 건너뛸 항목 수
+            skip: 건너뛸 항목 수 (cursor가 없을 때만 사용)
             limit: 가져올 최대 항목 수
+            cursor: 이전 페이지 마지막 항목의 (created_at, id)
 
         Returns:
             객체 리스트
         """
-        return db.query(self.model).offset(skip).limit(limit).all()
+        return paginate(db.query(self.model), self.model, skip=skip, limit=limit, cursor=cursor).all()
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """
@@ -110,4 +175,73 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj = db.query(self.model).get(id)
         db.delete(obj)
         db.commit()
-        return obj
\ No newline at end of file
+        return obj
+
+
+class AsyncCRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    """
+    AsyncSession을 사용하는 CRUDBase의 비동기 버전입니다.
+    비동기 세션에서는 관계를 지연 로딩할 수 없으므로, 관계가 필요한 조회는 하위 클래스에서 미리 로드해야 합니다.
+    """
+
+    def __init__(self, model: Type[ModelType]):
+        self.model = model
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[ModelType]:
+        """
+        ID로 단일 객체를 조회합니다.
+        """
+        return await db.get(self.model, id)
+
+    async def get_multi(
+        self, db: AsyncSession, *, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None
+    ) -> List[ModelType]:
+        """
+        여러 객체를 최신순으로 페이징하여 조회합니다.
+        """
+        result = await db.execute(
+            paginate(select(self.model), self.model, skip=skip, limit=limit, cursor=cursor)
+        )
+        return result.scalars().all()
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """
+        새 객체를 생성합니다.
+        """
+        db_obj = self.model(**jsonable_encoder(obj_in))
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: Union[UpdateSchemaType, Dict[str, Any]]
+    ) -> ModelType:
+        """
+        기존 객체를 업데이트합니다.
+        """
+        obj_data = jsonable_encoder(db_obj)
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.dict(exclude_unset=True)
+
+        for field in obj_data:
+            if field in update_data:
+                setattr(db_obj, field, update_data[field])
+
+        db.add(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[ModelType]:
+        """
+        객체를 삭제합니다.
+        """
+        obj = await db.get(self.model, id)
+        if obj is not None:
+            await db.delete(obj)
+            await db.commit()
+        return obj
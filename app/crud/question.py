@@ -1,11 +1,17 @@
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from typing import List, Optional, Dict, Any, Union
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 import random
 
 from app.models.question import Question
 from app.models.option import Option
+from app.models.submission_answer import SubmissionAnswer
 from app.schemas.question import QuestionCreate, QuestionUpdate, OptionCreate
-from app.crud.base import CRUDBase
+from app.crud.base import AsyncCRUDBase, CRUDBase
+from app.crud.quiz import quiz_crud
 
 class CRUDQuestion(CRUDBase[Question, QuestionCreate, QuestionUpdate]):
     def create_with_quiz(
@@ -37,6 +43,7 @@ class CRUDQuestion(CRUDBase[Question, QuestionCreate, QuestionUpdate]):
             )
             db.add(db_option)
 
+        quiz_crud.bump_version(db, quiz_id=db_question.quiz_id)
         db.commit()
         db.refresh(db_question)
         return db_question
@@ -66,6 +73,7 @@ class CRUDQuestion(CRUDBase[Question, QuestionCreate, QuestionUpdate]):
             )
             db.add(db_option)
 
+        quiz_crud.bump_version(db, quiz_id=db_question.quiz_id)
         db.commit()
         db.refresh(db_question)
         return db_question
@@ -73,29 +81,104 @@ class CRUDQuestion(CRUDBase[Question, QuestionCreate, QuestionUpdate]):
     def update_with_options(
         self, db: Session, *, db_obj: Question, obj_in: QuestionUpdate
     ) -> Question:
+        """
+        문제와 선택지를 수정합니다.
+        선택지는 순서대로 기존 행을 제자리에서 고치므로 ID가 유지되어 저장된 답변(submission_answers)이 남습니다.
+        목록이 길어지면 뒤에 새 선택지를 추가하고, 짧아지면 남는 선택지를 삭제하되 답변이 저장된 선택지는 삭제하지 않습니다.
+        수정 후에도 정답은 반드시 하나여야 합니다.
+        """
         # 문제 내용 업데이트
         if obj_in.content is not None:
             db_obj.content = obj_in.content
 
         # 선택지 업데이트
         if obj_in.options:
-            # 기존 선택지 삭제
-            db.query(Option).filter(Option.question_id == db_obj.id).delete()
+            existing = (
+                db.query(Option)
+                .filter(Option.question_id == db_obj.id)
+                .order_by(Option.order_index, Option.id)
+                .all()
+            )
+            removed = existing[len(obj_in.options):]
+            if removed:
+                answered = (
+                    db.query(SubmissionAnswer.id)
+                    .filter(SubmissionAnswer.option_id.in_([option.id for option in removed]))
+                    .first()
+                )
+                if answered:
+                    raise HTTPException(status_code=400, detail="답변이 저장된 선택지는 삭제할 수 없습니다.")
 
-            # 새 선택지 추가
+            options = []
             for i, option_data in enumerate(obj_in.options):
-                db_option = Option(
-                    content=option_data.content,
-                    is_correct=option_data.is_correct,
-                    question_id=db_obj.id,
-                    order_index=i
-                )
-                db.add(db_option)
+                if i < len(existing):
+                    # 기존 선택지는 보낸 필드만 수정
+                    db_option = existing[i]
+                    for field, value in option_data.model_dump(exclude_unset=True).items():
+                        setattr(db_option, field, value)
+                    db_option.order_index = i
+                    options.append(db_option)
+                else:
+                    # 새 선택지 추가
+                    if option_data.content is None:
+                        raise HTTPException(status_code=400, detail="새 선택지에는 내용이 필요합니다.")
+                    db_option = Option(
+                        content=option_data.content,
+                        is_correct=bool(option_data.is_correct),
+                        question_id=db_obj.id,
+                        order_index=i
+                    )
+                    db.add(db_option)
+                    options.append(db_option)
+
+            # 정답이 하나인지 검증
+            correct_count = sum(1 for option in options if option.is_correct)
+            if correct_count != 1:
+                raise HTTPException(status_code=400, detail="정답은 반드시 하나여야 합니다.")
+
+            for db_option in removed:
+                db.delete(db_option)
 
+        quiz_crud.bump_version(db, quiz_id=db_obj.quiz_id)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Question,
+        obj_in: Union[QuestionUpdate, Dict[str, Any]]
+    ) -> Question:
+        """
+        문제를 수정하고 퀴즈의 콘텐츠 버전을 올립니다.
+        """
+        quiz_crud.bump_version(db, quiz_id=db_obj.quiz_id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
+    def remove(self, db: Session, *, id: int) -> Question:
+        """
+        문제를 삭제하고 퀴즈의 콘텐츠 버전을 올립니다.
+        """
+        obj = db.query(Question).get(id)
+        quiz_crud.bump_version(db, quiz_id=obj.quiz_id)
+        db.delete(obj)
+        db.commit()
+        return obj
+
+    def get_question_for_quiz(
+        self, db: Session, *, quiz_id: int, question_id: int
+    ) -> Optional[Question]:
+        """
+        퀴즈에 속한 특정 문제를 조회합니다.
+        """
+        return (
+            db.query(Question)
+            .filter(Question.id == question_id, Question.quiz_id == quiz_id)
+            .first()
+        )
+
     def get_questions_by_quiz(
         self, db: Session, *, quiz_id: int, skip: int = 0, limit: int = 100
     ) -> List[Question]:
@@ -111,14 +194,83 @@ class CRUDQuestion(CRUDBase[Question, QuestionCreate, QuestionUpdate]):
             .all()
         )
         
+    def get_by_quiz_with_options(
+        self, db: Session, *, quiz_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Question]:
+        """
+        특정 퀴즈의 문제를 선택지와 함께 가져옵니다.
+        문제 수와 관계없이 쿼리 두 번(문제, 선택지 IN 조회)으로 불러옵니다.
+        """
+        questions = (
+            db.query(Question)
+            .filter(Question.quiz_id == quiz_id)
+            .order_by(Question.order_index)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return self.load_options(db, questions)
+
+    def get_all_by_quiz(self, db: Session, *, quiz_id: int) -> List[Question]:
+        """
+        특정 퀴즈의 모든 문제를 가져옵니다. (개수 제한 없음, 선택지가 필요하면 출제할 문제만 load_options로 불러옴)
+        """
+        return (
+            db.query(Question)
+            .filter(Question.quiz_id == quiz_id)
+            .order_by(Question.order_index)
+            .all()
+        )
+
+    def get_questions_by_ids(self, db: Session, *, question_ids: List[int]) -> List[Question]:
+        """
+        주어진 ID의 문제들을 선택지와 함께 주어진 ID 순서대로 가져옵니다. 없는 ID는 건너뜁니다.
+        """
+        if not question_ids:
+            return []
+        questions = db.query(Question).filter(Question.id.in_(question_ids)).all()
+        by_id = {question.id: question for question in questions}
+        return self.load_options(
+            db, [by_id[question_id] for question_id in question_ids if question_id in by_id]
+        )
+
+    def get_options_by_question_ids(
+        self, db: Session, *, question_ids: List[int]
+    ) -> Dict[int, List[Option]]:
+        """
+        여러 문제의 선택지를 IN 쿼리 한 번으로 가져와 {question_id: [선택지, ...]}로 묶어 반환합니다.
+        선택지는 문제별 order_index 순서이며, 선택지가 없는 문제는 빈 목록입니다.
+        """
+        options: Dict[int, List[Option]] = {question_id: [] for question_id in question_ids}
+        if not question_ids:
+            return options
+        rows = (
+            db.query(Option)
+            .filter(Option.question_id.in_(question_ids))
+            .order_by(Option.question_id, Option.order_index, Option.id)
+        )
+        for option in rows:
+            options[option.question_id].append(option)
+        return options
+
+    def load_options(self, db: Session, questions: List[Question]) -> List[Question]:
+        """
+        문제들의 options 관계를 get_options_by_question_ids 한 번으로 채웁니다.
+        이후 question.options에 접근해도 문제마다 지연 로딩 쿼리가 나가지 않습니다.
+        """
+        options = self.get_options_by_question_ids(db, question_ids=[q.id for q in questions])
+        for question in questions:
+            set_committed_value(question, "options", options[question.id])
+        return questions
+
     def get_random_questions_for_quiz(self, db: Session, quiz_id: int, user_id: int, skip: int = 0, limit: int = 100) -> List[Question]:
         """
-        특정 퀴즈에 대한 랜덤 문제를 가져오는 메서드.
+        특정 퀴즈에 대한 랜덤 문제를 선택지와 함께 가져오는 메서드.
         """
         questions = db.query(Question).filter(Question.quiz_id == quiz_id).offset(skip).limit(limit).all()
-        if len(questions) <= limit:
-            return questions
-        return random.sample(questions, limit)
+        if len(questions) > limit:
+            questions = random.sample(questions, limit)
+        return self.load_options(db, questions)
 
     def randomize_options(self, options: List[Option]) -> List[Dict]:
         """
@@ -179,8 +331,12 @@ class CRUDQuestion(CRUDBase[Question, QuestionCreate, QuestionUpdate]):
         if existing_option_orders:
             option_orders = existing_option_orders
         else:
+            # 선택된 문제들의 선택지를 한 번에 가져옴
+            options_by_question = self.get_options_by_question_ids(
+                db, question_ids=[q.id for q in questions]
+            )
             for q in questions:
-                options = db.query(Option).filter(Option.question_id == q.id).all()
+                options = options_by_question[q.id]
                 if randomize_options:
                     # 무작위 순서
                     option_orders[str(q.id)] = self.randomize_options(options)
@@ -193,4 +349,41 @@ class CRUDQuestion(CRUDBase[Question, QuestionCreate, QuestionUpdate]):
 
         return questions, question_order, option_orders
 
-question_crud = CRUDQuestion(Question)
\ No newline at end of file
+question_crud = CRUDQuestion(Question)
+
+
+class AsyncCRUDQuestion(AsyncCRUDBase[Question, QuestionCreate, QuestionUpdate]):
+    """
+    비동기 엔드포인트에서 사용하는 문제 조회 메서드입니다. 선택지는 항상 함께 로드합니다.
+    """
+
+    async def get_question_for_quiz(
+        self, db: AsyncSession, *, quiz_id: int, question_id: int
+    ) -> Optional[Question]:
+        """
+        퀴즈에 속한 특정 문제를 조회합니다.
+        """
+        result = await db.execute(
+            select(Question)
+            .options(selectinload(Question.options))
+            .where(Question.id == question_id, Question.quiz_id == quiz_id)
+        )
+        return result.scalars().first()
+
+    async def get_questions_by_quiz(
+        self, db: AsyncSession, *, quiz_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Question]:
+        """
+        특정 퀴즈의 모든 문제를 가져옵니다.
+        """
+        result = await db.execute(
+            select(Question)
+            .options(selectinload(Question.options))
+            .where(Question.quiz_id == quiz_id)
+            .order_by(Question.order_index)
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+async_question_crud = AsyncCRUDQuestion(Question)
\ No newline at end of file
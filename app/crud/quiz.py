@@ -1,15 +1,17 @@
 from fastapi.encoders import jsonable_encoder
+from datetime import datetime
 import random
-from typing import Any, Dict, List, Optional, Union
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, aliased, selectinload
+from sqlalchemy import case, func, select, true
 
 from app.models.quiz import Quiz
 from app.models.question import Question
 from app.models.option import Option
 from app.models.submission import Submission
 from app.schemas.quiz import QuizCreate, QuizUpdate
-from app.crud.base import CRUDBase
+from app.crud.base import AsyncCRUDBase, CRUDBase, Cursor, paginate
 
 class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
     def get(self, db: Session, id: int) -> Optional[Quiz]:
@@ -18,6 +20,40 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         """
         return db.query(Quiz).filter(Quiz.id == id).first()
 
+    def get_full(self, db: Session, id: int) -> Optional[Quiz]:
+        """
+        퀴즈를 문제와 선택지까지 함께 조회합니다.
+        selectinload로 문제 수와 관계없이 쿼리 세 번(퀴즈, 문제, 선택지)으로 전체 그래프를 불러옵니다.
+        """
+        return (
+            db.query(Quiz)
+            .options(selectinload(Quiz.questions).selectinload(Question.options))
+            .filter(Quiz.id == id)
+            .first()
+        )
+
+    def bump_version(self, db: Session, *, quiz_id: int) -> None:
+        """
+        퀴즈의 콘텐츠 버전을 올립니다. 커밋은 호출한 쪽의 트랜잭션에서 함께 수행됩니다.
+        """
+        db.query(Quiz).filter(Quiz.id == quiz_id).update(
+            {Quiz.version: Quiz.version + 1, Quiz.updated_at: datetime.utcnow()},
+            synchronize_session=False,
+        )
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Quiz,
+        obj_in: Union[QuizUpdate, Dict[str, Any]]
+    ) -> Quiz:
+        """
+        퀴즈를 수정하고 콘텐츠 버전을 올립니다.
+        """
+        self.bump_version(db, quiz_id=db_obj.id)
+        return super().update(db, db_obj=db_obj, obj_in=obj_in)
+
     def create_with_owner(
         self, db: Session, *, obj_in: QuizCreate, owner_id: int
     ) -> Quiz:
@@ -32,18 +68,19 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         return db_obj
 
     def get_multi_by_owner(
-            self, db: Session, *, owner_id: int, skip: int = 0, limit: int = 100
+            self,
+            db: Session,
+            *,
+            owner_id: int,
+            skip: int = 0,
+            limit: int = 100,
+            cursor: Optional[Cursor] = None,
         ) -> List[Quiz]:
             """
-            주어진 관리자 ID로 퀴즈 목록을 조회합니다.
+            주어진 관리자 ID로 퀴즈 목록을 최신순으로 조회합니다.
             """
-            return (
-                db.query(self.model)
-                .filter(Quiz.created_by == owner_id)  # 필터링 기준은 created_by
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
+            query = db.query(self.model).filter(Quiz.created_by == owner_id)  # 필터링 기준은 created_by
+            return paginate(query, Quiz, skip=skip, limit=limit, cursor=cursor).all()
 
     def get_random_questions(
         self, db: Session, *, quiz_id: int, count: int
@@ -57,46 +94,50 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
         return random.sample(questions, count)
 
     def get_active_quizzes(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self, db: Session, *, skip: int = 0, limit: int = 100, with_questions: bool = False
     ) -> List[Quiz]:
         """
         활성화된 퀴즈 목록만 가져옵니다.
+        with_questions가 True면 문제와 선택지를 퀴즈 수와 관계없이 두 번의 추가 쿼리로 함께 불러옵니다.
         """
-        return (
-            db.query(self.model)
-            .filter(Quiz.is_active == True)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = db.query(self.model).filter(Quiz.is_active == True)
+        if with_questions:
+            query = query.options(selectinload(Quiz.questions).selectinload(Question.options))
+        return query.order_by(Quiz.id).offset(skip).limit(limit).all()
+
+    def count_active_quizzes(self, db: Session) -> int:
+        """
+        활성화된 퀴즈 수를 반환합니다.
+        """
+        return db.query(func.count(Quiz.id)).filter(Quiz.is_active == True).scalar()
 
     def get_quizzes_with_status(
         self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
     ) -> List[Dict]:
         """
         사용자의 퀴즈 응시 상태를 포함한 퀴즈 목록을 가져옵니다.
+        퀴즈마다 사용자의 최신 제출을 LEFT JOIN LATERAL로 붙여 페이지 크기와 관계없이 쿼리 한 번으로 조회합니다.
+        (ix_submissions_user_id_quiz_id_created_at 인덱스에서 퀴즈당 한 행만 읽음)
         """
-        quizzes = (
-            db.query(Quiz)
+        latest = (
+            select(Submission.id, Submission.is_completed)
+            .where(Submission.user_id == user_id, Submission.quiz_id == Quiz.id)
+            .order_by(Submission.created_at.desc(), Submission.id.desc())
+            .limit(1)
+            .lateral("latest_submission")
+        )
+        rows = (
+            db.query(Quiz, latest.c.id, latest.c.is_completed)
+            .outerjoin(latest, true())
             .filter(Quiz.is_active == True)
+            .order_by(Quiz.id)
             .offset(skip)
             .limit(limit)
             .all()
         )
 
         result = []
-        for quiz in quizzes:
-            # 해당 퀴즈에 대한 사용자의 제출 정보를 찾습니다
-            submission = (
-                db.query(Submission)
-                .filter(
-                    Submission.quiz_id == quiz.id,
-                    Submission.user_id == user_id
-                )
-                .order_by(Submission.created_at.desc())
-                .first()
-            )
-
+        for quiz, submission_id, is_completed in rows:
             quiz_dict = {
                 "id": quiz.id,
                 "title": quiz.title,
@@ -108,12 +149,94 @@ class CRUDQuiz(CRUDBase[Quiz, QuizCreate, QuizUpdate]):
                 "is_active": quiz.is_active,
                 "created_at": quiz.created_at,
                 "updated_at": quiz.updated_at,
-                "has_attempted": bool(submission),
-                "has_completed": bool(submission and submission.is_completed),
-                "submission_id": submission.id if submission else None
+                "has_attempted": submission_id is not None,
+                "has_completed": bool(is_completed),
+                "submission_id": submission_id
             }
             result.append(quiz_dict)
 
         return result
 
-quiz_crud = CRUDQuiz(Quiz)
\ No newline at end of file
+    def get_dashboard_for_user(
+        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+    ) -> List[Tuple[Quiz, int, int, bool, Optional[float]]]:
+        """
+        퀴즈 목록 한 페이지(get_multi와 같은 최신순)와 함께 퀴즈별 문제 수, 사용자의 대표 제출을 쿼리 한 번으로 가져옵니다.
+        대표 제출은 진행 중인 제출이 있으면 가장 최근에 시작한 것, 없으면 가장 최근에 완료된 것입니다.
+        사용자가 응시하지 않은 퀴즈는 결과에서 빠집니다.
+        (퀴즈, 문제 수, 제출 ID, 완료 여부, 점수) 튜플 목록을 반환합니다.
+        """
+        page = paginate(select(Quiz), Quiz, skip=skip, limit=limit).cte("page")
+        page_quiz = aliased(Quiz, page)
+
+        # 페이지에 있는 퀴즈의 문제 수
+        question_counts = (
+            select(Question.quiz_id, func.count(Question.id).label("question_count"))
+            .where(Question.quiz_id.in_(select(page.c.id)))
+            .group_by(Question.quiz_id)
+            .subquery("question_counts")
+        )
+
+        # 퀴즈별 대표 제출 한 건 (진행 중 우선, 그다음 완료 시각 최신순)
+        is_completed = func.coalesce(Submission.is_completed, False)
+        status = (
+            select(Submission.id, is_completed.label("is_completed"), Submission.score)
+            .where(Submission.user_id == user_id, Submission.quiz_id == page_quiz.id)
+            .order_by(
+                is_completed,
+                case((is_completed, Submission.updated_at)).desc().nullslast(),
+                Submission.created_at.desc(),
+                Submission.id.desc(),
+            )
+            .limit(1)
+            .lateral("status")
+        )
+
+        return (
+            db.query(
+                page_quiz,
+                func.coalesce(question_counts.c.question_count, 0),
+                status.c.id,
+                status.c.is_completed,
+                status.c.score,
+            )
+            .select_from(page_quiz)
+            .join(status, true())
+            .outerjoin(question_counts, question_counts.c.quiz_id == page_quiz.id)
+            .order_by(page_quiz.created_at.desc(), page_quiz.id.desc())
+            .all()
+        )
+
+quiz_crud = CRUDQuiz(Quiz)
+
+
+class AsyncCRUDQuiz(AsyncCRUDBase[Quiz, QuizCreate, QuizUpdate]):
+    """
+    비동기 엔드포인트에서 사용하는 퀴즈 조회 메서드입니다.
+    """
+
+    async def get(self, db: AsyncSession, id: int) -> Optional[Quiz]:
+        """
+        주어진 ID로 퀴즈를 조회합니다.
+        """
+        return await db.get(Quiz, id)
+
+    async def get_version(self, db: AsyncSession, *, quiz_id: int) -> Optional[int]:
+        """
+        퀴즈의 콘텐츠 버전만 조회합니다. 퀴즈가 없으면 None을 반환합니다.
+        """
+        result = await db.execute(select(Quiz.version).where(Quiz.id == quiz_id))
+        return result.scalar()
+
+    async def get_full(self, db: AsyncSession, id: int) -> Optional[Quiz]:
+        """
+        퀴즈를 문제와 선택지까지 함께 조회합니다. (비동기 세션은 지연 로딩을 할 수 없으므로 미리 로드)
+        """
+        result = await db.execute(
+            select(Quiz)
+            .options(selectinload(Quiz.questions).selectinload(Question.options))
+            .where(Quiz.id == id)
+        )
+        return result.scalars().first()
+
+async_quiz_crud = AsyncCRUDQuiz(Quiz)
\ No newline at end of file
@@ -1,28 +1,136 @@
-from typing import Dict, List, Optional, Union
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import desc
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy import DateTime, Integer, and_, cast, desc, func, literal, select, true, update
 
 from app.models.submission import Submission
+from app.models.submission_answer import SubmissionAnswer
 from app.models.question import Question
 from app.models.option import Option
 from app.models.quiz import Quiz
 from app.models.session import Session as SessionModel
 from app.schemas.submission import SubmissionCreate, SubmissionUpdate, AnswerSubmit
-from app.crud.base import CRUDBase
+from app.crud.base import AsyncCRUDBase, CRUDBase, Cursor, paginate
+
+
+def _incoming_answers(question_ids: List[int], option_ids: List[int]) -> Any:
+    # 배열 두 개를 unnest하여 (question_id, option_id) 행 집합으로 전달 (답변 수와 관계없이 파라미터 두 개)
+    return func.unnest(
+        cast(question_ids, ARRAY(Integer)),
+        cast(option_ids, ARRAY(Integer)),
+    ).table_valued("question_id", "option_id").alias("incoming")
+
+def _upsert_answers_stmt(answers: Dict[int, int], conditions: List[Any]) -> Any:
+    """
+    조건(conditions)에 맞는 제출에 답변들을 한 번에 저장하는 INSERT ... ON CONFLICT DO UPDATE 문을 만듭니다.
+    문제에 속하지 않는 선택지는 저장하지 않습니다.
+    """
+    submissions = Submission.__table__
+    options = Option.__table__
+    answers_table = SubmissionAnswer.__table__
+    incoming = _incoming_answers(list(answers.keys()), list(answers.values()))
+
+    rows = (
+        select(
+            submissions.c.id,
+            incoming.c.question_id,
+            incoming.c.option_id,
+            literal(datetime.utcnow(), DateTime),
+        )
+        .select_from(submissions)
+        .join(incoming, true())
+        .join(
+            options,
+            and_(options.c.id == incoming.c.option_id, options.c.question_id == incoming.c.question_id),
+        )
+        .where(*conditions)
+    )
+    stmt = insert(answers_table).from_select(
+        ["submission_id", "question_id", "option_id", "answered_at"], rows
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[answers_table.c.submission_id, answers_table.c.question_id],
+        set_={"option_id": stmt.excluded.option_id, "answered_at": stmt.excluded.answered_at},
+    )
 
 class CRUDSubmission(CRUDBase[Submission, SubmissionCreate, SubmissionUpdate]):
     # 기존 메서드들...
 
     def get_answers(self, db: Session, submission_id: int) -> Dict[str, int]:
         """
-        특정 제출에 대한 답변을 가져오는 메서드.
+        특정 제출에 대한 답변 {question_id: option_id, ...}를 가져오는 메서드.
         """
-        submission = db.query(Submission).filter(Submission.id == submission_id).first()
-        if not submission:
-            return {}
+        rows = db.query(SubmissionAnswer.question_id, SubmissionAnswer.option_id).filter(
+            SubmissionAnswer.submission_id == submission_id
+        )
+        return {str(question_id): option_id for question_id, option_id in rows}
+
+    def count_correct_answers(self, db: Session, *, submission_id: int, quiz_id: int) -> Tuple[int, int]:
+        """
+        퀴즈의 전체 문제 수와 제출에서 정답을 고른 문제 수를 쿼리 한 번으로 셉니다.
+        """
+        total, correct = (
+            db.query(func.count(Question.id), func.count(Option.id))
+            .select_from(Question)
+            .outerjoin(
+                SubmissionAnswer,
+                and_(
+                    SubmissionAnswer.submission_id == submission_id,
+                    SubmissionAnswer.question_id == Question.id,
+                ),
+            )
+            .outerjoin(Option, and_(Option.id == SubmissionAnswer.option_id, Option.is_correct == True))
+            .filter(Question.quiz_id == quiz_id)
+            .one()
+        )
+        return total, correct
 
-        # 제출에 대한 답변을 가져오는 로직을 구현합니다.
-        return submission.answers if hasattr(submission, 'answers') else {}
+    def count_correct_options(self, db: Session, *, answers: Dict[str, int]) -> int:
+        """
+        답변 {question_id: option_id, ...} 중 해당 문제의 정답 선택지를 고른 답변 수를 셉니다.
+        답변 수와 관계없이 답변 집합을 정답 선택지와 조인하는 쿼리 한 번으로 계산합니다.
+        """
+        if not answers:
+            return 0
+        incoming = _incoming_answers([int(question_id) for question_id in answers], list(answers.values()))
+        return (
+            db.query(func.count(Option.id))
+            .select_from(incoming)
+            .join(
+                Option,
+                and_(
+                    Option.id == incoming.c.option_id,
+                    Option.question_id == incoming.c.question_id,
+                    Option.is_correct == True,
+                ),
+            )
+            .scalar()
+        )
+
+    def replace_answers(self, db: Session, *, submission_id: int, answers: Dict[str, int]) -> None:
+        """
+        제출의 답변을 주어진 답변으로 교체합니다. (커밋은 호출자가 수행)
+        """
+        keys = [int(question_id) for question_id in answers]
+        db.query(SubmissionAnswer).filter(
+            SubmissionAnswer.submission_id == submission_id,
+            SubmissionAnswer.question_id.notin_(keys),
+        ).delete(synchronize_session=False)
+        if answers:
+            db.execute(
+                _upsert_answers_stmt(
+                    dict(zip(keys, answers.values())),
+                    [Submission.__table__.c.id == submission_id],
+                )
+            )
+        # 이미 로드된 answer_rows가 있으면 다시 읽도록 함
+        submission = db.identity_map.get(identity_key(Submission, submission_id))
+        if submission is not None:
+            db.expire(submission, ["answer_rows"])
 
     def create_for_user(
         self,
@@ -43,7 +151,6 @@ class CRUDSubmission(CRUDBase[Submission, SubmissionCreate, SubmissionUpdate]):
             score=0.0,
             question_order=question_order,
             option_orders=option_orders,
-            answers={}
         )
         db.add(db_obj)
         db.commit()
@@ -58,32 +165,71 @@ class CRUDSubmission(CRUDBase[Submission, SubmissionCreate, SubmissionUpdate]):
         """
         submission = db.query(Submission).filter(Submission.id == submission_id).first()
         if submission:
-            submission.answers = answers
+            self.replace_answers(db, submission_id=submission_id, answers=answers)
+            submission.updated_at = datetime.utcnow()
             db.add(submission)
             db.commit()
             db.refresh(submission)
         return submission
 
-    def get_by_user_and_quiz(self, db: Session, user_id: int, quiz_id: int, skip: int = 0, limit: int = 100):
+    def get_by_user_and_quiz(
+        self,
+        db: Session,
+        user_id: int,
+        quiz_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Submission]:
         """
-        사용자-퀴즈 조합으로 제출 정보를 찾습니다.
+        사용자-퀴즈 조합으로 제출 정보를 최신순으로 찾습니다.
         """
-        return db.query(self.model).filter(
+        query = db.query(self.model).filter(
             self.model.user_id == user_id,
             self.model.quiz_id == quiz_id
-        ).offset(skip).limit(limit).all()
+        )
+        return paginate(query, Submission, skip=skip, limit=limit, cursor=cursor).all()
+
+    def get_by_quiz(
+        self,
+        db: Session,
+        *,
+        quiz_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Submission]:
+        """
+        퀴즈의 모든 제출 정보를 최신순으로 가져옵니다. (관리자용)
+        """
+        query = db.query(Submission).filter(Submission.quiz_id == quiz_id)
+        return paginate(query, Submission, skip=skip, limit=limit, cursor=cursor).all()
 
     def get_by_quiz_and_submission_id(self, db: Session, quiz_id: int, submission_id: int) -> Optional[Submission]:
         """
         퀴즈 ID와 제출 ID를 기준으로 제출 기록을 조회합니다.
         """
         return db.query(Submission).options(
-            joinedload(Submission.quiz).joinedload(Quiz.questions)
+            selectinload(Submission.quiz)
+            .selectinload(Quiz.questions)
+            .selectinload(Question.options),
+            selectinload(Submission.answer_rows),
         ).filter(
             Submission.id == submission_id,
             Submission.quiz_id == quiz_id
         ).first()
 
+    def get_with_details(self, db: Session, id: int) -> Optional[Submission]:
+        """
+        제출을 답변 목록과 함께 조회합니다. (결과 조회 응답의 answers를 추가 쿼리 없이 채움)
+        """
+        return (
+            db.query(Submission)
+            .options(selectinload(Submission.answer_rows))
+            .filter(Submission.id == id)
+            .first()
+        )
+
     def get_in_progress_by_user_and_quiz(self, db: Session, user_id: int, quiz_id: int):
         """
         완료되지 않은(submission.is_completed=False) 제출을 가져옵니다.
@@ -98,42 +244,62 @@ class CRUDSubmission(CRUDBase[Submission, SubmissionCreate, SubmissionUpdate]):
             .first()
         )
 
-    def add_answers(self, db: Session, submission_id: int, answers_in: List[AnswerSubmit]) -> Submission:
+    def add_answers(
+        self,
+        db: Session,
+        submission_id: int,
+        answers_in: List[AnswerSubmit],
+        *,
+        user_id: Optional[int] = None,
+        quiz_id: Optional[int] = None,
+    ) -> Optional[Row]:
         """
         여러 문제에 대한 답변을 저장하거나 갱신합니다.
+        답변 묶음 전체를 submission_answers에 INSERT ... ON CONFLICT DO UPDATE 하고
+        같은 문장(CTE)에서 제출의 updated_at을 갱신하므로 한 번의 왕복으로 끝나며,
+        동시에 들어온 답변 저장 요청이 서로의 답을 덮어쓰지 않습니다.
+        완료된 제출이거나 user_id/quiz_id 조건에 맞지 않으면 갱신하지 않고 None을 반환합니다.
         """
-        submission = db.query(Submission).filter(Submission.id == submission_id).first()
-        if not submission:
-            return None
+        table = Submission.__table__
+        # 같은 문제에 대한 답이 여러 번 오면 마지막 답을 사용 (ON CONFLICT는 한 행을 두 번 갱신할 수 없음)
+        answers = {answer.question_id: answer.selected_option_id for answer in answers_in}
 
-        # 기존 답변 딕셔너리에 갱신
-        answers = submission.answers or {}
+        conditions = [table.c.id == submission_id, table.c.is_completed == False]
+        if user_id is not None:
+            conditions.append(table.c.user_id == user_id)
+        if quiz_id is not None:
+            conditions.append(table.c.quiz_id == quiz_id)
 
-        # 여러 답안 처리
-        for answer in answers_in:
-            answers[str(answer.question_id)] = answer.selected_option_id
-
-        submission.answers = answers
-
-        db.add(submission)
+        stmt = update(table).where(*conditions).values(updated_at=datetime.utcnow())
+        if answers:
+            stmt = stmt.add_cte(_upsert_answers_stmt(answers, conditions).cte("upserted"))
+        stmt = stmt.returning(
+            table.c.id,
+            table.c.user_id,
+            table.c.quiz_id,
+            table.c.score,
+            table.c.is_completed,
+            table.c.created_at,
+            table.c.updated_at,
+        )
+        row = db.execute(stmt).first()
         db.commit()
-        db.refresh(submission)
-        return submission
+        return row
 
     def get_by_user(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
     ) -> List[Submission]:
         """
-        사용자의 모든 제출 정보를 가져옵니다.
+        사용자의 모든 제출 정보를 최신순으로 가져옵니다.
         """
-        return (
-            db.query(Submission)
-            .filter(Submission.user_id == user_id)
-            .order_by(desc(Submission.created_at))
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = db.query(Submission).filter(Submission.user_id == user_id)
+        return paginate(query, Submission, skip=skip, limit=limit, cursor=cursor).all()
 
     def submit_quiz(
         self, db: Session, *, submission_id: int, answers: Dict[str, int]
@@ -146,24 +312,12 @@ class CRUDSubmission(CRUDBase[Submission, SubmissionCreate, SubmissionUpdate]):
             return None
 
         # 답변 저장
-        submission.answers = answers
+        self.replace_answers(db, submission_id=submission_id, answers=answers)
         submission.is_completed = True
 
         # 채점
         total_questions = len(answers)
-        correct_count = 0
-
-        for question_id_str, option_id in answers.items():
-            question_id = int(question_id_str)
-            # 선택한 옵션이 정답인지 확인
-            option = db.query(Option).filter(
-                Option.id == option_id,
-                Option.question_id == question_id,
-                Option.is_correct == True
-            ).first()
-
-            if option:
-                correct_count += 1
+        correct_count = self.count_correct_options(db, answers=answers)
 
         # 점수 계산 (백분율)
         if total_questions > 0:
@@ -222,4 +376,64 @@ class CRUDSubmission(CRUDBase[Submission, SubmissionCreate, SubmissionUpdate]):
             .first()
         )
 
-submission_crud = CRUDSubmission(Submission)
\ No newline at end of file
+submission_crud = CRUDSubmission(Submission)
+
+
+class AsyncCRUDSubmission(AsyncCRUDBase[Submission, SubmissionCreate, SubmissionUpdate]):
+    """
+    비동기 엔드포인트에서 사용하는 제출 조회 메서드입니다.
+    """
+
+    async def get_by_quiz_and_submission_id(
+        self, db: AsyncSession, quiz_id: int, submission_id: int
+    ) -> Optional[Submission]:
+        """
+        퀴즈 ID와 제출 ID를 기준으로 제출 기록을 조회합니다. 퀴즈의 문제와 선택지까지 함께 로드합니다.
+        """
+        result = await db.execute(
+            select(Submission)
+            .options(
+                selectinload(Submission.quiz)
+                .selectinload(Quiz.questions)
+                .selectinload(Question.options),
+                selectinload(Submission.answer_rows),
+            )
+            .where(Submission.id == submission_id, Submission.quiz_id == quiz_id)
+        )
+        return result.scalars().first()
+
+    async def get_by_quiz(
+        self,
+        db: AsyncSession,
+        *,
+        quiz_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Submission]:
+        """
+        퀴즈의 모든 제출 정보를 최신순으로 가져옵니다. (관리자용)
+        """
+        query = select(Submission).where(Submission.quiz_id == quiz_id)
+        result = await db.execute(paginate(query, Submission, skip=skip, limit=limit, cursor=cursor))
+        return result.scalars().all()
+
+    async def get_by_user_and_quiz(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        quiz_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[Cursor] = None,
+    ) -> List[Submission]:
+        """
+        사용자-퀴즈 조합으로 제출 정보를 최신순으로 찾습니다.
+        """
+        query = select(Submission).where(
+            Submission.user_id == user_id, Submission.quiz_id == quiz_id
+        )
+        result = await db.execute(paginate(query, Submission, skip=skip, limit=limit, cursor=cursor))
+        return result.scalars().all()
+
+async_submission_crud = AsyncCRUDSubmission(Submission)
\ No newline at end of file
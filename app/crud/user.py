@@ -1,6 +1,6 @@
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
-from app.crud.base import CRUDBase
+from app.crud.base import AsyncCRUDBase, CRUDBase
 from sqlalchemy.orm import Session
 from typing import Any, Dict, Optional, Union
 from app.core.security import get_password_hash, verify_password
@@ -52,4 +52,7 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         return user.is_admin
 
 # CRUDUser 인스턴스 생성
-user = CRUDUser(User)
\ No newline at end of file
+user = CRUDUser(User)
+
+# 비동기 엔드포인트의 인증에서 사용하는 인스턴스 (ID 조회만 필요)
+async_user = AsyncCRUDBase[User, UserCreate, UserUpdate](User)
@@ -0,0 +1,117 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolStats:
+    """
+    커넥션 풀 체크아웃 횟수와 대기 시간을 집계하는 스레드 안전 카운터입니다.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, float] = {}
+        self._max_wait = 0.0
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self._counters["checkout_wait_seconds"] = (
+                self._counters.get("checkout_wait_seconds", 0) + seconds
+            )
+            self._max_wait = max(self._max_wait, seconds)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            counters = dict(self._counters)
+            max_wait = self._max_wait
+        result = {name: int(value) for name, value in counters.items() if not name.endswith("_seconds")}
+        # 시간은 마이크로초 단위 정수로 노출
+        result["checkout_wait_us"] = int(counters.get("checkout_wait_seconds", 0) * 1e6)
+        result["checkout_wait_max_us"] = int(max_wait * 1e6)
+        return result
+
+
+class _TimedCheckoutMixin:
+    """
+    풀에서 커넥션을 꺼낼 때까지 기다린 시간을 측정합니다. (풀이 가득 차면 여기서 대기)
+    """
+    stats: PoolStats
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        except PoolTimeoutError:
+            self.stats.incr("checkout_timeouts")
+            raise
+        finally:
+            self.stats.record_wait(time.perf_counter() - started)
+
+    def recreate(self) -> Any:
+        # engine.dispose() 후 새로 만든 풀도 같은 카운터를 사용
+        pool = super().recreate()  # type: ignore[misc]
+        pool.stats = self.stats
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckoutMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+# 이름별로 계측 중인 엔진 (동기/비동기)
+_engines: Dict[str, Any] = {}
+
+
+def instrument_engine(name: str, engine: Any) -> None:
+    """
+    엔진의 풀 이벤트에 카운터를 연결하고 /metrics에 노출할 엔진으로 등록합니다.
+    비동기 엔진은 내부 동기 엔진(sync_engine)을 넘겨야 합니다.
+    """
+    stats = PoolStats()
+    engine.pool.stats = stats
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        stats.incr("connections_opened")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        stats.incr("checkouts")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection: Any, connection_record: Any, exception: Optional[BaseException]) -> None:
+        stats.incr("invalidated")
+
+    _engines[name] = engine
+
+
+def _pool_usage(pool: Pool) -> Dict[str, int]:
+    # QueuePool.overflow()는 풀이 덜 찼을 때 음수이므로 실제 초과 커넥션 수로 변환
+    return {
+        "size": pool.size(),
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+    }
+
+
+def get_pool_stats() -> Dict[str, Dict[str, int]]:
+    """
+    엔진별 커넥션 풀 사용량(사용 중/초과 커넥션 수)과 체크아웃 대기 통계를 반환합니다.
+    """
+    return {
+        name: {**_pool_usage(engine.pool), **engine.pool.stats.snapshot()}
+        for name, engine in _engines.items()
+    }
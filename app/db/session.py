@@ -1,18 +1,141 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+from typing import Any, AsyncGenerator, Awaitable, Callable, Generator, Optional, Union
 
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+from app.db.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
+
+# 동기/비동기 엔진에 공통으로 적용하는 커넥션 풀 설정
+_pool_options = {
+    "pool_pre_ping": True,
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,  # 풀이 가득 차면 이 시간만큼만 대기
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+}
+
+
+def _create_engine(url: Optional[str]) -> Any:
+    return create_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        # 오래 걸리는 쿼리가 커넥션을 계속 점유하지 않도록 서버 측 시간 제한 (psycopg2)
+        connect_args={"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"},
+        **_pool_options,
+    )
+
+def _create_async_engine(url: Optional[str]) -> Any:
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        connect_args={"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}},
+        **_pool_options,
+    )
+
+engine = _create_engine(settings.SQLALCHEMY_DATABASE_URI)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+instrument_engine("sync", engine)
+
+# 비동기 엔드포인트용 엔진 (asyncpg)
+# 커밋 후에도 응답 직렬화 시 속성을 다시 로드하지 않도록 expire_on_commit=False
+async_engine = _create_async_engine(settings.SQLALCHEMY_ASYNC_DATABASE_URI)
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+instrument_engine("async", async_engine.sync_engine)
+
+# 읽기 전용 복제본 엔진 (설정하지 않으면 주 DB 엔진을 그대로 사용)
+if settings.SQLALCHEMY_REPLICA_DATABASE_URI:
+    replica_engine = _create_engine(settings.SQLALCHEMY_REPLICA_DATABASE_URI)
+    async_replica_engine = _create_async_engine(settings.SQLALCHEMY_ASYNC_REPLICA_DATABASE_URI)
+    instrument_engine("replica", replica_engine)
+    instrument_engine("async_replica", async_replica_engine.sync_engine)
+else:
+    replica_engine = engine
+    async_replica_engine = async_engine
+
+
+class RoutingSession(Session):
+    """
+    조회는 복제본으로, 쓰기(flush)는 주 DB로 보내는 세션입니다.
+    use_primary()를 호출한 세션은 조회도 주 DB에서 수행합니다. (복제 지연 회피)
+    """
+
+    def get_bind(self, mapper: Optional[Any] = None, clause: Optional[Any] = None, **kw: Any) -> Any:
+        if self._flushing or self.info.get("use_primary"):
+            return self.info["primary"]
+        return self.info["replica"]
+
+
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autocommit=False,
+    autoflush=False,
+    info={"primary": engine, "replica": replica_engine},
+)
+AsyncReadSessionLocal = sessionmaker(
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    info={"primary": async_engine.sync_engine, "replica": async_replica_engine.sync_engine},
+)
+
+
+def use_primary(db: Union[Session, AsyncSession]) -> None:
+    """
+    이 세션의 이후 조회를 주 DB로 보냅니다. (방금 쓴 데이터를 읽어야 할 때 사용)
+    """
+    db.info["use_primary"] = True
+
+
+def reads_from_replica(db: Union[Session, AsyncSession]) -> bool:
+    """
+    이 세션의 조회가 복제본으로 가는지 확인합니다. (복제본을 설정하지 않았거나 use_primary()를 호출했으면 False)
+    복제본에서 찾지 못한 행은 복제 지연 때문일 수 있으므로 "없음"으로 기억하면 안 됩니다.
+    """
+    info = db.info
+    return (
+        "replica" in info
+        and not info.get("use_primary")
+        and info["replica"] is not info["primary"]
+    )
 
 Base = declarative_base()
 
 # 의존성 주입용 함수
-def get_db():
+def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# 비동기 엔드포인트용 의존성 주입 함수
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def run_in_session(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    요청 세션 밖(백그라운드 작업 등)에서 새 세션을 열어 fn(db, ...)을 실행합니다.
+    """
+    db = SessionLocal()
+    try:
+        return fn(db, *args, **kwargs)
+    finally:
+        db.close()
+
+async def run_in_async_session(fn: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+    """
+    요청 세션 밖(백그라운드 작업 등)에서 새 비동기 세션을 열어 fn(db, ...)을 실행합니다.
+    """
+    async with AsyncSessionLocal() as db:
+        return await fn(db, *args, **kwargs)
@@ -1,17 +1,38 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI, Depends, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.security.utils import get_authorization_scheme_param
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.routing import Match
 from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional, Tuple
 import uvicorn
+import hashlib
+import logging
 import time
 
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.db.session import engine, SessionLocal
+from app.db.pool_metrics import get_pool_stats
 from app.db.init_db import init_db
-from app.services.caching_service import setup_cache, get_cache
+from app.core.security import decode_access_token
+from app.services.caching_service import (
+    setup_cache,
+    setup_async_cache,
+    close_async_cache,
+    get_async_cache,
+    get_cache_stats,
+    CachePolicy,
+    CacheScope,
+    HTTP_CACHE_PREFIX,
+)
+from app.services.cache_codec import CachedResponse
+from app.services.quiz_service import warm_quiz_cache
 from app.api import deps
 
+logger = logging.getLogger(__name__)
+
 # FastAPI 앱 초기화
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -22,6 +43,10 @@ app = FastAPI(
     redoc_url=f"{settings.API_V1_STR}/redoc",
 )
 
+# 시작 작업(캐시 워밍업 포함)이 끝나야 준비 완료로 응답
+app.state.ready = False
+app.state.warmup = None
+
 # CORS 미들웨어 설정
 if settings.BACKEND_CORS_ORIGINS:
     app.add_middleware(
@@ -32,29 +57,157 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_headers=["*"],
     )
 
+# 캐시된 응답에 다시 붙이지 않을 헤더 (본문 기준으로 새로 계산됨)
+_UNCACHED_HEADERS = {"content-length", "etag"}
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    If-None-Match 헤더에 현재 ETag가 포함되어 있는지 확인합니다. (약한 비교)
+    """
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def _resolve_cache_policy(request: Request) -> Tuple[Optional[CachePolicy], Dict[str, Any]]:
+    """
+    요청 경로에 해당하는 라우트를 찾아 선언된 캐시 정책과 경로 파라미터를 반환합니다.
+    """
+    for route in request.app.router.routes:
+        match, child_scope = route.matches(request.scope)
+        if match == Match.FULL:
+            policy = getattr(getattr(route, "endpoint", None), "cache_policy", None)
+            return policy, child_scope.get("path_params", {})
+    return None, {}
+
+
+def _decode_claims(request: Request) -> Optional[Dict[str, Any]]:
+    """
+    Authorization 헤더의 Bearer 토큰을 검증하고 클레임을 반환합니다. (DB 조회 없음)
+    """
+    scheme, token = get_authorization_scheme_param(request.headers.get("authorization"))
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return decode_access_token(token)
+
+
+def _principal_segment(policy: CachePolicy, claims: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    캐시 정책과 JWT 클레임으로 캐시 키의 주체 구간을 만듭니다.
+    캐시를 사용할 수 없는 요청이면 None을 반환합니다.
+    """
+    if policy.scope == CacheScope.PUBLIC and not policy.require_auth:
+        return "public"
+
+    if claims is None:
+        # 인증 실패 응답은 라우트가 만들도록 캐시를 건너뜀
+        return None
+
+    if policy.scope == CacheScope.PUBLIC:
+        return "public"
+    if policy.scope == CacheScope.ROLE:
+        role = claims.get("role")
+        # 역할 클레임이 없는 이전 토큰은 캐시하지 않음
+        return f"role:{role}" if role else None
+    return f"user:{claims['sub']}"
+
+
+def _principal_is_current(
+    policy: CachePolicy, claims: Dict[str, Any], user_status: Dict[str, Any]
+) -> bool:
+    """
+    토큰의 주체가 DB 기준으로도 여전히 유효한지 확인합니다.
+    비활성화/삭제된 사용자나 역할 클레임이 현재 역할과 다른 토큰(권한이 바뀐 관리자 등)은
+    캐시를 읽거나 채우지 않고 라우트가 직접 처리하도록 합니다.
+    """
+    if not user_status["is_active"]:
+        return False
+    return policy.scope != CacheScope.ROLE or claims.get("role") == user_status["role"]
+
+
+def _build_cached_response(request: Request, cached: CachedResponse, cache_status: str) -> Response:
+    """
+    캐시된 응답을 그대로 반환하거나, ETag가 일치하면 본문 없이 304를 반환합니다.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, cached.etag):
+        return Response(status_code=304, headers={"ETag": cached.etag, "X-Cache": cache_status})
+
+    response = Response(content=cached.body, status_code=cached.status_code)
+    for name, value in cached.headers:
+        response.headers.append(name, value)
+    response.headers["ETag"] = cached.etag
+    response.headers["X-Cache"] = cache_status
+    return response
+
+
 # 캐시 미들웨어
 class CacheMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
         # GET 요청이 아닌 경우 캐싱 건너뛰기
         if request.method != "GET":
             return await call_next(request)
 
-        # 응답이 캐시에 있는지 확인
-        cache_key = f"{request.url.path}?{request.url.query}"
-        cache = get_cache()
-        cached_response = cache.get(cache_key)
+        # 라우트가 캐시 정책을 선언하지 않았으면 캐싱 건너뛰기
+        policy, path_params = _resolve_cache_policy(request)
+        if policy is None:
+            return await call_next(request)
+
+        # 정책 범위(공개/역할/사용자)에 따라 키를 구분
+        claims = _decode_claims(request)
+        principal = _principal_segment(policy, claims)
+        if principal is None:
+            return await call_next(request)
+        cache_key = f"{HTTP_CACHE_PREFIX}{request.url.path}?{request.url.query}:{principal}"
+
+        # 이벤트 루프를 블로킹하지 않도록 비동기 클라이언트 사용
+        cache = get_async_cache()
 
-        if cached_response:
-            return cached_response
+        # 인증이 필요한 응답은 토큰 클레임만 믿지 않고 주체의 현재 상태를 확인 (짧은 TTL로 캐시)
+        # 캐시된 응답과 사용자 상태는 한 번의 왕복으로 함께 읽음
+        check_principal = policy.require_auth or policy.scope != CacheScope.PUBLIC
+        principal_claims = claims if check_principal else None
+        user_id = int(principal_claims["sub"]) if principal_claims is not None else None
+        keys = [cache_key] if user_id is None else [cache_key, deps.user_status_key(user_id)]
+        cached = await cache.get_many(keys)
+        if principal_claims is not None and user_id is not None:
+            user_status = cached.get(keys[1]) or await deps.load_user_status(user_id)
+            if not _principal_is_current(policy, principal_claims, user_status):
+                return await call_next(request)
 
-        # 캐시에 없는 경우 요청 처리 및 응답 캐싱
+        # 응답이 캐시에 있으면 라우트와 DB를 거치지 않고 바로 반환
+        cached_response = cached.get(cache_key)
+
+        if isinstance(cached_response, CachedResponse):
+            return _build_cached_response(request, cached_response, "HIT")
+
+        # 캐시에 없는 경우 요청 처리
         response = await call_next(request)
 
-        # 성공적인 응답만 캐싱
-        if 200 <= response.status_code < 300:
-            cache.set(cache_key, response, expire=300)  # 5분 동안 캐싱
+        # 성공적인 응답만 캐싱 (쿠키를 설정하는 응답은 제외)
+        if not (200 <= response.status_code < 300) or "set-cookie" in response.headers:
+            return response
 
-        return response
+        # 스트리밍 응답 본문을 한 번만 버퍼링
+        body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[attr-defined]
+        cached_response = CachedResponse(
+            status_code=response.status_code,
+            headers=[
+                (name.decode("latin-1"), value.decode("latin-1"))
+                for name, value in response.raw_headers
+                if name.decode("latin-1").lower() not in _UNCACHED_HEADERS
+            ],
+            body=body,
+            etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"',
+        )
+        # 쓰기 엔드포인트에서 invalidate_tags로 무효화할 수 있도록 태그 등록
+        tag_params = {**path_params, "user_id": claims["sub"] if claims else None}
+        tags = [tag.format(**tag_params) for tag in policy.tags]
+        await cache.set(cache_key, cached_response, expire=policy.expire, tags=tags)
+
+        return _build_cached_response(request, cached_response, "MISS")
 
 # 캐싱을 위한 미들웨어 추가
 app.add_middleware(CacheMiddleware)
@@ -65,24 +218,51 @@ app.include_router(api_router, prefix=settings.API_V1_STR)
 # Rate limiting 미들웨어를 여기에 추가할 수 있습니다.
 
 @app.on_event("startup")
-async def startup_event():
+async def startup_event() -> None:
     # 필요한 경우 데이터베이스 초기화
     db = SessionLocal()
     try:
         # 첫 번째 관리자 사용자로 데이터베이스 초기화
         init_db(db)
-        # 캐시 연결 설정
+        # 캐시 연결 설정 (동기: 엔드포인트/서비스, 비동기: 미들웨어)
         setup_cache()
+        await setup_async_cache()
     finally:
         db.close()
 
+    # 배포 직후 첫 요청이 모두 DB로 몰리지 않도록 활성 퀴즈를 캐시에 미리 채움
+    if settings.CACHE_WARMUP_ENABLED:
+        try:
+            app.state.warmup = await run_in_threadpool(warm_quiz_cache)
+        except Exception:
+            # 워밍업 실패는 캐시 미스로 이어질 뿐이므로 시작을 막지 않음
+            logger.exception("Cache warm-up error")
+    app.state.ready = True
+
+@app.on_event("shutdown")
+async def shutdown_event() -> None:
+    await close_async_cache()
+
 @app.get("/")
-def read_root():
+def read_root() -> Dict[str, Any]:
     return {"message": "Quiz System API에 오신 것을 환영합니다. 문서는 /api/v1/docs에서 확인하세요."}
 
 @app.get("/health")
-def health_check():
+def health_check() -> Dict[str, Any]:
     return {"status": "정상", "timestamp": time.time()}
 
+@app.get("/ready")
+def readiness_check(response: Response) -> Dict[str, Any]:
+    # 캐시 워밍업이 끝나기 전에는 로드밸런서가 트래픽을 보내지 않도록 503 반환
+    if not app.state.ready:
+        response.status_code = 503
+        return {"status": "준비 중"}
+    return {"status": "준비 완료", "warmup": app.state.warmup}
+
+@app.get("/metrics")
+def read_metrics() -> Dict[str, Any]:
+    # 캐시 계층별(L1/L2) 적중/실패 통계와 DB 커넥션 풀 사용량
+    return {"cache": get_cache_stats(), "db_pool": get_pool_stats()}
+
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
@@ -2,4 +2,5 @@ from app.models.user import User
 from app.models.quiz import Quiz
 from app.models.question import Question
 from app.models.option import Option
-from app.models.submission import Submission
\ No newline at end of file
+from app.models.submission import Submission
+from app.models.submission_answer import SubmissionAnswer
@@ -1,9 +1,13 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Boolean, Column, Index, Integer, String, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimeStampMixin
 
 class Option(Base, TimeStampMixin):
     __tablename__ = "options"
+    __table_args__ = (
+        # 문제별 선택지 조회 (question.options 로딩)
+        Index("ix_options_question_id_order_index", "question_id", "order_index"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     question_id = Column(Integer, ForeignKey("questions.id"))
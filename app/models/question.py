@@ -1,9 +1,13 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Index, Integer, String, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimeStampMixin
 
 class Question(Base, TimeStampMixin):
     __tablename__ = "questions"
+    __table_args__ = (
+        # 퀴즈별 문제를 순서대로 조회 (get_questions_by_quiz)
+        Index("ix_questions_quiz_id_order_index", "quiz_id", "order_index"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     quiz_id = Column(Integer, ForeignKey("quizzes.id"))
@@ -1,9 +1,13 @@
-from sqlalchemy import Boolean, Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Boolean, Column, Index, Integer, String, Text, ForeignKey
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimeStampMixin
 
 class Quiz(Base, TimeStampMixin):
     __tablename__ = "quizzes"
+    __table_args__ = (
+        # 관리자별 퀴즈 목록 키셋 페이지네이션 (get_multi_by_owner)
+        Index("ix_quizzes_created_by_created_at_id", "created_by", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -13,6 +17,7 @@ class Quiz(Base, TimeStampMixin):
     questions_per_quiz = Column(Integer, default=10)  # 출제할 문제 수
     randomize_questions = Column(Boolean, default=False)  # 문제 랜덤 배치 여부
     randomize_options = Column(Boolean, default=False)  # 선택지 랜덤 배치 여부
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 퀴즈/문제/선택지 수정 시 증가하는 콘텐츠 버전
     
     # 관계 설정
     creator = relationship("User", foreign_keys=[created_by])
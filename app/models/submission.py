@@ -1,19 +1,59 @@
-from sqlalchemy import Column, Integer, Float, ForeignKey, JSON, Boolean
+from typing import Dict
+from sqlalchemy import Column, Index, Integer, Float, ForeignKey, Boolean, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import Base, TimeStampMixin
 
 class Submission(Base, TimeStampMixin):
     __tablename__ = "submissions"
+    __table_args__ = (
+        # 사용자-퀴즈별 제출 조회 / 응시 상태 확인
+        Index("ix_submissions_user_id_quiz_id_is_completed", "user_id", "quiz_id", "is_completed"),
+        # 진행 중인 응시 조회 (get_in_progress_by_user_and_quiz), 완료되지 않은 행만 포함
+        Index(
+            "ix_submissions_in_progress",
+            "user_id",
+            "quiz_id",
+            postgresql_where=text("is_completed = false"),
+        ),
+        # 퀴즈별 최신 제출 목록 (관리자)
+        Index("ix_submissions_quiz_id_created_at", "quiz_id", "created_at"),
+        # 사용자별 최신 제출 목록 키셋 페이지네이션 (get_by_user)
+        Index("ix_submissions_user_id_created_at_id", "user_id", "created_at", "id"),
+        # 사용자-퀴즈별 최신 제출 한 건 (get_quizzes_with_status의 LATERAL 조인)
+        Index(
+            "ix_submissions_user_id_quiz_id_created_at",
+            "user_id",
+            "quiz_id",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
     quiz_id = Column(Integer, ForeignKey("quizzes.id"))
     score = Column(Float, default=0.0)  # 점수
     is_completed = Column(Boolean, default=False)  # 제출 완료 여부
-    question_order = Column(JSON)  # 사용자별 문제 순서 저장 [{question_id: 1, order: 2}, ...]
-    option_orders = Column(JSON)  # 사용자별 선택지 순서 저장 {question_id: [{option_id: 1, order: 2}, ...], ...}
-    answers = Column(JSON)  # 사용자 답변 저장 {question_id: option_id, ...}
+    question_order = Column(JSONB)  # 사용자별 문제 순서 저장 [{question_id: 1, order: 2}, ...]
+    option_orders = Column(JSONB)  # 사용자별 선택지 순서 저장 {question_id: [{option_id: 1, order: 2}, ...], ...}
+    # 이전 방식의 답변 JSON {question_id: option_id, ...}
+    # 답변은 submission_answers 테이블에 저장하며, 이 컬럼은 백필/롤백용으로만 남겨둠
+    _answers_json = Column("answers", JSONB)
     
     # 관계 설정
     user = relationship("User")
-    quiz = relationship("Quiz", back_populates="submissions")
\ No newline at end of file
+    quiz = relationship("Quiz", back_populates="submissions")
+    answer_rows = relationship(
+        "SubmissionAnswer",
+        back_populates="submission",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def answers(self) -> Dict[str, int]:
+        """
+        사용자 답변 {question_id: option_id, ...} (문제 ID는 기존 JSON과 같이 문자열 키)
+        """
+        return {str(answer.question_id): answer.option_id for answer in self.answer_rows}
\ No newline at end of file
@@ -0,0 +1,22 @@
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, UniqueConstraint
+from sqlalchemy.orm import relationship
+from app.models.base import Base
+
+class SubmissionAnswer(Base):
+    __tablename__ = "submission_answers"
+    __table_args__ = (
+        # 제출당 문제 하나에 답 하나 (INSERT ... ON CONFLICT 대상)
+        UniqueConstraint("submission_id", "question_id", name="uq_submission_answers_submission_id_question_id"),
+        # 문제별 선택 분포 등 문항 분석
+        Index("ix_submission_answers_question_id_option_id", "question_id", "option_id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    submission_id = Column(Integer, ForeignKey("submissions.id", ondelete="CASCADE"), nullable=False)
+    question_id = Column(Integer, ForeignKey("questions.id", ondelete="CASCADE"), nullable=False)
+    option_id = Column(Integer, ForeignKey("options.id", ondelete="CASCADE"), nullable=False)
+    answered_at = Column(DateTime, default=datetime.utcnow, nullable=False)  # 마지막으로 답을 고른 시간
+
+    # 관계 설정
+    submission = relationship("Submission", back_populates="answer_rows")
@@ -1,8 +1,12 @@
-from sqlalchemy import Boolean, Column, Integer, String
+from sqlalchemy import Boolean, Column, Index, Integer, String
 from app.models.base import Base, TimeStampMixin
 
 class User(Base, TimeStampMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        # 사용자 목록 키셋 페이지네이션 (created_at, id 내림차순)
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True)
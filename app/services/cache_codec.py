@@ -0,0 +1,261 @@
+import json
+import logging
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+from app.core.config import settings
+
+zstandard: Optional[ModuleType]
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 의존성 (없으면 zlib 사용)
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 값 헤더: 매직(2바이트) + 스키마 버전(1바이트) + 타입 태그(1바이트)
+# 매직은 NUL 바이트로 시작하므로 기존 pickle(0x80)/JSON/UTF-8 값과 겹치지 않습니다.
+# 태그 바이트의 상위 2비트는 압축 방식 플래그입니다. (0이면 비압축이므로 기존 값과 호환)
+MAGIC = b"\x00Q"
+SCHEMA_VERSION = 1
+HEADER_SIZE = 4
+
+# 압축 방식 플래그 (태그 바이트 상위 2비트)
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_ZSTD = 2
+_COMPRESSION_SHIFT = 6
+_TAG_MASK = (1 << _COMPRESSION_SHIFT) - 1
+_COMPRESSION_NAMES = {"none": COMPRESSION_NONE, "zlib": COMPRESSION_ZLIB, "zstd": COMPRESSION_ZSTD}
+
+# 타입 태그
+TAG_JSON = 1  # orjson으로 직렬화한 dict/list/스칼라 값
+TAG_BYTES = 2  # 원본 바이트
+TAG_TEXT = 3  # UTF-8 문자열
+TAG_RESPONSE = 4  # HTTP 응답 (메타데이터 JSON + 본문 바이트)
+
+
+@dataclass
+class CachedResponse:
+    """
+    응답 캐시에 저장되는 HTTP 응답입니다. 본문은 한 번만 버퍼링된 바이트로 보관합니다.
+    """
+    status_code: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    etag: str
+
+
+def _encode_response(response: CachedResponse) -> bytes:
+    meta = orjson.dumps(
+        {"status_code": response.status_code, "headers": response.headers, "etag": response.etag}
+    )
+    # 메타데이터 길이(4바이트) + 메타데이터 + 본문 (본문은 인코딩하지 않고 그대로 저장)
+    return struct.pack("!I", len(meta)) + meta + response.body
+
+
+def _decode_response(payload: bytes) -> CachedResponse:
+    (meta_size,) = struct.unpack_from("!I", payload)
+    meta = orjson.loads(payload[4:4 + meta_size])
+    return CachedResponse(
+        status_code=meta["status_code"],
+        headers=[tuple(header) for header in meta["headers"]],
+        body=payload[4 + meta_size:],
+        etag=meta["etag"],
+    )
+
+
+def _default(value: Any) -> Any:
+    """
+    orjson이 기본으로 처리하지 못하는 타입을 변환합니다.
+    """
+    # Pydantic 모델은 JSON 호환 dict로 변환
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"캐시에 저장할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def _dumps_json(value: Any) -> bytes:
+    return orjson.dumps(value, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class CacheCodec:
+    """
+    캐시 값 직렬화 방식을 정의하는 기본 클래스입니다.
+    """
+
+    def encode(self, value: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+class CompressionStats:
+    """
+    코덱의 압축 효과(절약한 바이트)와 비용(CPU 시간)을 집계하는 스레드 안전 카운터입니다.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, **amounts: float) -> None:
+        with self._lock:
+            for name, amount in amounts.items():
+                self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            counters = dict(self._counters)
+        result = {name: int(value) for name, value in counters.items() if not name.endswith("_seconds")}
+        # 시간은 마이크로초 단위 정수로 노출
+        for name, value in counters.items():
+            if name.endswith("_seconds"):
+                result[name.replace("_seconds", "_us")] = int(value * 1e6)
+        return result
+
+
+class BinaryCodec(CacheCodec):
+    """
+    타입 태그와 스키마 버전이 포함된 헤더를 붙여 값을 직렬화하는 코덱입니다.
+    복원 시에는 헤더의 태그 하나로 역직렬화 방식을 결정하며,
+    헤더가 없는 값은 이전 버전(JSON)으로 저장된 레거시 키로 간주합니다. pickle 값은 복원하지 않고 캐시 미스로 처리합니다.
+
+    직렬화된 값이 compress_threshold 바이트 이상이면 압축하고 태그 바이트에 압축 방식을 표시합니다.
+    압축해도 작아지지 않는 값은 그대로 저장합니다. compress_threshold가 0이면 압축하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        compression: str = "none",
+        compress_threshold: int = 0,
+        compress_level: int = 3,
+    ):
+        if compression not in _COMPRESSION_NAMES:
+            raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed, falling back to zlib compression")
+            compression = "zlib"
+        self.compression = _COMPRESSION_NAMES[compression]
+        self.compress_threshold = compress_threshold if self.compression != COMPRESSION_NONE else 0
+        self.compress_level = compress_level
+        self.stats = CompressionStats()
+        self._encoders: Dict[type, Tuple[int, Callable[[Any], bytes]]] = {
+            bytes: (TAG_BYTES, bytes),
+            str: (TAG_TEXT, lambda value: value.encode("utf-8")),
+            CachedResponse: (TAG_RESPONSE, _encode_response),
+        }
+        self._decoders: Dict[int, Callable[[bytes], Any]] = {
+            TAG_JSON: orjson.loads,
+            TAG_BYTES: bytes,
+            TAG_TEXT: lambda payload: payload.decode("utf-8"),
+            TAG_RESPONSE: _decode_response,
+        }
+
+    def register(
+        self,
+        tag: int,
+        value_type: type,
+        encoder: Callable[[Any], bytes],
+        decoder: Callable[[bytes], Any],
+    ) -> None:
+        """
+        새로운 타입의 직렬화 방식을 등록합니다.
+        """
+        self._encoders[value_type] = (tag, encoder)
+        self._decoders[tag] = decoder
+
+    def encode(self, value: Any) -> bytes:
+        tag, encoder = self._encoders.get(type(value), (TAG_JSON, _dumps_json))
+        payload = encoder(value)
+
+        if self.compress_threshold and len(payload) >= self.compress_threshold:
+            started = time.perf_counter()
+            compressed = self._compress(payload)
+            elapsed = time.perf_counter() - started
+            if len(compressed) < len(payload):
+                self.stats.add(
+                    compressed_values=1,
+                    compress_bytes_in=len(payload),
+                    compress_bytes_out=len(compressed),
+                    compress_bytes_saved=len(payload) - len(compressed),
+                    compress_seconds=elapsed,
+                )
+                tag |= self.compression << _COMPRESSION_SHIFT
+                payload = compressed
+            else:
+                self.stats.add(incompressible_values=1, compress_seconds=elapsed)
+
+        return MAGIC + bytes((SCHEMA_VERSION, tag)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        if data[:2] != MAGIC:
+            return self._decode_legacy(data)
+
+        version, tag = data[2], data[3]
+        if version != SCHEMA_VERSION:
+            # 알 수 없는 스키마 버전은 캐시 미스로 처리
+            return None
+
+        decoder = self._decoders.get(tag & _TAG_MASK)
+        if decoder is None:
+            return None
+
+        payload = data[HEADER_SIZE:]
+        compression = tag >> _COMPRESSION_SHIFT
+        if compression != COMPRESSION_NONE:
+            decompressed = self._decompress(compression, payload)
+            if decompressed is None:
+                return None
+            payload = decompressed
+        return decoder(payload)
+
+    def _compress(self, payload: bytes) -> bytes:
+        if self.compression == COMPRESSION_ZSTD and zstandard is not None:
+            compressed: bytes = zstandard.ZstdCompressor(level=self.compress_level).compress(payload)
+            return compressed
+        return zlib.compress(payload, self.compress_level)
+
+    def _decompress(self, compression: int, payload: bytes) -> Optional[bytes]:
+        """
+        압축된 값을 복원합니다. 이 워커에서 풀 수 없는 방식이면 None(캐시 미스)을 반환합니다.
+        """
+        started = time.perf_counter()
+        if compression == COMPRESSION_ZLIB:
+            result = zlib.decompress(payload)
+        elif compression == COMPRESSION_ZSTD and zstandard is not None:
+            result = zstandard.ZstdDecompressor().decompress(payload)
+        else:
+            return None
+        self.stats.add(decompressed_values=1, decompress_seconds=time.perf_counter() - started)
+        return result
+
+    def _decode_legacy(self, data: bytes) -> Any:
+        """
+        헤더 없이 저장된 이전 형식의 값을 복원합니다. (기존 키가 만료되면 사용되지 않음)
+        """
+        if data[:1] == b"\x80":
+            # pickle 값은 역직렬화 시 코드를 실행할 수 있으므로 읽지 않음 (기존 키는 TTL이 지나면 사라짐)
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return data.decode("utf-8")
+
+
+# 기본 코덱 인스턴스
+default_codec = BinaryCodec(
+    compression=settings.CACHE_COMPRESSION,
+    compress_threshold=settings.CACHE_COMPRESSION_THRESHOLD,
+    compress_level=settings.CACHE_COMPRESSION_LEVEL,
+)
@@ -1,148 +1,1506 @@
 import redis
-from typing import Any, Dict, Optional, Union
+import redis.asyncio as aioredis
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Union, cast
+import asyncio
+import functools
 import json
-import pickle
-from fastapi.responses import Response, JSONResponse
+import logging
+import math
+import random
+import threading
+import time
+import uuid
 
 from app.core.config import settings
+from app.services.cache_codec import CacheCodec, default_codec
 
-# 전역 Redis 클라이언트 인스턴스
+logger = logging.getLogger(__name__)
+
+# 전역 Redis 클라이언트 인스턴스와 캐시 래퍼
 _redis_client = None
+_cache = None
+_async_cache = None
+
+# 워커 프로세스 내부 L1 캐시 인스턴스와 무효화 구독 스레드
+_local_cache = None
+_invalidation_thread = None
+
+# stale-while-revalidate 백그라운드 갱신 스레드 풀과 갱신 중인 키
+_refresh_executor = None
+_refreshing: Set[str] = set()
+_refresh_lock = threading.Lock()
+
+# Redis 장애로 반영하지 못한 무효화 (브레이커가 닫히면 다시 적용)
+_pending_tags: Set[str] = set()
+_pending_keys: Set[str] = set()
+_pending_lock = threading.Lock()
+
+# CacheMiddleware가 저장하는 HTTP 응답 캐시 키 접두사
+HTTP_CACHE_PREFIX = "http:"
+
+# 태그별로 등록된 캐시 키 집합의 접두사
+TAG_PREFIX = "tag:"
+
+# 존재하지 않는 리소스 조회(404)를 기억하는 네거티브 캐시 키 접두사
+# 실제 값과 다른 키 공간을 사용하므로 캐시된 값과 구분됨
+NEGATIVE_PREFIX = "missing:"
+
+# 한 번의 UNLINK 명령으로 삭제할 최대 키 개수
+_DELETE_BATCH_SIZE = 500
+
+# 태그 집합에서 이미 만료된 키를 제거하는 스크립트
+# EXISTS와 SREM을 원자적으로 실행하므로, 그 사이에 다시 저장된 키를 태그에서 빼지 않음
+_PRUNE_TAG_SCRIPT = """
+local removed = 0
+for _, key in ipairs(ARGV) do
+    if redis.call('EXISTS', key) == 0 then
+        removed = removed + redis.call('SREM', KEYS[1], key)
+    end
+end
+return removed
+"""
+
+# 캐시 재계산 락 키 접두사와, 자신이 잡은 락만 해제하는 스크립트
+LOCK_PREFIX = "lock:"
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 값이 없음을 나타내는 표식 (None도 유효한 값일 수 있으므로 구분)
+_MISSING = object()
+
+
+class CacheScope(str, Enum):
+    """
+    응답 캐시를 공유하는 범위입니다.
+    """
+    PUBLIC = "public"  # 모든 사용자가 같은 캐시를 공유
+    ROLE = "role"  # 같은 역할(관리자/일반 사용자)끼리 공유
+    USER = "user"  # 사용자별로 분리
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    라우트가 선언하는 응답 캐시 정책입니다.
+    """
+    scope: CacheScope
+    expire: int = 300
+    require_auth: bool = True  # 유효한 토큰이 있을 때만 캐시를 사용
+    tags: Tuple[str, ...] = ()  # 경로 파라미터와 {user_id}로 채워지는 무효화 태그 템플릿
+
+
+def cache_response(
+    scope: CacheScope,
+    expire: int = 300,
+    require_auth: bool = True,
+    tags: Tuple[str, ...] = (),
+) -> Callable[[Callable], Callable]:
+    """
+    엔드포인트에 응답 캐시 정책을 선언하는 데코레이터입니다.
+    정책이 없는 라우트는 CacheMiddleware가 캐싱하지 않습니다.
+
+    예: @cache_response(CacheScope.USER, tags=("quiz:{quiz_id}",))
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        policy = CachePolicy(scope=scope, expire=expire, require_auth=require_auth, tags=tuple(tags))
+        setattr(endpoint, "cache_policy", policy)  # CacheMiddleware가 getattr로 읽음
+        return endpoint
+
+    return decorator
+
+
+class CacheStats:
+    """
+    캐시 계층별 적중/실패 횟수를 집계하는 스레드 안전 카운터입니다.
+    """
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counters)
+
+
+# 프로세스 전역 캐시 통계
+cache_stats = CacheStats()
+
+
+class CacheUnavailableError(Exception):
+    """
+    서킷 브레이커가 열려 있어 Redis 호출을 건너뛸 때 발생합니다.
+    """
+
+
+class BreakerState(str, Enum):
+    """
+    서킷 브레이커 상태입니다.
+    """
+    CLOSED = "closed"  # 정상: 모든 호출을 Redis로 보냄
+    OPEN = "open"  # 차단: Redis를 호출하지 않고 캐시를 우회
+    HALF_OPEN = "half_open"  # 시험: 한 번의 호출로 복구 여부를 확인
+
+
+class CircuitBreaker:
+    """
+    Redis 호출을 감싸는 서킷 브레이커입니다.
+    연결 오류나 시간 초과가 연속으로 failure_threshold번 발생하면 차단(open)되어
+    reset_timeout 동안 Redis를 호출하지 않습니다. 이후 한 번의 시험 호출이 성공하면 다시 닫힙니다.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout: float,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = BreakerState.CLOSED
+        self._on_close = on_close
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        지금 Redis를 호출해도 되는지 반환합니다.
+        """
+        with self._lock:
+            if self.state == BreakerState.CLOSED:
+                return True
+            if self.state == BreakerState.OPEN:
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self._transition(BreakerState.HALF_OPEN)
+            # half-open 상태에서는 한 번에 하나의 시험 호출만 허용
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self.state != BreakerState.HALF_OPEN:
+                return
+            self._transition(BreakerState.CLOSED)
+        if self._on_close is not None:
+            self._on_close()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            cache_stats.incr("breaker_failures")
+            self._failures += 1
+            self._probing = False
+            if self.state == BreakerState.HALF_OPEN or (
+                self.state == BreakerState.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._transition(BreakerState.OPEN)
+
+    def _transition(self, state: BreakerState) -> None:
+        self.state = state
+        cache_stats.incr(f"breaker_{state.value}")
+        logger.warning("Cache circuit breaker %s", state.value)
+
+    def _before_call(self) -> None:
+        if not self.allow():
+            cache_stats.incr("breaker_bypassed")
+            raise CacheUnavailableError("Redis 서킷 브레이커가 열려 있습니다.")
+
+    def call(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        fn을 실행하고 결과에 따라 브레이커 상태를 갱신합니다.
+        연결 오류와 시간 초과만 실패로 집계하며, 그 외 오류는 Redis가 응답한 것이므로 성공으로 봅니다.
+        """
+        self._before_call()
+        try:
+            result = fn(*args, **kwargs)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    async def call_async(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        코루틴 함수용 call입니다.
+        """
+        self._before_call()
+        try:
+            result = await fn(*args, **kwargs)
+        except (redis.ConnectionError, redis.TimeoutError):
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        self.record_success()
+        return result
+
+
+def _report_error(operation: str, error: Exception) -> None:
+    """
+    캐시 오류와 브레이커가 열려 건너뛴 호출을 기록합니다.
+    """
+    if isinstance(error, CacheUnavailableError):
+        logger.warning("Cache %s skipped: circuit breaker is open", operation)
+        return
+    logger.warning("Cache %s error: %s", operation, error)
+
+
+class LocalCache:
+    """
+    워커 프로세스 내부에서 동작하는 크기 제한 LRU 캐시(L1)입니다.
+    Redis에서 읽어온 직렬화된 바이트를 그대로 보관하므로,
+    호출자마다 새로 역직렬화된 객체를 받아 서로의 변경에 영향을 주지 않습니다.
+    """
+
+    def __init__(self, max_items: int, ttl: int):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._data: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        키에 해당하는 값을 반환합니다. 만료된 항목은 제거하고 None을 반환합니다.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)  # 최근 사용 항목으로 갱신
+            return value
+
+    def set(self, key: str, value: bytes, expire: Optional[int] = None) -> None:
+        """
+        값을 저장합니다. 보관 시간은 L1 TTL과 Redis TTL 중 짧은 쪽을 따릅니다.
+        """
+        ttl = self.ttl if expire is None else min(self.ttl, expire)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_items:
+                self._data.popitem(last=False)  # 가장 오래 사용되지 않은 항목 제거
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [k for k in self._data if k.startswith(prefix)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class _Call:
+    """
+    SingleFlight에서 진행 중인 한 번의 로딩 호출입니다.
+    """
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 로딩을 워커 내에서 하나로 합칩니다.
+    먼저 들어온 호출만 로더를 실행하고, 나머지는 그 결과를 기다리거나 기존 값을 받습니다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any], stale: Any = _MISSING) -> Any:
+        """
+        키에 대한 로딩을 실행합니다. 이미 진행 중이면 stale 값이 있을 때 바로 반환하고,
+        없으면 진행 중인 로딩이 끝날 때까지 기다립니다.
+        """
+        with self._lock:
+            existing = self._calls.get(key)
+            leader = existing is None
+            call = _Call() if existing is None else existing
+            if leader:
+                self._calls[key] = call
+
+        if not leader:
+            if stale is not _MISSING:
+                cache_stats.incr("singleflight_stale")
+                return stale
+            cache_stats.incr("singleflight_waits")
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+
+# 프로세스 전역 single-flight 인스턴스
+_single_flight = SingleFlight()
+
+
+class AsyncSingleFlight:
+    """
+    SingleFlight의 asyncio 버전입니다. 같은 키의 동시 로딩을 이벤트 루프 내에서 하나로 합칩니다.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[str, asyncio.Future] = {}
+
+    async def do(
+        self, key: str, fn: Callable[[], Awaitable[Any]], stale: Any = _MISSING
+    ) -> Any:
+        call = self._calls.get(key)
+        if call is not None:
+            if stale is not _MISSING:
+                cache_stats.incr("singleflight_stale")
+                return stale
+            cache_stats.incr("singleflight_waits")
+            # 기다리던 요청이 취소되어도 진행 중인 로딩은 취소되지 않도록 shield
+            return await asyncio.shield(call)
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        try:
+            result = await fn()
+            call.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except Exception as e:
+            call.set_exception(e)
+            call.exception()  # 기다리는 요청이 없어도 미확인 예외 경고가 남지 않도록 처리
+            raise
+        finally:
+            self._calls.pop(key, None)
+
+
+# 이벤트 루프(워커)별 single-flight 인스턴스와 백그라운드 갱신 태스크
+_async_single_flight = AsyncSingleFlight()
+_async_refresh_tasks: Set["asyncio.Task[Any]"] = set()
+
+
+def _as_entry(value: Any) -> Optional[Dict[str, Any]]:
+    """
+    get_or_set 봉투({"v", "exp", "delta"})만 반환합니다.
+    같은 키에 이전 형식으로 저장된 값(봉투가 아닌 목록 등)은 캐시 미스로 처리합니다.
+    """
+    if isinstance(value, dict) and "v" in value and "exp" in value:
+        return value
+    return None
+
+
+def _should_refresh_early(entry: Dict[str, Any]) -> bool:
+    """
+    논리적 만료 시각이 지났으면 True를 반환합니다.
+    확률적 조기 갱신(XFetch): 만료가 가까울수록, 재계산 비용이 클수록 높은 확률로 True를 반환합니다.
+    인기 키가 한꺼번에 만료되어 동시에 재계산되는 것을 막습니다.
+    """
+    now = time.time()
+    if now >= entry["exp"]:
+        return True
+    beta = settings.CACHE_EARLY_REFRESH_BETA
+    if beta <= 0:
+        return False
+    delta = entry.get("delta", 0.0)
+    return bool(now - delta * beta * math.log(1.0 - random.random()) >= entry["exp"])
+
+
+def _stale_ttl_for(key: str) -> int:
+    """
+    키가 속한 네임스페이스(가장 길게 일치하는 접두사)의 stale 허용 시간을 반환합니다.
+    """
+    matches = [prefix for prefix in settings.CACHE_STALE_TTL if key.startswith(prefix)]
+    if not matches:
+        return 0
+    return settings.CACHE_STALE_TTL[max(matches, key=len)]
+
+
+def _get_refresh_executor() -> ThreadPoolExecutor:
+    """
+    백그라운드 캐시 갱신용 스레드 풀을 반환합니다.
+    """
+    global _refresh_executor
+
+    with _refresh_lock:
+        if _refresh_executor is None:
+            _refresh_executor = ThreadPoolExecutor(
+                max_workers=settings.CACHE_REFRESH_WORKERS,
+                thread_name_prefix="cache-refresh",
+            )
+    return _refresh_executor
+
+
+def _record_pending_invalidation(tags: Iterable[str] = (), keys: Iterable[str] = ()) -> None:
+    """
+    Redis에 반영하지 못한 무효화를 보관했다가, 브레이커가 닫히면 다시 적용합니다.
+    """
+    with _pending_lock:
+        _pending_tags.update(tags)
+        _pending_keys.update(keys)
+
+
+def _replay_pending_invalidations() -> None:
+    """
+    장애 동안 보관한 무효화를 백그라운드에서 Redis에 적용합니다.
+    """
+    with _pending_lock:
+        tags, keys = list(_pending_tags), list(_pending_keys)
+        _pending_tags.clear()
+        _pending_keys.clear()
+    if not tags and not keys:
+        return
+
+    def replay() -> None:
+        try:
+            cache = get_cache()
+            if tags:
+                cache.invalidate_tags(*tags)
+            for key in keys:
+                cache.delete(key)
+            cache_stats.incr("breaker_replayed_invalidations", len(tags) + len(keys))
+        except Exception as e:
+            _report_error("invalidation replay", e)
+
+    _get_refresh_executor().submit(replay)
+
+
+# 동기/비동기 클라이언트가 공유하는 Redis 서킷 브레이커
+_breaker = CircuitBreaker(
+    failure_threshold=settings.CACHE_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.CACHE_BREAKER_RESET_TIMEOUT,
+    on_close=_replay_pending_invalidations,
+)
+
+
+def _apply_invalidation(message: Dict[str, Any]) -> None:
+    """
+    다른 워커에서 발행한 무효화 메시지를 로컬 L1 캐시에 반영합니다.
+    """
+    if _local_cache is None:
+        return
+
+    op = message.get("op")
+    if op == "delete":
+        _local_cache.delete(*message.get("keys", []))
+    elif op == "prefix":
+        _local_cache.delete_prefix(message.get("prefix", ""))
+    elif op == "clear":
+        _local_cache.clear()
+    cache_stats.incr("l1_invalidations")
+
+
+def _listen_for_invalidations(redis_client: redis.Redis) -> None:
+    """
+    Redis pub/sub 채널을 구독하여 워커 간 L1 캐시 무효화를 처리합니다.
+    연결이 끊기면 L1을 비우고 다시 구독합니다.
+    """
+    while True:
+        try:
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+            for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    _apply_invalidation(json.loads(message["data"]))
+                except (ValueError, TypeError) as e:
+                    logger.warning("Cache invalidation message error: %s", e)
+        except Exception as e:
+            logger.exception("Cache invalidation listener error")
+            # 구독이 끊긴 동안 놓친 무효화가 있을 수 있으므로 L1을 비움
+            if _local_cache is not None:
+                _local_cache.clear()
+            time.sleep(1)
+
+
+def _tag_key(tag: str) -> str:
+    return f"{TAG_PREFIX}{tag}"
+
+
+def _queue_set(pipe: Any, key: str, data: bytes, expire: int, tags: Iterable[str]) -> None:
+    """
+    파이프라인에 값 저장과 태그 등록 명령을 추가합니다. (동기/비동기 파이프라인 공용)
+    """
+    pipe.set(key, data, ex=expire)  # 캐시에서 설정할 만료 시간과 함께 저장
+    for tag in tags:
+        tag_key = _tag_key(tag)
+        pipe.sadd(tag_key, key)
+        # 태그 집합은 가장 오래 사는 멤버만큼 유지 (새 집합이면 NX, 기존 집합은 GT로 연장)
+        pipe.expire(tag_key, expire, nx=True)
+        pipe.expire(tag_key, expire, gt=True)
+
+
+def _maybe_prune_tags(tags: Iterable[str]) -> None:
+    """
+    CACHE_TAG_PRUNE_PROBABILITY 확률로 태그 집합의 만료된 멤버 정리를 백그라운드에 예약합니다.
+    태그 집합의 TTL은 새 멤버가 등록될 때마다 연장되므로, 자주 쓰이는 태그는 정리하지 않으면 계속 커집니다.
+    """
+    tags = list(tags)
+    if not tags or random.random() >= settings.CACHE_TAG_PRUNE_PROBABILITY:
+        return
+    _get_refresh_executor().submit(get_cache().prune_tags, *tags)
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    캐시 계층별(L1/L2) 적중/실패 통계, 압축 통계와 서킷 브레이커 상태를 반환합니다.
+    """
+    return {
+        **cache_stats.snapshot(),
+        **default_codec.stats.snapshot(),
+        "breaker_state": _breaker.state.value,
+    }
+
+
+def _pool_kwargs() -> Dict[str, Any]:
+    """
+    동기/비동기 커넥션 풀에 공통으로 사용하는 설정입니다.
+    """
+    return {
+        "host": settings.REDIS_HOST,  # Redis 호스트
+        "port": settings.REDIS_PORT,  # Redis 포트
+        "db": settings.REDIS_DB,  # 사용할 데이터베이스 인덱스
+        "decode_responses": False,  # 코덱이 바이트를 직접 다루므로 바이트로 반환
+        "max_connections": settings.REDIS_MAX_CONNECTIONS,
+        "timeout": settings.REDIS_POOL_TIMEOUT,  # 풀이 가득 차면 이 시간만큼 대기
+        "socket_timeout": settings.REDIS_SOCKET_TIMEOUT,  # Redis 명령 시간 초과 설정
+        "socket_connect_timeout": settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+        "health_check_interval": settings.REDIS_HEALTH_CHECK_INTERVAL,
+    }
 
 
 def setup_cache() -> redis.Redis:
     """
-    Redis 클라이언트 연결을 초기화합니다.
+    Redis 커넥션 풀과 클라이언트 연결을 초기화합니다.
     """
     global _redis_client
     
     if _redis_client is None:
-        _redis_client = redis.Redis(
-            host=settings.REDIS_HOST,  # Redis 호스트
-            port=settings.REDIS_PORT,  # Redis 포트
-            db=0,  # 사용할 데이터베이스 인덱스
-            decode_responses=False,  # pickle 호환을 위해 바이트로 반환
-            socket_timeout=5,  # Redis 연결 시간 초과 설정
-        )
-    
+        pool = redis.BlockingConnectionPool(**_pool_kwargs())
+        _redis_client = redis.Redis(connection_pool=pool)
+
+    setup_local_cache(_redis_client)
+
     return _redis_client
 
 
+async def setup_async_cache() -> "AsyncRedisCache":
+    """
+    이벤트 루프를 블로킹하지 않는 비동기 Redis 클라이언트를 초기화합니다.
+    커넥션 풀이 이벤트 루프에 묶이므로 애플리케이션 시작 시 루프 안에서 호출해야 합니다.
+    """
+    global _async_cache
+
+    if _async_cache is None:
+        setup_cache()  # L1 캐시와 무효화 구독은 동기 클라이언트와 공유
+        pool = aioredis.BlockingConnectionPool(**_pool_kwargs())
+        _async_cache = AsyncRedisCache(aioredis.Redis(connection_pool=pool), local=_local_cache)
+
+    return _async_cache
+
+
+async def close_async_cache() -> None:
+    """
+    비동기 Redis 커넥션 풀을 닫습니다.
+    """
+    global _async_cache
+
+    if _async_cache is not None:
+        await _async_cache.redis.aclose()
+        await _async_cache.redis.connection_pool.disconnect()
+        _async_cache = None
+
+
+def setup_local_cache(redis_client: redis.Redis) -> Optional[LocalCache]:
+    """
+    설정에 따라 L1 캐시를 만들고, 워커 간 무효화를 위한 구독 스레드를 시작합니다.
+    """
+    global _local_cache, _invalidation_thread
+
+    if not settings.CACHE_LOCAL_ENABLED:
+        return None
+
+    if _local_cache is None:
+        _local_cache = LocalCache(
+            max_items=settings.CACHE_LOCAL_MAX_ITEMS,
+            ttl=settings.CACHE_LOCAL_TTL,
+        )
+
+    if _invalidation_thread is None:
+        _invalidation_thread = threading.Thread(
+            target=_listen_for_invalidations,
+            args=(redis_client,),
+            name="cache-invalidation-listener",
+            daemon=True,
+        )
+        _invalidation_thread.start()
+
+    return _local_cache
+
+
 def get_cache() -> "RedisCache":
     """
-    Redis 캐시 인스턴스를 반환합니다.
+    Redis 캐시 인스턴스를 반환합니다. (프로세스당 하나를 재사용)
     """
-    global _redis_client
+    global _cache
     
-    if _redis_client is None:
-        _redis_client = setup_cache()  # Redis 클라이언트를 설정합니다.
+    if _cache is None:
+        _cache = RedisCache(setup_cache(), local=_local_cache)  # Redis 클라이언트를 설정합니다.
     
-    return RedisCache(_redis_client)
+    return _cache
+
+
+def get_async_cache() -> "AsyncRedisCache":
+    """
+    비동기 Redis 캐시 인스턴스를 반환합니다. setup_async_cache가 먼저 호출되어야 합니다.
+    """
+    if _async_cache is None:
+        raise RuntimeError("비동기 캐시가 초기화되지 않았습니다. setup_async_cache()를 먼저 호출하세요.")
+    return _async_cache
+
+
+def negative_cached(
+    key: Callable[..., str], remember: Optional[Callable[..., bool]] = None
+) -> Callable[[Callable], Callable]:
+    """
+    조회 함수가 None(리소스 없음)을 반환하면 잠시 네거티브 캐시에 기억하는 데코레이터입니다.
+    기억하는 동안에는 조회 함수를 호출하지 않고 바로 None을 반환합니다. (get_unless_missing)
+    key는 조회 함수와 같은 인자를 받아 리소스 키를 만들며, 코루틴 함수에도 적용할 수 있습니다.
+    remember도 같은 인자를 받으며, False를 반환한 호출의 None 결과는 기억하지 않습니다.
+
+    예: @negative_cached(lambda db, quiz_id: f"quiz:{quiz_id}")
+    """
+    def should_remember(*args: Any, **kwargs: Any) -> bool:
+        return remember is None or remember(*args, **kwargs)
+
+    def decorator(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await get_async_cache().get_unless_missing(
+                    key(*args, **kwargs),
+                    lambda: fn(*args, **kwargs),
+                    remember=should_remember(*args, **kwargs),
+                )
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return get_cache().get_unless_missing(
+                key(*args, **kwargs),
+                lambda: fn(*args, **kwargs),
+                remember=should_remember(*args, **kwargs),
+            )
+        return wrapper
+
+    return decorator
 
 
 class RedisCache:
     """
     다양한 데이터와 응답을 처리할 수 있는 Redis 캐시 래퍼 클래스입니다.
+    값의 직렬화는 codec에 위임하며, local이 주어지면 워커 내부 L1 캐시를 Redis(L2) 앞단에 둡니다.
+    Redis 호출은 서킷 브레이커를 거치며, 브레이커가 열려 있는 동안에는 L1만 사용합니다.
     """
     
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        local: Optional[LocalCache] = None,
+        codec: CacheCodec = default_codec,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
         self.redis = redis_client
+        self.local = local
+        self.codec = codec
+        self.breaker = breaker if breaker is not None else _breaker
     
+    def _get_raw(self, key: str) -> Optional[bytes]:
+        """
+        L1 → Redis 순서로 직렬화된 원본 값을 찾고, 계층별 통계를 기록합니다.
+        """
+        if self.local is not None:
+            data = self.local.get(key)
+            if data is not None:
+                cache_stats.incr("l1_hits")
+                return data
+            cache_stats.incr("l1_misses")
+
+            # 값과 남은 TTL을 한 번의 왕복으로 가져와 L1 보관 시간을 맞춤
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.ttl(key)
+            data, ttl = self.breaker.call(pipe.execute)
+        else:
+            data, ttl = self.breaker.call(self.redis.get, key), None
+        data = cast(Optional[bytes], data)
+
+        if data is None:
+            cache_stats.incr("l2_misses")
+            return None
+
+        cache_stats.incr("l2_hits")
+        if self.local is not None:
+            self.local.set(key, data, expire=ttl if ttl and ttl > 0 else None)
+        return data
+
+    def _publish_invalidation(self, message: Dict[str, Any]) -> None:
+        """
+        다른 워커의 L1 캐시도 무효화되도록 메시지를 발행합니다.
+        """
+        if self.local is None:
+            return
+        try:
+            self.breaker.call(
+                self.redis.publish, settings.CACHE_INVALIDATION_CHANNEL, json.dumps(message)
+            )
+        except Exception as e:
+            _report_error("invalidation publish", e)
+
     def get(self, key: str) -> Optional[Any]:
         """
-        캐시에서 값을 가져옵니다. 복잡한 객체의 역직렬화도 처리합니다.
+        캐시에서 값을 가져옵니다. 역직렬화는 값 헤더의 타입 태그에 따라 한 번에 처리됩니다.
         """
         try:
-            data = self.redis.get(key)
+            data = self._get_raw(key)
             if data is None:
                 return None  # 값이 없으면 None을 반환
             
-            # Response 객체로 역직렬화 시도
-            try:
-                response_data = pickle.loads(data)
-                if isinstance(response_data, dict) and "response_type" in response_data:
-                    if response_data["response_type"] == "json":
-                        return JSONResponse(
-                            content=response_data["content"],
-                            status_code=response_data["status_code"],
-                            headers=response_data["headers"]
-                        )
-                    # 필요한 다른 응답 타입 추가 가능
-                return response_data
-            except:
-                # 기본적인 문자열 또는 JSON 처리로 포맷을 되돌림
-                try:
-                    return json.loads(data)
-                except:
-                    return data.decode("utf-8") if isinstance(data, bytes) else data
+            return self.codec.decode(data)
         except Exception as e:
-            print(f"Cache get error: {str(e)}")
+            _report_error("get", e)
             return None
     
-    def set(self, key: str, value: Any, expire: int = 300) -> bool:
-        """
-        캐시에 값을 저장합니다. 복잡한 객체를 직렬화하여 저장하며, 만료 시간도 설정합니다.
-        """
-        try:
-            # FastAPI Response 객체 처리
-            if isinstance(value, Response):
-                # JSONResponse에 대해서는 본문(content)을 저장
-                if isinstance(value, JSONResponse):
-                    cache_data = {
-                        "response_type": "json",
-                        "content": value.body.decode("utf-8") if isinstance(value.body, bytes) else value.body,
-                        "status_code": value.status_code,
-                        "headers": dict(value.headers)
-                    }
-                    serialized = pickle.dumps(cache_data)
-                else:
-                    # 다른 Response 타입은 전체 객체를 직렬화
-                    serialized = pickle.dumps(value)
-            else:
-                # 일반 Python 객체 처리
-                if isinstance(value, (dict, list, tuple, bool, int, float, str)):
-                    serialized = json.dumps(value).encode("utf-8")
-                else:
-                    serialized = pickle.dumps(value)
-            
-            self.redis.set(key, serialized, ex=expire)  # 캐시에서 설정할 만료 시간과 함께 저장
+    def set(
+        self, key: str, value: Any, expire: int = 300, tags: Iterable[str] = ()
+    ) -> bool:
+        """
+        캐시에 값을 저장합니다. dict/list/스칼라/Pydantic 모델 등 JSON 호환 값만 저장할 수 있으며,
+        만료 시간도 설정합니다. tags가 주어지면 invalidate_tags로 한 번에 무효화할 수 있도록
+        각 태그 집합에 키를 등록합니다.
+        Redis를 쓸 수 없어도 L1에는 저장하므로, 장애 동안에도 워커 내에서는 캐시가 동작합니다.
+        """
+        try:
+            serialized = self.codec.encode(value)
+            if self.local is not None:
+                self.local.set(key, serialized, expire=expire)
+
+            pipe = self.redis.pipeline(transaction=False)
+            _queue_set(pipe, key, serialized, expire, tags)
+            self.breaker.call(pipe.execute)
+            _maybe_prune_tags(tags)
             return True
         except Exception as e:
-            print(f"Cache set error: {str(e)}")
+            _report_error("set", e)
             return False
     
+    def prime_many(
+        self,
+        values: Dict[str, Any],
+        expire: int = 300,
+        tags: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> bool:
+        """
+        get_or_set으로 읽을 값들을 미리 채웁니다. (캐시 워밍업)
+        get_or_set과 같은 봉투 형식과 stale 허용 시간으로, 파이프라인 한 번에 저장합니다.
+        tags는 키별 태그 목록입니다.
+        """
+        tags = tags or {}
+        try:
+            now = time.time()
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in values.items():
+                data = self.codec.encode({"v": value, "delta": 0.0, "exp": now + expire})
+                _queue_set(pipe, key, data, expire + _stale_ttl_for(key), tags.get(key, ()))
+            self.breaker.call(pipe.execute)
+            return True
+        except Exception as e:
+            _report_error("prime_many", e)
+            return False
+
+    def is_missing(self, key: str) -> bool:
+        """
+        key에 해당하는 리소스가 최근 조회에서 존재하지 않았는지 확인합니다.
+        """
+        try:
+            return self._get_raw(f"{NEGATIVE_PREFIX}{key}") is not None
+        except Exception as e:
+            _report_error("is_missing", e)
+            return False
+
+    def mark_missing(self, key: str, expire: Optional[int] = None) -> None:
+        """
+        key에 해당하는 리소스가 없음을 짧은 시간 동안 기억합니다.
+        """
+        expire = expire or settings.CACHE_NEGATIVE_TTL
+        negative_key = f"{NEGATIVE_PREFIX}{key}"
+        if self.local is not None:
+            self.local.set(negative_key, b"1", expire=expire)
+        try:
+            self.breaker.call(self.redis.set, negative_key, b"1", ex=expire)
+        except Exception as e:
+            _report_error("mark_missing", e)
+
+    def clear_missing(self, key: str) -> None:
+        """
+        리소스가 생성되었을 때 네거티브 캐시 항목을 지웁니다. (다른 워커의 L1에도 전파)
+        """
+        self.delete(f"{NEGATIVE_PREFIX}{key}")
+
+    def get_unless_missing(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        expire: Optional[int] = None,
+        remember: bool = True,
+    ) -> Any:
+        """
+        최근에 없다고 확인된 리소스면 loader를 호출하지 않고 None을 반환합니다.
+        loader가 None을 반환하면 그 결과를 네거티브 캐시에 기억합니다.
+        remember가 False이면 기억하지 않습니다. (복제본처럼 최신 쓰기가 아직 안 보일 수 있는 조회)
+        """
+        if self.is_missing(key):
+            cache_stats.incr("negative_hits")
+            return None
+        value = loader()
+        if value is None and remember:
+            self.mark_missing(key, expire)
+        return value
+
     def delete(self, key: str) -> bool:
         """
         캐시에서 특정 키를 삭제합니다.
         """
+        if self.local is not None:
+            self.local.delete(key)
         try:
-            self.redis.delete(key)
+            self.breaker.call(self.redis.delete, key)
+            self._publish_invalidation({"op": "delete", "keys": [key]})
             return True
         except Exception as e:
-            print(f"Cache delete error: {str(e)}")
+            _report_error("delete", e)
+            _record_pending_invalidation(keys=[key])
             return False
     
+    def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        expire: int = 300,
+        tags: Iterable[str] = (),
+        background_loader: Optional[Callable[[], Any]] = None,
+    ) -> Any:
+        """
+        캐시에서 값을 가져오고, 없으면 loader로 계산해 저장합니다. (캐시 스탬피드 방지)
+
+        - 워커 내에서는 같은 키의 로더가 하나만 실행됩니다. (single-flight)
+        - 워커 간에는 짧은 Redis 락으로 한 워커만 재계산하고, 나머지는 결과를 기다리거나
+          기존 값을 받습니다.
+        - 만료 직전의 인기 키는 확률적으로 미리 갱신되어 한꺼번에 만료되지 않습니다.
+        - expire는 soft TTL입니다. 키 네임스페이스에 CACHE_STALE_TTL이 설정되어 있으면
+          그 시간만큼 Redis에 더 보관하며, soft TTL이 지난 값은 바로 반환하고
+          background_loader로 백그라운드에서 갱신합니다. (stale-while-revalidate)
+          background_loader는 요청 세션이 닫힌 뒤 실행되므로 자체 세션을 열어야 합니다.
+
+        값은 재계산 시간(delta)과 논리적 만료 시각(exp)을 담은 봉투 형태로 저장되므로,
+        이 메서드로 저장한 키는 get_or_set으로만 읽어야 합니다.
+        loader가 None을 반환하면 캐시에 저장하지 않습니다.
+        """
+        entry = _as_entry(self.get(key))
+        stale = _MISSING
+        if entry is not None:
+            if not _should_refresh_early(entry):
+                return entry["v"]
+            stale = entry["v"]
+            if time.time() >= entry["exp"]:
+                cache_stats.incr("stale_hits")
+            else:
+                cache_stats.incr("early_refreshes")
+
+            if background_loader is not None:
+                self._schedule_refresh(key, background_loader, expire, tags, stale)
+                return stale
+
+        return _single_flight.do(
+            key, lambda: self._load_with_lock(key, loader, expire, tags, stale), stale=stale
+        )
+
+    def _load_with_lock(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        expire: int,
+        tags: Iterable[str],
+        stale: Any,
+    ) -> Any:
+        """
+        Redis 락을 잡은 워커만 loader를 실행합니다.
+        락을 얻지 못하면 기존 값을 반환하거나, 다른 워커가 저장할 때까지 잠시 기다립니다.
+        """
+        lock_key = f"{LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = bool(
+                self.breaker.call(
+                    self.redis.set,
+                    lock_key,
+                    token,
+                    nx=True,
+                    px=int(settings.CACHE_LOCK_TIMEOUT * 1000),
+                )
+            )
+        except Exception as e:
+            # Redis를 쓸 수 없으면 기다리지 않고 바로 로드 (워커 내에서는 single-flight로 합쳐짐)
+            _report_error("lock", e)
+            return self._load_and_set(key, loader, expire, tags)
+
+        if not acquired:
+            if stale is not _MISSING:
+                cache_stats.incr("lock_stale")
+                return stale
+
+            # 다른 워커가 재계산 중이면 결과가 저장될 때까지 대기 (락 만료 시 직접 로드)
+            deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                entry = self.get(key)
+                if entry is not None:
+                    cache_stats.incr("lock_waits")
+                    return entry["v"]
+
+        try:
+            return self._load_and_set(key, loader, expire, tags)
+        finally:
+            if acquired:
+                try:
+                    self.breaker.call(self.redis.eval, _RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+                except Exception as e:
+                    _report_error("unlock", e)
+
+    def _load_and_set(
+        self, key: str, loader: Callable[[], Any], expire: int, tags: Iterable[str]
+    ) -> Any:
+        """
+        loader를 실행하고, 재계산 시간과 논리적 만료 시각(soft TTL)을 담은 봉투로 저장합니다.
+        Redis에는 stale 허용 시간만큼 더 보관합니다. (hard TTL)
+        """
+        started = time.monotonic()
+        value = loader()
+        delta = time.monotonic() - started
+        if value is not None:
+            self.set(
+                key,
+                {"v": value, "delta": delta, "exp": time.time() + expire},
+                expire=expire + _stale_ttl_for(key),
+                tags=tags,
+            )
+        return value
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        expire: int,
+        tags: Iterable[str],
+        stale: Any,
+    ) -> None:
+        """
+        백그라운드 갱신을 예약합니다. 같은 키의 갱신이 이미 예약되어 있으면 건너뜁니다.
+        """
+        with _refresh_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+
+        def refresh() -> None:
+            try:
+                # 다른 워커가 이미 갱신 중이면 락을 얻지 못하고 그대로 종료됨
+                self._load_with_lock(key, loader, expire, tags, stale)
+                cache_stats.incr("background_refreshes")
+            except Exception as e:
+                _report_error("background refresh", e)
+            finally:
+                with _refresh_lock:
+                    _refreshing.discard(key)
+
+        _get_refresh_executor().submit(refresh)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        태그에 등록된 모든 키를 삭제합니다. 키 공간 전체를 훑지 않고 태그 집합만 읽습니다.
+        삭제된 키의 개수를 반환합니다.
+        Redis를 쓸 수 없으면 태그에 속한 키를 알 수 없으므로 L1 전체를 비우고,
+        브레이커가 닫힌 뒤 다시 적용하도록 태그를 보관합니다.
+        """
+        tag_keys = [_tag_key(tag) for tag in tags]
+        try:
+            # 태그 집합을 읽고 지우는 작업을 원자적으로 수행하여, 그 사이에 등록된 키가 유실되지 않도록 함
+            pipe = self.redis.pipeline(transaction=True)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            pipe.delete(*tag_keys)
+            results = self.breaker.call(pipe.execute)
+
+            members = set().union(*results[:-1])
+            if not members:
+                return 0
+
+            keys: List[str] = [k.decode("utf-8") if isinstance(k, bytes) else k for k in members]
+            if self.local is not None:
+                self.local.delete(*keys)
+
+            pipe = self.redis.pipeline(transaction=False)
+            for i in range(0, len(keys), _DELETE_BATCH_SIZE):
+                pipe.unlink(*keys[i:i + _DELETE_BATCH_SIZE])
+            deleted = sum(cast(List[int], self.breaker.call(pipe.execute)))
+
+            self._publish_invalidation({"op": "delete", "keys": keys})
+            return deleted
+        except Exception as e:
+            _report_error("invalidate_tags", e)
+            if self.local is not None:
+                self.local.clear()
+            _record_pending_invalidation(tags=tags)
+            return 0
+
+    def prune_tags(self, *tags: str) -> int:
+        """
+        태그 집합에서 이미 만료되거나 삭제된 키를 제거하고, 제거한 멤버 수를 반환합니다.
+        SSCAN으로 나누어 읽으므로 큰 집합도 Redis를 오래 블로킹하지 않습니다.
+        """
+        removed = 0
+        try:
+            for tag in tags:
+                tag_key = _tag_key(tag)
+                batch: List[bytes] = []
+                for member in self.redis.sscan_iter(tag_key, count=_DELETE_BATCH_SIZE):
+                    batch.append(member)
+                    if len(batch) >= _DELETE_BATCH_SIZE:
+                        removed += self._prune_tag_batch(tag_key, batch)
+                        batch = []
+                if batch:
+                    removed += self._prune_tag_batch(tag_key, batch)
+        except Exception as e:
+            _report_error("prune_tags", e)
+        return removed
+
+    def _prune_tag_batch(self, tag_key: str, members: List[bytes]) -> int:
+        return cast(int, self.breaker.call(self.redis.eval, _PRUNE_TAG_SCRIPT, 1, tag_key, *members))
+
     def clear_prefix(self, prefix: str) -> int:
         """
         특정 접두사를 가진 모든 키를 삭제합니다.
         삭제된 키의 개수를 반환합니다.
+        SCAN으로 키 공간 전체를 순회하므로 요청 경로에서는 invalidate_tags를 사용하세요.
         """
+        if self.local is not None:
+            self.local.delete_prefix(prefix)
         try:
-            keys = self.redis.keys(f"{prefix}*")
-            if keys:
-                return self.redis.delete(*keys)  # 해당 키들을 한번에 삭제
-            return 0
+            deleted: int = self.breaker.call(self._unlink_prefix, prefix)
+            self._publish_invalidation({"op": "prefix", "prefix": prefix})
+            return deleted
         except Exception as e:
-            print(f"Cache clear_prefix error: {str(e)}")
+            _report_error("clear_prefix", e)
             return 0
+
+    def _unlink_prefix(self, prefix: str) -> int:
+        deleted = 0
+        batch: List[bytes] = []
+        # KEYS와 달리 SCAN은 Redis를 오래 블로킹하지 않음
+        for key in self.redis.scan_iter(match=f"{prefix}*", count=1000):
+            batch.append(key)
+            if len(batch) >= _DELETE_BATCH_SIZE:
+                deleted += cast(int, self.redis.unlink(*batch))
+                batch = []
+        if batch:
+            deleted += cast(int, self.redis.unlink(*batch))
+        return deleted
     
     def clear_all(self) -> bool:
         """
         전체 캐시를 삭제합니다 (주의해서 사용하세요).
         """
+        if self.local is not None:
+            self.local.clear()
+        try:
+            self.breaker.call(self.redis.flushdb)  # 모든 데이터베이스의 키를 삭제
+            self._publish_invalidation({"op": "clear"})
+            return True
+        except Exception as e:
+            _report_error("clear_all", e)
+            return False
+
+
+class AsyncRedisCache:
+    """
+    비동기 미들웨어에서 사용하는 Redis 캐시 래퍼입니다.
+    동기 RedisCache와 같은 코덱, L1 캐시, 통계, 서킷 브레이커를 공유하므로 두 경로의 캐시 항목이 호환됩니다.
+    """
+
+    def __init__(
+        self,
+        redis_client: aioredis.Redis,
+        local: Optional[LocalCache] = None,
+        codec: CacheCodec = default_codec,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.redis = redis_client
+        self.local = local
+        self.codec = codec
+        self.breaker = breaker if breaker is not None else _breaker
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        L1 → Redis 순서로 값을 가져옵니다.
+        """
+        try:
+            if self.local is not None:
+                data = self.local.get(key)
+                if data is not None:
+                    cache_stats.incr("l1_hits")
+                    return self.codec.decode(data)
+                cache_stats.incr("l1_misses")
+
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.get(key)
+                    pipe.ttl(key)
+                    data, ttl = await self.breaker.call_async(pipe.execute)
+            else:
+                data, ttl = await self.breaker.call_async(self.redis.get, key), None
+
+            if data is None:
+                cache_stats.incr("l2_misses")
+                return None
+
+            cache_stats.incr("l2_hits")
+            if self.local is not None:
+                self.local.set(key, data, expire=ttl if ttl and ttl > 0 else None)
+            return self.codec.decode(data)
+        except Exception as e:
+            _report_error("get", e)
+            return None
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        여러 키를 한 번의 왕복으로 가져옵니다. L1에 없는 키만 MGET으로 Redis에서 읽으며,
+        L1 보관 시간을 맞추도록 남은 TTL도 같은 파이프라인에서 가져옵니다.
+        캐시에 있는 키만 결과 딕셔너리에 포함됩니다.
+        """
+        found: Dict[str, bytes] = {}
         try:
-            self.redis.flushdb()  # 모든 데이터베이스의 키를 삭제
+            missing = []
+            for key in keys:
+                data = self.local.get(key) if self.local is not None else None
+                if data is not None:
+                    found[key] = data
+                else:
+                    missing.append(key)
+            if self.local is not None:
+                cache_stats.incr("l1_hits", len(found))
+                cache_stats.incr("l1_misses", len(missing))
+
+            if missing:
+                if self.local is not None:
+                    async with self.redis.pipeline(transaction=False) as pipe:
+                        pipe.mget(missing)
+                        for key in missing:
+                            pipe.ttl(key)
+                        values, *ttls = await self.breaker.call_async(pipe.execute)
+                else:
+                    values = await self.breaker.call_async(self.redis.mget, missing)
+                    ttls = [None] * len(missing)
+
+                for key, data, ttl in zip(missing, values, ttls):
+                    if data is None:
+                        cache_stats.incr("l2_misses")
+                        continue
+                    cache_stats.incr("l2_hits")
+                    found[key] = data
+                    if self.local is not None:
+                        self.local.set(key, data, expire=ttl if ttl and ttl > 0 else None)
+        except Exception as e:
+            # Redis를 쓸 수 없어도 L1에서 찾은 값은 반환
+            _report_error("get_many", e)
+
+        result: Dict[str, Any] = {}
+        for key, data in found.items():
+            try:
+                value = self.codec.decode(data)
+            except Exception as e:
+                _report_error("get_many", e)
+                continue
+            if value is not None:
+                result[key] = value
+        return result
+
+    async def set(
+        self, key: str, value: Any, expire: int = 300, tags: Iterable[str] = ()
+    ) -> bool:
+        """
+        값을 저장하고 태그 집합에 키를 등록합니다. (RedisCache.set과 동일한 형식)
+        """
+        try:
+            serialized = self.codec.encode(value)
+            if self.local is not None:
+                self.local.set(key, serialized, expire=expire)
+
+            async with self.redis.pipeline(transaction=False) as pipe:
+                _queue_set(pipe, key, serialized, expire, tags)
+                await self.breaker.call_async(pipe.execute)
+            _maybe_prune_tags(tags)
             return True
         except Exception as e:
-            print(f"Cache clear_all error: {str(e)}")
-            return False
\ No newline at end of file
+            _report_error("set", e)
+            return False
+
+    async def _publish_invalidation(self, message: Dict[str, Any]) -> None:
+        """
+        다른 워커의 L1 캐시도 무효화되도록 메시지를 발행합니다.
+        """
+        if self.local is None:
+            return
+        try:
+            await self.breaker.call_async(
+                self.redis.publish, settings.CACHE_INVALIDATION_CHANNEL, json.dumps(message)
+            )
+        except Exception as e:
+            _report_error("invalidation publish", e)
+
+    async def delete(self, key: str) -> bool:
+        """
+        캐시에서 특정 키를 삭제합니다.
+        """
+        if self.local is not None:
+            self.local.delete(key)
+        try:
+            await self.breaker.call_async(self.redis.delete, key)
+            await self._publish_invalidation({"op": "delete", "keys": [key]})
+            return True
+        except Exception as e:
+            _report_error("delete", e)
+            _record_pending_invalidation(keys=[key])
+            return False
+
+    async def is_missing(self, key: str) -> bool:
+        """
+        key에 해당하는 리소스가 최근 조회에서 존재하지 않았는지 확인합니다.
+        """
+        negative_key = f"{NEGATIVE_PREFIX}{key}"
+        if self.local is not None and self.local.get(negative_key) is not None:
+            return True
+        try:
+            return bool(await self.breaker.call_async(self.redis.exists, negative_key) > 0)
+        except Exception as e:
+            _report_error("is_missing", e)
+            return False
+
+    async def mark_missing(self, key: str, expire: Optional[int] = None) -> None:
+        """
+        key에 해당하는 리소스가 없음을 짧은 시간 동안 기억합니다.
+        """
+        expire = expire or settings.CACHE_NEGATIVE_TTL
+        negative_key = f"{NEGATIVE_PREFIX}{key}"
+        if self.local is not None:
+            self.local.set(negative_key, b"1", expire=expire)
+        try:
+            await self.breaker.call_async(self.redis.set, negative_key, b"1", ex=expire)
+        except Exception as e:
+            _report_error("mark_missing", e)
+
+    async def clear_missing(self, key: str) -> None:
+        """
+        리소스가 생성되었을 때 네거티브 캐시 항목을 지웁니다.
+        """
+        await self.delete(f"{NEGATIVE_PREFIX}{key}")
+
+    async def get_unless_missing(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: Optional[int] = None,
+        remember: bool = True,
+    ) -> Any:
+        """
+        RedisCache.get_unless_missing의 비동기 버전입니다.
+        """
+        if await self.is_missing(key):
+            cache_stats.incr("negative_hits")
+            return None
+        value = await loader()
+        if value is None and remember:
+            await self.mark_missing(key, expire)
+        return value
+
+    async def get_or_set(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: int = 300,
+        tags: Iterable[str] = (),
+        background_loader: Optional[Callable[[], Awaitable[Any]]] = None,
+    ) -> Any:
+        """
+        RedisCache.get_or_set의 비동기 버전입니다. 같은 봉투 형식을 사용하므로 두 경로가 키를 공유합니다.
+        loader와 background_loader는 코루틴 함수이며, background_loader는 자체 세션을 열어야 합니다.
+        """
+        entry = _as_entry(await self.get(key))
+        stale = _MISSING
+        if entry is not None:
+            if not _should_refresh_early(entry):
+                return entry["v"]
+            stale = entry["v"]
+            if time.time() >= entry["exp"]:
+                cache_stats.incr("stale_hits")
+            else:
+                cache_stats.incr("early_refreshes")
+
+            if background_loader is not None:
+                self._schedule_refresh(key, background_loader, expire, tags, stale)
+                return stale
+
+        return await _async_single_flight.do(
+            key, lambda: self._load_with_lock(key, loader, expire, tags, stale), stale=stale
+        )
+
+    async def _load_with_lock(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: int,
+        tags: Iterable[str],
+        stale: Any,
+    ) -> Any:
+        """
+        Redis 락을 잡은 워커만 loader를 실행합니다. (RedisCache._load_with_lock과 같은 락 키 사용)
+        """
+        lock_key = f"{LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        try:
+            acquired = bool(
+                await self.breaker.call_async(
+                    self.redis.set,
+                    lock_key,
+                    token,
+                    nx=True,
+                    px=int(settings.CACHE_LOCK_TIMEOUT * 1000),
+                )
+            )
+        except Exception as e:
+            _report_error("lock", e)
+            return await self._load_and_set(key, loader, expire, tags)
+
+        if not acquired:
+            if stale is not _MISSING:
+                cache_stats.incr("lock_stale")
+                return stale
+
+            deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                entry = await self.get(key)
+                if entry is not None:
+                    cache_stats.incr("lock_waits")
+                    return entry["v"]
+
+        try:
+            return await self._load_and_set(key, loader, expire, tags)
+        finally:
+            if acquired:
+                try:
+                    await self.breaker.call_async(
+                        self.redis.eval, _RELEASE_LOCK_SCRIPT, 1, lock_key, token
+                    )
+                except Exception as e:
+                    _report_error("unlock", e)
+
+    async def _load_and_set(
+        self, key: str, loader: Callable[[], Awaitable[Any]], expire: int, tags: Iterable[str]
+    ) -> Any:
+        started = time.monotonic()
+        value = await loader()
+        delta = time.monotonic() - started
+        if value is not None:
+            await self.set(
+                key,
+                {"v": value, "delta": delta, "exp": time.time() + expire},
+                expire=expire + _stale_ttl_for(key),
+                tags=tags,
+            )
+        return value
+
+    def _schedule_refresh(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        expire: int,
+        tags: Iterable[str],
+        stale: Any,
+    ) -> None:
+        """
+        백그라운드 갱신 태스크를 예약합니다. 같은 키의 갱신이 이미 예약되어 있으면 건너뜁니다.
+        """
+        with _refresh_lock:
+            if key in _refreshing:
+                return
+            _refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                await self._load_with_lock(key, loader, expire, tags, stale)
+                cache_stats.incr("background_refreshes")
+            except Exception as e:
+                _report_error("background refresh", e)
+            finally:
+                with _refresh_lock:
+                    _refreshing.discard(key)
+
+        # 태스크가 끝나기 전에 가비지 컬렉션되지 않도록 참조를 보관
+        task = asyncio.create_task(refresh())
+        _async_refresh_tasks.add(task)
+        task.add_done_callback(_async_refresh_tasks.discard)
@@ -9,45 +9,21 @@ from app.crud.question import question_crud
 from app.crud.submission import submission_crud
 
 
-def grade_submission(db: Session, submission: Submission, quiz: Quiz) -> Submission:
+def grade_submission(db: Session, submission: Submission) -> Submission:
     """
     퀴즈 제출 결과를 채점하는 함수
+    문항/선택지를 불러오지 않고 submission_answers와 정답 선택지를 조인한 쿼리 한 번으로 점수를 계산합니다.
 
     Args:
         db: 데이터베이스 세션
         submission: 채점 대상 제출 객체
-        quiz: 해당 제출이 속한 퀴즈 객체 (문항 정보 포함)
 
     Returns:
         채점 결과가 반영된 Submission 객체
     """
-    # dict 형태로 받은 답변 (question_id: selected_option_id)
-    raw_answers = submission_crud.get_answers(db, submission.id)
-
-    # 문자열 key가 있을 수 있으므로 int로 변환
-    answered_questions = {
-        int(question_id): selected_option_id
-        for question_id, selected_option_id in raw_answers.items()
-    }
-
-    # 퀴즈의 모든 문항 가져오기
-    questions = question_crud.get_questions_by_quiz(db, quiz_id=quiz.id)
-
-    question_scores: Dict[int, bool] = {}
-    total_points = 0
-    max_points = 0
-
-    for question in questions:
-        max_points += 1
-        correct_option_id = next((opt.id for opt in question.options if opt.is_correct), None)
-
-        selected_option_id = answered_questions.get(question.id)
-
-        if selected_option_id is not None and selected_option_id == correct_option_id:
-            question_scores[question.id] = True
-            total_points += 1
-        else:
-            question_scores[question.id] = False
+    max_points, total_points = submission_crud.count_correct_answers(
+        db, submission_id=submission.id, quiz_id=submission.quiz_id
+    )
 
     submission.score = (total_points / max_points * 100) if max_points > 0 else 0
 
@@ -75,7 +51,7 @@ def get_submission_details(db: Session, submission: Submission) -> Dict[str, Any
     }
 
     # 해당 퀴즈의 모든 문항 조회
-    questions = question_crud.get_questions_by_quiz(db, quiz_id=submission.quiz_id)
+    questions = question_crud.get_by_quiz_with_options(db, quiz_id=submission.quiz_id)
 
     questions_details = []  # 상세 질문 정보 리스트
 
@@ -1,46 +1,190 @@
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Union
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+import logging
 import random
+import time
 
 from app.models.quiz import Quiz
 from app.models.question import Question
 from app.models.option import Option
 from app.models.submission import Submission
 from app.models.user import User
-from app.crud.quiz import quiz_crud
+from app.crud.quiz import async_quiz_crud, quiz_crud
 from app.crud.question import question_crud
-from app.crud.submission import submission_crud
-from app.schemas.quiz import QuizRead
-from app.services.caching_service import get_cache
-from app.crud.quiz import quiz_crud
+from app.crud.submission import async_submission_crud, submission_crud
+from app.schemas.question import QuestionCreate
+from app.schemas.quiz import QuizCreate, QuizRead, QuizWithQuestions
+from app.schemas.submission import SubmissionCreate
+from app.core.config import settings
+from app.services.caching_service import get_async_cache, get_cache, negative_cached
+from app.db.session import reads_from_replica, run_in_async_session, run_in_session
 
-def get_quiz_with_questions(db: Session, quiz_id: int) -> Quiz:
+logger = logging.getLogger(__name__)
+
+# 존재하지 않는 퀴즈/문제/제출 조회를 기억하는 네거티브 캐시 키
+def _quiz_missing_key(quiz_id: int) -> str:
+    return f"quiz:{quiz_id}"
+
+def _question_missing_key(quiz_id: int, question_id: int) -> str:
+    return f"question:{question_id}:quiz:{quiz_id}"
+
+def _submission_missing_key(quiz_id: int, submission_id: int) -> str:
+    return f"submission:{submission_id}:quiz:{quiz_id}"
+
+def _remember_missing(db: Union[Session, AsyncSession], *args: Any, **kwargs: Any) -> bool:
+    # 복제본에서 찾지 못한 결과는 복제 지연일 수 있으므로 다른 사용자에게 "없음"으로 공유하지 않음
+    return not reads_from_replica(db)
+
+@negative_cached(lambda db, quiz_id: _quiz_missing_key(quiz_id), remember=_remember_missing)
+def get_quiz(db: Session, quiz_id: int) -> Optional[Quiz]:
     """
-    퀴즈와 해당 퀴즈의 모든 질문 및 옵션을 가져오는 함수.
-    캐시에서 먼저 확인하고, 없으면 DB에서 가져옴.
+    퀴즈를 조회하는 함수. 없는 ID는 잠시 네거티브 캐시에 기억하여 반복 조회가 DB까지 가지 않도록 함.
+    """
+    return quiz_crud.get(db=db, id=quiz_id)
+
+@negative_cached(lambda db, quiz_id: _quiz_missing_key(quiz_id), remember=_remember_missing)
+async def get_quiz_async(db: AsyncSession, quiz_id: int) -> Optional[Quiz]:
+    """
+    get_quiz의 비동기 버전. (같은 네거티브 캐시 키 사용)
     """
-    # 캐시에서 먼저 확인
-    cache = get_cache()
-    cache_key = f"quiz:{quiz_id}:full"
-    cached_quiz = cache.get(cache_key)
+    return await async_quiz_crud.get(db, id=quiz_id)
 
-    if cached_quiz:
-        return cached_quiz
+@negative_cached(lambda db, quiz_id: _quiz_missing_key(quiz_id), remember=_remember_missing)
+async def get_quiz_version_async(db: AsyncSession, quiz_id: int) -> Optional[int]:
+    """
+    퀴즈의 콘텐츠 버전을 조회하는 함수. 퀴즈가 없으면 None을 반환하고 네거티브 캐시에 기억함.
+    """
+    return await async_quiz_crud.get_version(db, quiz_id=quiz_id)
+
+@negative_cached(
+    lambda db, quiz_id, question_id: _question_missing_key(quiz_id, question_id),
+    remember=_remember_missing,
+)
+def get_question(db: Session, quiz_id: int, question_id: int) -> Optional[Question]:
+    """
+    퀴즈에 속한 문제를 조회하는 함수. 없는 문제는 잠시 네거티브 캐시에 기억함.
+    """
+    return question_crud.get_question_for_quiz(db=db, quiz_id=quiz_id, question_id=question_id)
 
-    # 캐시에서 없으면 DB에서 퀴즈를 가져옴
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+@negative_cached(
+    lambda db, quiz_id, submission_id: _submission_missing_key(quiz_id, submission_id),
+    remember=_remember_missing,
+)
+async def get_submission_async(db: AsyncSession, quiz_id: int, submission_id: int) -> Optional[Submission]:
+    """
+    퀴즈의 제출 기록을 문제/선택지/답변과 함께 조회하는 함수. 없는 제출은 잠시 네거티브 캐시에 기억함.
+    """
+    return await async_submission_crud.get_by_quiz_and_submission_id(
+        db=db, quiz_id=quiz_id, submission_id=submission_id
+    )
+
+def create_quiz_with_owner(db: Session, obj_in: QuizCreate, owner_id: int) -> Quiz:
+    """
+    퀴즈를 만드는 함수. 생성 전에 조회되어 네거티브 캐시에 기억된 '없음' 항목을 함께 지움. (다른 워커의 L1에도 전파)
+    """
+    quiz = quiz_crud.create_with_owner(db=db, obj_in=obj_in, owner_id=owner_id)
+    get_cache().clear_missing(_quiz_missing_key(quiz.id))
+    return quiz
+
+def create_question_with_quiz(db: Session, obj_in: QuestionCreate, quiz_id: int) -> Question:
+    """
+    퀴즈에 문제를 추가하는 함수. (create_quiz_with_owner 참고)
+    """
+    question = question_crud.create_with_quiz(db=db, obj_in=obj_in, quiz_id=quiz_id)
+    get_cache().clear_missing(_question_missing_key(quiz_id, question.id))
+    return question
+
+def start_submission(db: Session, obj_in: SubmissionCreate) -> Submission:
+    """
+    제출 기록을 만드는 함수. (create_quiz_with_owner 참고)
+    """
+    submission = submission_crud.create(db=db, obj_in=obj_in)
+    get_cache().clear_missing(_submission_missing_key(submission.quiz_id, submission.id))
+    return submission
+
+def _quiz_cache_key(quiz_id: int, version: int) -> str:
+    # 콘텐츠 버전별로 키가 달라지므로 한 번 저장된 스냅샷은 내용이 바뀌지 않음
+    return f"quiz:{quiz_id}:v{version}:full"
+
+def _quiz_snapshot(quiz: Quiz) -> Dict[str, Any]:
+    """
+    질문/옵션이 로드된 퀴즈를 캐시에 저장할 JSON 호환 스냅샷으로 변환하는 함수.
+    """
+    return QuizWithQuestions.model_validate(quiz, from_attributes=True).model_dump(mode="json")
+
+async def _load_quiz_snapshot_async(db: AsyncSession, quiz_id: int) -> Optional[Dict[str, Any]]:
+    """
+    DB에서 퀴즈와 질문/옵션을 읽어 캐시에 저장할 JSON 호환 스냅샷을 만드는 함수.
+    """
+    quiz = await async_quiz_crud.get_full(db, id=quiz_id)
     if not quiz:
         return None
+    return _quiz_snapshot(quiz)
+
+async def get_quiz_with_questions_async(db: AsyncSession, quiz_id: int) -> Optional[QuizWithQuestions]:
+    """
+    퀴즈와 해당 퀴즈의 모든 질문 및 옵션을 가져오는 함수.
+    퀴즈의 콘텐츠 버전만 DB에서 조회한 뒤, 그 버전의 스냅샷을 캐시에서 가져오고 없으면 DB에서 가져옴.
+    퀴즈/문제/선택지를 수정하면 버전이 올라가므로 수정 내용이 바로 반영되고,
+    바뀌지 않은 퀴즈는 스냅샷이 만료될 때까지 다시 조회하지 않음.
+    동시 요청이 몰려도 DB 로딩은 키당 한 번만 수행됨. (get_or_set)
+    ORM 객체 대신 QuizWithQuestions 스키마로 반환하여 캐시에는 JSON 호환 값만 저장됨.
+    """
+    version = await get_quiz_version_async(db, quiz_id=quiz_id)
+    if version is None:
+        return None
+
+    snapshot = await get_async_cache().get_or_set(
+        _quiz_cache_key(quiz_id, version),
+        lambda: _load_quiz_snapshot_async(db, quiz_id),
+        expire=settings.CACHE_QUIZ_SNAPSHOT_TTL,  # 이전 버전 스냅샷은 이 시간이 지나면 정리됨
+        tags=[f"quiz:{quiz_id}"],
+        background_loader=lambda: run_in_async_session(_load_quiz_snapshot_async, quiz_id),
+    )
+    if snapshot is None:
+        return None
 
-    # 관계된 질문들을 로드하도록 강제
-    for question in quiz.questions:
-        # 각 질문에 대해 옵션을 강제로 로드
-        _ = question.options
+    # 호출자마다 새 객체를 만들어 문제/선택지 섞기가 서로 영향을 주지 않도록 함
+    return QuizWithQuestions.model_validate(snapshot)
 
-    # 캐시에 결과를 저장 (5분 동안 유효)
-    cache.set(cache_key, quiz, expire=300)  # 5분 동안 캐시
+def _warm_quiz_batch(db: Session, skip: int, limit: int) -> int:
+    """
+    활성 퀴즈 한 배치를 질문/옵션과 함께 일괄 조회하여 캐시에 채우는 함수.
+    """
+    quizzes = quiz_crud.get_active_quizzes(db=db, skip=skip, limit=limit, with_questions=True)
+    if not quizzes:
+        return 0
 
-    return quiz
+    keys = {quiz.id: _quiz_cache_key(quiz.id, quiz.version) for quiz in quizzes}
+    snapshots = {keys[quiz.id]: _quiz_snapshot(quiz) for quiz in quizzes}
+    tags = {keys[quiz.id]: [f"quiz:{quiz.id}"] for quiz in quizzes}
+    get_cache().prime_many(snapshots, expire=settings.CACHE_QUIZ_SNAPSHOT_TTL, tags=tags)
+    return len(quizzes)
+
+def warm_quiz_cache() -> Dict[str, Any]:
+    """
+    모든 활성 퀴즈를 get_quiz_with_questions_async가 읽는 캐시에 미리 채우는 함수. (워커 시작 시 호출)
+    배치마다 별도 세션으로 조회하며, 동시에 실행되는 배치 수는 CACHE_WARMUP_CONCURRENCY로 제한함.
+    워밍업한 퀴즈 수와 소요 시간을 반환함.
+    """
+    started = time.perf_counter()
+    total = run_in_session(quiz_crud.count_active_quizzes)
+    batch_size = settings.CACHE_WARMUP_BATCH_SIZE
+
+    with ThreadPoolExecutor(
+        max_workers=settings.CACHE_WARMUP_CONCURRENCY, thread_name_prefix="cache-warmup"
+    ) as executor:
+        futures = [
+            executor.submit(run_in_session, _warm_quiz_batch, skip, batch_size)
+            for skip in range(0, total, batch_size)
+        ]
+        warmed = sum(future.result() for future in futures)
+
+    elapsed = time.perf_counter() - started
+    logger.info("Cache warm-up: %d quizzes in %.2fs", warmed, elapsed)
+    return {"quizzes": warmed, "seconds": round(elapsed, 3)}
 
 def get_questions_for_user(db: Session, quiz_id: int, user_id: int) -> List[Question]:
     """
@@ -48,7 +192,7 @@ def get_questions_for_user(db: Session, quiz_id: int, user_id: int) -> List[Ques
     퀴즈 설정에 따라 질문을 랜덤화하고, 사용자의 응시 상태에 맞게 반환.
     """
     # 퀴즈 정보를 가져옴
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = get_quiz(db=db, quiz_id=quiz_id)
     if not quiz:
         return []
 
@@ -74,6 +218,9 @@ def get_questions_for_user(db: Session, quiz_id: int, user_id: int) -> List[Ques
     if quiz.randomize_questions:
         random.shuffle(selected_questions)
 
+    # 출제할 질문들의 옵션을 한 번에 불러옴
+    question_crud.load_options(db, selected_questions)
+
     # 각 질문에 대해 옵션을 랜덤화
     if quiz.randomize_options:
         for question in selected_questions:
@@ -88,7 +235,7 @@ def get_questions_for_user(db: Session, quiz_id: int, user_id: int) -> List[Ques
             "score": 0,
             "selected_questions": [q.id for q in selected_questions]
         }
-        submission_crud.create(db=db, obj_in=submission_data)
+        submission = start_submission(db=db, obj_in=submission_data)
 
     return selected_questions
 
@@ -98,7 +245,7 @@ def get_user_quiz_status(db: Session, quiz_id: int, user_id: int, skip: int = 0,
     사용자의 응시 상태에 따라 'not_started', 'in_progress', 'completed' 상태를 반환.
     """
     # 퀴즈 정보를 가져옴
-    quiz = quiz_crud.get(db=db, id=quiz_id)
+    quiz = get_quiz(db=db, quiz_id=quiz_id)
     if not quiz:
         return {"status": "not_found"}
 
@@ -132,35 +279,30 @@ def get_quizzes_for_user(db: Session, user: User, skip: int = 0, limit: int = 10
     """
     사용자가 참여할 수 있는 퀴즈 목록을 가져오고, 각 퀴즈에 대해 사용자의 상태를 추가하여 반환.
     관리자가 아닌 경우 사용자 상태를 추가.
+    퀴즈 정보, 문제 수, 응시 상태를 퀴즈마다 따로 조회하지 않고 쿼리 한 번으로 가져옴. (get_user_quiz_status와 같은 기준)
     """
-    # 모든 활성화된 퀴즈를 가져옴
-    quizzes = quiz_crud.get_multi(db=db, skip=skip, limit=limit)
+    rows = quiz_crud.get_dashboard_for_user(db=db, user_id=user.id, skip=skip, limit=limit)
 
     result = []
-    for quiz in quizzes:
-        # 사용자 상태를 확인
-        status = get_user_quiz_status(db, quiz.id, user.id, skip, limit)
-
-        # 사용자가 응시한 퀴즈만 추가
-        if status["status"] != "not_started":
-            quiz_data = {
-                "id": quiz.id,
-                "title": quiz.title,
-                "description": quiz.description,
-                "created_at": quiz.created_at,
-                "total_questions": len(quiz.questions),
-                "questions_per_quiz": quiz.questions_per_quiz or len(quiz.questions),
-                "created_by": quiz.created_by,
-                "is_active": quiz.is_active,
-                "updated_at": quiz.updated_at,
-                "status": status["status"]
-            }
-
-            if status["status"] != "not_started":
-                quiz_data["submission_id"] = status.get("submission_id")
-            if status["status"] == "completed":
-                quiz_data["score"] = status.get("score")
-
-            result.append(quiz_data)
+    for quiz, question_count, submission_id, is_completed, score in rows:
+        # 사용자가 응시한 퀴즈만 조회되므로 진행 중 또는 완료 상태
+        status = "completed" if is_completed else "in_progress"
+        quiz_data = {
+            "id": quiz.id,
+            "title": quiz.title,
+            "description": quiz.description,
+            "created_at": quiz.created_at,
+            "total_questions": question_count,
+            "questions_per_quiz": quiz.questions_per_quiz or question_count,
+            "created_by": quiz.created_by,
+            "is_active": quiz.is_active,
+            "updated_at": quiz.updated_at,
+            "status": status,
+            "submission_id": submission_id,
+        }
+        if status == "completed":
+            quiz_data["score"] = score
+
+        result.append(quiz_data)
 
     return result
\ No newline at end of file
@@ -0,0 +1,91 @@
+"""
+동기/비동기 DB 계층 처리량 벤치마크
+
+동시 응시자 1,000명이 퀴즈 상세(문제/선택지 포함)와 자신의 제출 목록을 조회하는 상황을 가정하여
+  - 동기 세션(SessionLocal, psycopg2) + FastAPI 기본 스레드풀 크기(40)
+  - 비동기 세션(AsyncSessionLocal, asyncpg) + 이벤트 루프
+의 처리량을 비교합니다. 캐시를 거치지 않고 DB 계층만 측정합니다.
+
+실행 (시드 데이터가 있는 DB 필요):
+    BENCH_USERS=1000 poetry run python -m benchmarks.bench_async_db
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from sqlalchemy.orm import Session, selectinload
+
+from app.crud.quiz import async_quiz_crud
+from app.crud.submission import async_submission_crud, submission_crud
+from app.db.session import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.models.question import Question
+from app.models.quiz import Quiz
+
+USERS = int(os.getenv("BENCH_USERS", "1000"))
+THREADS = int(os.getenv("BENCH_THREADS", "40"))  # anyio 스레드풀 기본 크기
+
+
+def _quiz_ids() -> List[int]:
+    with SessionLocal() as db:
+        return [quiz_id for (quiz_id,) in db.query(Quiz.id).filter(Quiz.is_active == True).all()]
+
+
+def sync_test_taker(user_id: int, quiz_id: int) -> None:
+    db: Session = SessionLocal()
+    try:
+        db.query(Quiz).options(
+            selectinload(Quiz.questions).selectinload(Question.options)
+        ).filter(Quiz.id == quiz_id).first()
+        submission_crud.get_by_user_and_quiz(db, user_id=user_id, quiz_id=quiz_id)
+    finally:
+        db.close()
+
+
+async def async_test_taker(user_id: int, quiz_id: int) -> None:
+    async with AsyncSessionLocal() as db:
+        await async_quiz_crud.get_full(db, id=quiz_id)
+        await async_submission_crud.get_by_user_and_quiz(db, user_id=user_id, quiz_id=quiz_id)
+
+
+def report(name: str, elapsed: float) -> None:
+    print(f"{name:<32} {elapsed * 1000:>10.1f} ms  {USERS / elapsed:>10.1f} users/s")
+
+
+def run_sync(quiz_ids: List[int]) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        futures = [
+            executor.submit(sync_test_taker, user_id, quiz_ids[user_id % len(quiz_ids)])
+            for user_id in range(USERS)
+        ]
+        for future in futures:
+            future.result()
+    return time.perf_counter() - started
+
+
+async def run_async(quiz_ids: List[int]) -> float:
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(async_test_taker(user_id, quiz_ids[user_id % len(quiz_ids)]) for user_id in range(USERS))
+    )
+    elapsed = time.perf_counter() - started
+    await async_engine.dispose()
+    return elapsed
+
+
+def run() -> None:
+    quiz_ids = _quiz_ids()
+    if not quiz_ids:
+        print("no active quizzes, run the seed script first")
+        return
+
+    print(f"{USERS} concurrent test-takers, {len(quiz_ids)} quizzes")
+    report(f"sync (threadpool={THREADS})", run_sync(quiz_ids))
+    engine.dispose()
+    report("async (AsyncSession)", asyncio.run(run_async(quiz_ids)))
+
+
+if __name__ == "__main__":
+    run()
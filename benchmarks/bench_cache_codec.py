@@ -0,0 +1,120 @@
+"""
+캐시 코덱 벤치마크
+
+시드 데이터(app/seed/data.json)로 실제 QuizWithQuestions 페이로드를 만들어
+기존 방식(ORM 객체 pickle, JSON)과 BinaryCodec(비압축/zlib/zstd)의 인코딩/디코딩 시간과 크기를 비교합니다.
+
+실행:
+    poetry run python -m benchmarks.bench_cache_codec
+"""
+import functools
+import json
+import pickle
+import timeit
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from app.models.option import Option
+from app.models.question import Question
+from app.models.quiz import Quiz
+from app.schemas.quiz import QuizWithQuestions
+from app.services.cache_codec import BinaryCodec, zstandard
+
+SEED_FILE = Path(__file__).resolve().parent.parent / "app" / "seed" / "data.json"
+REPEAT = 2000
+
+# 비교할 코덱 (압축 임계값은 기본 설정과 같은 1KB)
+CODECS = {
+    "BinaryCodec(model)": BinaryCodec(),
+    "BinaryCodec+zlib": BinaryCodec("zlib", compress_threshold=1024, compress_level=3),
+}
+if zstandard is not None:
+    CODECS["BinaryCodec+zstd"] = BinaryCodec("zstd", compress_threshold=1024, compress_level=3)
+
+
+def build_orm_quiz(quiz_id: int, quiz_data: Dict[str, Any], scale: int = 1) -> Quiz:
+    """
+    시드 데이터로 DB 없이 ORM 객체 그래프를 구성합니다. scale 배수만큼 문제를 복제합니다.
+    """
+    now = datetime.utcnow()
+    quiz = Quiz(
+        id=quiz_id,
+        title=quiz_data["title"],
+        description=quiz_data["description"],
+        created_by=1,
+        is_active=True,
+        questions_per_quiz=quiz_data["questions_per_quiz"],
+        randomize_questions=quiz_data["randomize_questions"],
+        randomize_options=quiz_data["randomize_options"],
+        created_at=now,
+        updated_at=now,
+    )
+
+    question_id, option_id = 1, 1
+    for _ in range(scale):
+        for q_data in quiz_data["questions"]:
+            question = Question(
+                id=question_id,
+                quiz_id=quiz_id,
+                content=q_data["content"],
+                order_index=question_id - 1,
+                created_at=now,
+                updated_at=now,
+            )
+            for j, opt in enumerate(q_data["options"]):
+                question.options.append(
+                    Option(
+                        id=option_id,
+                        question_id=question_id,
+                        content=opt["content"],
+                        is_correct=opt["is_correct"],
+                        order_index=j,
+                        created_at=now,
+                        updated_at=now,
+                    )
+                )
+                option_id += 1
+            quiz.questions.append(question)
+            question_id += 1
+    return quiz
+
+
+def measure(encode: Callable[[], bytes], decode: Callable[[bytes], Any]) -> Tuple[float, float, int]:
+    """
+    인코딩/디코딩 1회 평균 시간(마이크로초)과 페이로드 크기(바이트)를 반환합니다.
+    """
+    payload = encode()
+    encode_us = timeit.timeit(encode, number=REPEAT) / REPEAT * 1e6
+    decode_us = timeit.timeit(lambda: decode(payload), number=REPEAT) / REPEAT * 1e6
+    return encode_us, decode_us, len(payload)
+
+
+def run() -> None:
+    with open(SEED_FILE, encoding="utf-8") as f:
+        quizzes: List[Dict[str, Any]] = json.load(f)["quizzes"]
+
+    cases = [(f"seed#{i + 1}", q, 1) for i, q in enumerate(quizzes)]
+    cases.append(("seed#2 x10", quizzes[-1], 10))
+    cases.append(("seed#2 x100", quizzes[-1], 100))
+
+    print(f"{'payload':<12} {'method':<22} {'encode(us)':>11} {'decode(us)':>11} {'size(B)':>9}")
+    for name, quiz_data, scale in cases:
+        orm_quiz = build_orm_quiz(1, quiz_data, scale)
+        model = QuizWithQuestions.model_validate(orm_quiz, from_attributes=True)
+        plain = model.model_dump(mode="json")
+
+        methods: Dict[str, Tuple[Callable[[], bytes], Callable[[bytes], Any]]] = {
+            "pickle(ORM, legacy)": (lambda: pickle.dumps(orm_quiz), pickle.loads),
+            "pickle(dict)": (lambda: pickle.dumps(plain), pickle.loads),
+            "json(dict)": (lambda: json.dumps(plain).encode("utf-8"), json.loads),
+        }
+        for codec_name, codec in CODECS.items():
+            methods[codec_name] = (functools.partial(codec.encode, model), codec.decode)
+        for method, (encode, decode) in methods.items():
+            encode_us, decode_us, size = measure(encode, decode)
+            print(f"{name:<12} {method:<22} {encode_us:>11.1f} {decode_us:>11.1f} {size:>9}")
+
+
+if __name__ == "__main__":
+    run()
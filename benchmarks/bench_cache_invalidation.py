@@ -0,0 +1,90 @@
+"""
+캐시 무효화 벤치마크
+
+키 공간에 100만 개의 키가 있을 때, 퀴즈 목록 캐시(quizzes:list:*)를 무효화하는 비용을 비교합니다.
+  - KEYS + DEL (기존 clear_prefix 방식, Redis 전체를 블로킹)
+  - SCAN + UNLINK (현재 clear_prefix)
+  - 태그 집합 기반 invalidate_tags
+
+실행 (벤치마크 전용 Redis DB를 비우고 사용합니다):
+    BENCH_REDIS_DB=15 poetry run python -m benchmarks.bench_cache_invalidation
+"""
+import os
+import time
+from typing import Callable, List, cast
+
+import redis
+
+from app.core.config import settings
+from app.services.caching_service import RedisCache
+
+TOTAL_KEYS = int(os.getenv("BENCH_TOTAL_KEYS", "1000000"))
+LIST_KEYS = int(os.getenv("BENCH_LIST_KEYS", "10000"))
+BATCH = 10000
+
+
+def populate_filler(client: redis.Redis) -> None:
+    """
+    무효화 대상이 아닌 키로 키 공간을 채웁니다.
+    """
+    for start in range(0, TOTAL_KEYS - LIST_KEYS, BATCH):
+        pipe = client.pipeline(transaction=False)
+        for i in range(start, min(start + BATCH, TOTAL_KEYS - LIST_KEYS)):
+            pipe.set(f"quiz:{i}:full", b"x", ex=3600)
+        pipe.execute()
+
+
+def populate_lists(cache: RedisCache) -> None:
+    """
+    사용자별 퀴즈 목록 캐시를 태그와 함께 저장합니다.
+    """
+    for user_id in range(LIST_KEYS):
+        cache.set(
+            f"quizzes:list:user:{user_id}:skip:0:limit:100",
+            [],
+            expire=3600,
+            tags=["quizzes:list"],
+        )
+
+
+def timed(name: str, fn: Callable[[], int]) -> None:
+    start = time.perf_counter()
+    deleted = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{name:<28} {elapsed:>10.1f} ms  deleted={deleted}")
+
+
+def run() -> None:
+    client = redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=int(os.getenv("BENCH_REDIS_DB", "15")),
+    )
+    client.flushdb()
+    cache = RedisCache(client)
+
+    print(f"populating {TOTAL_KEYS} keys ({LIST_KEYS} list keys)...")
+    populate_filler(client)
+
+    def keys_and_delete() -> int:
+        keys = cast(List[bytes], client.keys("quizzes:list*"))
+        return cast(int, client.delete(*keys)) if keys else 0
+
+    def keys_only() -> int:
+        return len(cast(List[bytes], client.keys("quizzes:list*")))
+
+    populate_lists(cache)
+    timed("KEYS only (blocking)", keys_only)
+    timed("KEYS + DEL (legacy)", keys_and_delete)
+
+    populate_lists(cache)
+    timed("SCAN + UNLINK (clear_prefix)", lambda: cache.clear_prefix("quizzes:list"))
+
+    populate_lists(cache)
+    timed("invalidate_tags", lambda: cache.invalidate_tags("quizzes:list"))
+
+    client.flushdb()
+
+
+if __name__ == "__main__":
+    run()
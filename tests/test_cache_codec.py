@@ -0,0 +1,98 @@
+import json
+import os
+import pickle
+
+import pytest
+
+from app.services.cache_codec import (
+    HEADER_SIZE,
+    MAGIC,
+    SCHEMA_VERSION,
+    TAG_JSON,
+    BinaryCodec,
+    CachedResponse,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"id": 1, "title": "Quiz", "questions": [{"id": 2, "options": [1, 2, 3]}]},
+        [1, "two", 3.0, None, True],
+        42,
+        b"\x00\x01raw bytes",
+        "한국어 문자열",
+    ],
+)
+def test_round_trip(value: object) -> None:
+    codec = BinaryCodec()
+    data = codec.encode(value)
+    assert data[:2] == MAGIC and data[2] == SCHEMA_VERSION
+    decoded = codec.decode(data)
+    assert decoded == value and type(decoded) is type(value)
+
+
+def test_response_round_trip() -> None:
+    codec = BinaryCodec()
+    response = CachedResponse(
+        status_code=200,
+        headers=[("content-type", "application/json")],
+        body=b'{"ok":true}',
+        etag='"abc"',
+    )
+    assert codec.decode(codec.encode(response)) == response
+
+
+def test_non_string_keys_and_sets_are_json_encoded() -> None:
+    codec = BinaryCodec()
+    assert codec.decode(codec.encode({1: {3, 4}})) in ({"1": [3, 4]}, {"1": [4, 3]})
+
+
+def test_unknown_schema_version_or_tag_is_a_miss() -> None:
+    codec = BinaryCodec()
+    payload = codec.encode({"a": 1})[HEADER_SIZE:]
+    assert codec.decode(MAGIC + bytes((SCHEMA_VERSION + 1, TAG_JSON)) + payload) is None
+    assert codec.decode(MAGIC + bytes((SCHEMA_VERSION, 63)) + payload) is None
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (json.dumps({"id": 1}).encode("utf-8"), {"id": 1}),
+        ("plain text".encode("utf-8"), "plain text"),
+    ],
+)
+def test_legacy_values_are_decoded(data: bytes, expected: object) -> None:
+    assert BinaryCodec().decode(data) == expected
+
+
+def test_legacy_pickle_values_are_a_miss() -> None:
+    assert BinaryCodec().decode(pickle.dumps({"id": 1, "title": "Quiz"})) is None
+
+
+@pytest.mark.parametrize("compression", ["zlib", "zstd"])
+def test_large_values_are_compressed(compression: str) -> None:
+    codec = BinaryCodec(compression=compression, compress_threshold=64)
+    value = {"questions": [{"content": "같은 문제 내용 " * 10, "options": list(range(20))}] * 20}
+    data = codec.encode(value)
+    assert data[3] >> 6 != 0  # 태그 바이트 상위 비트에 압축 방식 표시
+    assert len(data) < len(BinaryCodec().encode(value))
+    assert codec.decode(data) == value
+    assert codec.stats.snapshot()["compressed_values"] == 1
+
+
+def test_small_or_incompressible_values_are_stored_as_is() -> None:
+    codec = BinaryCodec(compression="zlib", compress_threshold=64)
+    small = codec.encode("short")
+    assert small[3] >> 6 == 0 and codec.decode(small) == "short"
+
+    noise = os.urandom(512)
+    data = codec.encode(noise)
+    assert data[3] >> 6 == 0 and codec.decode(data) == noise
+    assert codec.stats.snapshot()["incompressible_values"] == 1
+
+
+def test_uncompressed_codec_reads_compressed_values() -> None:
+    value = {"content": "x" * 1000}
+    data = BinaryCodec(compression="zlib", compress_threshold=64).encode(value)
+    assert BinaryCodec().decode(data) == value
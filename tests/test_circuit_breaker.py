@@ -0,0 +1,90 @@
+import asyncio
+from typing import List
+
+import pytest
+import redis
+
+from app.services import caching_service
+from app.services.caching_service import BreakerState, CacheUnavailableError, CircuitBreaker
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """
+    브레이커가 보는 시간을 테스트에서 직접 움직일 수 있게 합니다.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(caching_service.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _fail() -> None:
+    raise redis.ConnectionError("down")
+
+
+def _wrong_type() -> None:
+    raise redis.ResponseError("WRONGTYPE")
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.failure_threshold):
+        with pytest.raises(redis.ConnectionError):
+            breaker.call(_fail)
+
+
+def test_opens_after_consecutive_failures(clock: List[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10)
+    with pytest.raises(redis.ConnectionError):
+        breaker.call(_fail)
+    assert breaker.call(lambda: "ok") == "ok"  # 성공하면 연속 실패 횟수 초기화
+    _trip(breaker)
+    assert breaker.state == BreakerState.OPEN
+    with pytest.raises(CacheUnavailableError):
+        breaker.call(lambda: "ok")
+
+
+def test_other_errors_do_not_count_as_failures() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+    with pytest.raises(redis.ResponseError):
+        breaker.call(_wrong_type)
+    assert breaker.state == BreakerState.CLOSED
+
+
+def test_half_open_probe_closes_on_success(clock: List[float]) -> None:
+    closed: List[bool] = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, on_close=lambda: closed.append(True))
+    _trip(breaker)
+    clock[0] += 10
+    assert breaker.allow()
+    assert breaker.state == BreakerState.HALF_OPEN
+    assert not breaker.allow()  # 시험 호출은 한 번에 하나만
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED
+    assert closed == [True]
+
+
+def test_half_open_probe_reopens_on_failure(clock: List[float]) -> None:
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+    _trip(breaker)
+    clock[0] += 10
+    with pytest.raises(redis.ConnectionError):
+        breaker.call(_fail)
+    assert breaker.state == BreakerState.OPEN
+    clock[0] += 9
+    assert not breaker.allow()
+
+
+def test_call_async() -> None:
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10)
+
+    async def ok() -> str:
+        return "ok"
+
+    async def fail() -> None:
+        raise redis.TimeoutError("slow")
+
+    assert asyncio.run(breaker.call_async(ok)) == "ok"
+    with pytest.raises(redis.TimeoutError):
+        asyncio.run(breaker.call_async(fail))
+    with pytest.raises(CacheUnavailableError):
+        asyncio.run(breaker.call_async(ok))
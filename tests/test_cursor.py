@@ -0,0 +1,40 @@
+import base64
+from datetime import datetime
+
+import pytest
+
+from app.crud.base import decode_cursor, encode_cursor, next_cursor
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2026, 10, 17, 18, 32, 10, 418205)
+    cursor = encode_cursor(created_at, 42)
+    assert "=" not in cursor  # URL 쿼리에 그대로 쓸 수 있도록 패딩 제거
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+def test_cursor_accepts_iso_string() -> None:
+    assert decode_cursor(encode_cursor("2026-10-17T18:32:10", 7)) == (datetime(2026, 10, 17, 18, 32, 10), 7)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor!",
+        base64.urlsafe_b64encode(b"[1, 2, 3]").decode("ascii"),
+        base64.urlsafe_b64encode(b'["yesterday", 1]').decode("ascii"),
+        base64.urlsafe_b64encode(b'["2026-10-17T18:32:10", "x"]').decode("ascii"),
+        base64.urlsafe_b64encode(b"\xff\xfe").decode("ascii"),
+    ],
+)
+def test_malformed_cursor_raises_value_error(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_only_for_full_pages() -> None:
+    items = [{"created_at": datetime(2026, 10, 17), "id": i} for i in range(3)]
+    assert next_cursor(items, limit=4) is None
+    assert decode_cursor(next_cursor(items, limit=3)) == (datetime(2026, 10, 17), 2)
+    assert next_cursor([], limit=3) is None
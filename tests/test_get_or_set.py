@@ -0,0 +1,33 @@
+import time
+from typing import Any, Callable, Iterable
+
+import pytest
+import redis
+
+from app.services.caching_service import RedisCache
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> RedisCache:
+    """
+    Redis 없이 get_or_set의 분기만 확인할 수 있도록 락 로딩을 바로 loader 실행으로 바꾼 캐시
+    """
+    cache = RedisCache(redis.Redis())
+
+    def load(key: str, loader: Callable[[], Any], expire: int, tags: Iterable[str], stale: Any) -> Any:
+        return loader()
+
+    monkeypatch.setattr(cache, "_load_with_lock", load)
+    return cache
+
+
+@pytest.mark.parametrize("legacy", [[{"id": 1}], {"id": 1}, "text", 42])
+def test_legacy_value_is_a_miss(cache: RedisCache, monkeypatch: pytest.MonkeyPatch, legacy: Any) -> None:
+    monkeypatch.setattr(cache, "get", lambda key: legacy)
+    assert cache.get_or_set("quizzes:list:user:1:skip:0:limit:100", lambda: ["fresh"]) == ["fresh"]
+
+
+def test_fresh_entry_is_returned(cache: RedisCache, monkeypatch: pytest.MonkeyPatch) -> None:
+    entry = {"v": ["cached"], "exp": time.time() + 3600, "delta": 0.0}
+    monkeypatch.setattr(cache, "get", lambda key: entry)
+    assert cache.get_or_set("quiz:1", lambda: ["fresh"]) == ["cached"]
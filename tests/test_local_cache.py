@@ -0,0 +1,72 @@
+from typing import List
+
+import pytest
+
+from app.services import caching_service
+from app.services.caching_service import LocalCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> List[float]:
+    """
+    LocalCache가 보는 시간을 테스트에서 직접 움직일 수 있게 합니다.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(caching_service.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_stored_bytes() -> None:
+    cache = LocalCache(max_items=10, ttl=60)
+    cache.set("a", b"1")
+    assert cache.get("a") == b"1"
+    assert cache.get("missing") is None
+
+
+def test_entries_expire_after_ttl(clock: List[float]) -> None:
+    cache = LocalCache(max_items=10, ttl=60)
+    cache.set("a", b"1")
+    clock[0] += 59
+    assert cache.get("a") == b"1"
+    clock[0] += 1
+    assert cache.get("a") is None
+
+
+def test_redis_ttl_caps_local_ttl(clock: List[float]) -> None:
+    cache = LocalCache(max_items=10, ttl=60)
+    cache.set("short", b"1", expire=5)
+    cache.set("long", b"2", expire=600)
+    clock[0] += 5
+    assert cache.get("short") is None
+    clock[0] += 54
+    assert cache.get("long") == b"2"
+
+
+def test_non_positive_expire_is_not_stored() -> None:
+    cache = LocalCache(max_items=10, ttl=60)
+    cache.set("a", b"1", expire=0)
+    assert cache.get("a") is None
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = LocalCache(max_items=2, ttl=60)
+    cache.set("a", b"1")
+    cache.set("b", b"2")
+    cache.get("a")  # a를 최근 사용 항목으로 갱신
+    cache.set("c", b"3")
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+
+
+def test_delete_and_delete_prefix() -> None:
+    cache = LocalCache(max_items=10, ttl=60)
+    for key in ("quiz:1", "quiz:2", "question:1"):
+        cache.set(key, b"x")
+    cache.delete("question:1", "unknown")
+    assert cache.get("question:1") is None
+    cache.delete_prefix("quiz:")
+    assert cache.get("quiz:1") is None and cache.get("quiz:2") is None
+    cache.set("a", b"1")
+    cache.clear()
+    assert cache.get("a") is None
@@ -0,0 +1,146 @@
+"""
+퀴즈 → 문제 → 선택지 로딩 쿼리 수 검사
+
+문제 수가 다른 퀴즈들을 만들고, 전체 그래프를 불러오는 CRUD 메서드가 보내는 SQL 개수를 셉니다.
+쿼리 수가 문제 수에 따라 늘어나거나(N+1) 기대값을 넘으면 실패합니다.
+로딩 전략(selectinload)이 빠지거나 호출부가 다시 지연 로딩을 타게 되는 회귀를 잡기 위한 테스트입니다.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.crud.question import question_crud
+from app.crud.quiz import quiz_crud
+from app.crud.submission import submission_crud
+from app.models.base import Base
+from app.services.quiz_service import _quiz_snapshot
+
+# 퀴즈 ID = 문제 수, 제출 ID = 퀴즈 순서 (퀴즈마다 완료된 제출 하나)
+QUESTION_COUNTS = [1, 10, 100]
+OPTIONS_PER_QUESTION = 4
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, email, hashed_password, is_active, is_admin, created_at, updated_at)
+    VALUES (1, 'admin@test.local', 'x', true, true, now(), now())
+    """,
+    """
+    INSERT INTO quizzes (id, title, description, created_by, is_active, questions_per_quiz,
+                         randomize_questions, randomize_options, version, created_at, updated_at)
+    SELECT n, 'Quiz ' || n, '', 1, true, n, false, false, 1, now(), now()
+    FROM unnest(CAST(:question_counts AS INTEGER[])) n
+    """,
+    """
+    INSERT INTO questions (quiz_id, content, order_index, created_at, updated_at)
+    SELECT q.id, 'Question ' || n, n, now(), now()
+    FROM quizzes q, generate_series(1, q.id) n
+    """,
+    """
+    INSERT INTO options (question_id, content, is_correct, order_index, created_at, updated_at)
+    SELECT qs.id, 'Option ' || n, n = 1, n, now(), now()
+    FROM questions qs, generate_series(1, :options_per_question) n
+    """,
+    """
+    INSERT INTO submissions (user_id, quiz_id, score, is_completed, created_at, updated_at)
+    SELECT 1, q.id, 0, true, now(), now() FROM quizzes q ORDER BY q.id
+    """,
+    """
+    INSERT INTO submission_answers (submission_id, question_id, option_id, answered_at)
+    SELECT s.id, o.question_id, o.id, now()
+    FROM submissions s JOIN questions qs ON qs.quiz_id = s.quiz_id JOIN options o ON o.question_id = qs.id
+    WHERE o.order_index = 1
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+def seeded_engine(db_engine: Any) -> Iterator[Any]:
+    """
+    문제 수가 다른 퀴즈들을 채운 엔진. 모듈이 끝나면 테이블을 비웁니다.
+    """
+    params = {"question_counts": QUESTION_COUNTS, "options_per_question": OPTIONS_PER_QUESTION}
+    with db_engine.begin() as conn:
+        for sql in SEED_SQL:
+            conn.execute(text(sql), params)
+    yield db_engine
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with db_engine.begin() as conn:
+        conn.exec_driver_sql(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+
+
+def count_queries(engine: Any, fn: Callable[[Session], Any]) -> int:
+    """
+    fn이 실행하는 SQL 개수를 셉니다. 반환값을 스키마로 직렬화하는 것처럼 그래프 전체를 순회한 뒤 셉니다.
+    """
+    statements: List[str] = []
+
+    def capture(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(bind=engine) as db:
+            fn(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return len(statements)
+
+
+def _walk_quiz(quiz: Any) -> None:
+    for question in quiz.questions:
+        list(question.options)
+
+
+def _walk_questions(questions: List[Any]) -> None:
+    for question in questions:
+        list(question.options)
+
+
+# 이름: (기대 쿼리 수, 퀴즈 ID와 제출 ID를 받아 로딩/순회하는 함수)
+CASES: Dict[str, Tuple[int, Callable[[Session, int, int], Any]]] = {
+    "quiz_crud.get_full": (
+        3,
+        lambda db, quiz_id, submission_id: _walk_quiz(quiz_crud.get_full(db, id=quiz_id)),
+    ),
+    "question_crud.get_by_quiz_with_options": (
+        2,
+        lambda db, quiz_id, submission_id: _walk_questions(
+            question_crud.get_by_quiz_with_options(db, quiz_id=quiz_id, limit=1000)
+        ),
+    ),
+    "question_crud.get_questions_for_user": (
+        2,
+        lambda db, quiz_id, submission_id: question_crud.get_questions_for_user(
+            db, quiz_id=quiz_id, randomize_options=True
+        ),
+    ),
+    "_quiz_snapshot": (
+        3,
+        lambda db, quiz_id, submission_id: _quiz_snapshot(quiz_crud.get_full(db, id=quiz_id)),
+    ),
+    "submission_crud.get_by_quiz_and_submission_id": (
+        5,
+        lambda db, quiz_id, submission_id: _walk_quiz(
+            submission_crud.get_by_quiz_and_submission_id(db, quiz_id=quiz_id, submission_id=submission_id).quiz
+        ),
+    ),
+    "submission_crud.get_with_details": (
+        2,
+        lambda db, quiz_id, submission_id: submission_crud.get_with_details(db, id=submission_id).answers,
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_graph_loaders_use_constant_queries(seeded_engine: Any, name: str) -> None:
+    expected, fn = CASES[name]
+    counts = [
+        count_queries(seeded_engine, lambda db: fn(db, quiz_id, submission_id))
+        for submission_id, quiz_id in enumerate(QUESTION_COUNTS, start=1)
+    ]
+    assert len(set(counts)) == 1, f"query count scales with quiz size: {counts}"
+    assert counts[0] <= expected
@@ -0,0 +1,147 @@
+"""
+핫 쿼리 실행 계획 검사
+
+CRUD 메서드가 실제로 보내는 SQL을 가로채 EXPLAIN을 실행하고,
+submissions/questions/options 테이블을 순차 스캔(Seq Scan)하는 쿼리가 있으면 실패합니다.
+인덱스가 빠지거나 쿼리 모양이 바뀌어 인덱스를 타지 않게 되는 회귀를 잡기 위한 테스트입니다.
+테스트 데이터는 작으므로 enable_seqscan을 끄고 EXPLAIN합니다. (쓸 수 있는 인덱스가 없을 때만 순차 스캔이 남음)
+"""
+import json
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.crud.question import question_crud
+from app.crud.quiz import quiz_crud
+from app.crud.submission import submission_crud
+from app.models.base import Base
+from app.models.question import Question
+
+USERS = 200
+QUIZZES = 50
+QUESTIONS_PER_QUIZ = 5
+OPTIONS_PER_QUESTION = 4
+SUBMISSIONS_PER_USER = 10
+
+# 순차 스캔이 허용되지 않는 테이블
+HOT_TABLES = {"submissions", "questions", "options"}
+
+SEED_SQL = [
+    """
+    INSERT INTO users (id, email, hashed_password, is_active, is_admin, created_at, updated_at)
+    SELECT g, 'user' || g || '@test.local', 'x', true, false, now(), now()
+    FROM generate_series(1, :users) g
+    """,
+    """
+    INSERT INTO quizzes (id, title, description, created_by, is_active, questions_per_quiz,
+                         randomize_questions, randomize_options, version, created_at, updated_at)
+    SELECT g, 'Quiz ' || g, '', 1, true, 10, false, false, 1, now(), now()
+    FROM generate_series(1, :quizzes) g
+    """,
+    """
+    INSERT INTO questions (quiz_id, content, order_index, created_at, updated_at)
+    SELECT q, 'Question ' || n, n, now(), now()
+    FROM generate_series(1, :quizzes) q, generate_series(1, :questions_per_quiz) n
+    """,
+    """
+    INSERT INTO options (question_id, content, is_correct, order_index, created_at, updated_at)
+    SELECT qs.id, 'Option ' || n, n = 1, n, now(), now()
+    FROM questions qs, generate_series(1, :options_per_question) n
+    """,
+    """
+    INSERT INTO submissions (user_id, quiz_id, score, is_completed, created_at, updated_at)
+    SELECT u, (u * 7 + k) % :quizzes + 1, random() * 100, k % 5 <> 0,
+           now() - random() * interval '30 days', now()
+    FROM generate_series(1, :users) u, generate_series(1, :submissions_per_user) k
+    """,
+]
+
+
+@pytest.fixture(scope="module")
+def seeded_engine(db_engine: Any) -> Iterator[Any]:
+    """
+    데이터를 채우고 통계를 갱신한 엔진. 모듈이 끝나면 테이블을 비웁니다.
+    """
+    params = {
+        "users": USERS,
+        "quizzes": QUIZZES,
+        "questions_per_quiz": QUESTIONS_PER_QUIZ,
+        "options_per_question": OPTIONS_PER_QUESTION,
+        "submissions_per_user": SUBMISSIONS_PER_USER,
+    }
+    with db_engine.begin() as conn:
+        for sql in SEED_SQL:
+            conn.execute(text(sql), params)
+    with db_engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+    yield db_engine
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with db_engine.begin() as conn:
+        conn.exec_driver_sql(f"TRUNCATE {tables} RESTART IDENTITY CASCADE")
+
+
+def _plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def explain(engine: Any, fn: Callable[[Session], Any]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+    """
+    fn이 실행하는 SQL을 모두 가로채 EXPLAIN하고, (SQL, 테이블 스캔 노드 목록)을 반환합니다.
+    """
+    statements: List[Tuple[str, Any]] = []
+
+    def capture(
+        conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        with Session(bind=engine) as db:
+            fn(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    results = []
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            scans = [node for node in _plan_nodes(plan[0]["Plan"]) if "Relation Name" in node]
+            results.append((statement, scans))
+        conn.exec_driver_sql("RESET enable_seqscan")
+    return results
+
+
+# 시드 데이터에서 user_id=123은 (123 * 7 + k) % QUIZZES + 1 번 퀴즈들에 제출 기록이 있음
+USER_ID, QUIZ_ID = 123, (123 * 7 + 5) % QUIZZES + 1
+
+CASES: Dict[str, Callable[[Session], Any]] = {
+    "get_in_progress_by_user_and_quiz": lambda db: submission_crud.get_in_progress_by_user_and_quiz(
+        db, user_id=USER_ID, quiz_id=QUIZ_ID
+    ),
+    "get_by_user_and_quiz": lambda db: submission_crud.get_by_user_and_quiz(
+        db, user_id=USER_ID, quiz_id=QUIZ_ID
+    ),
+    "get_by_quiz": lambda db: submission_crud.get_by_quiz(db, quiz_id=QUIZ_ID),
+    "get_quizzes_with_status": lambda db: quiz_crud.get_quizzes_with_status(db, user_id=USER_ID),
+    "get_questions_by_quiz": lambda db: question_crud.get_questions_by_quiz(db, quiz_id=QUIZ_ID),
+    "question.options": lambda db: db.query(Question).filter(Question.quiz_id == QUIZ_ID).first().options,
+}
+
+
+@pytest.mark.parametrize("name", list(CASES))
+def test_hot_queries_avoid_sequential_scans(seeded_engine: Any, name: str) -> None:
+    for statement, scans in explain(seeded_engine, CASES[name]):
+        seq_scans = [
+            f"{node['Node Type']} on {node['Relation Name']}"
+            for node in scans
+            if node["Node Type"] == "Seq Scan" and node["Relation Name"] in HOT_TABLES
+        ]
+        assert not seq_scans, f"{seq_scans}: {' '.join(statement.split())}"
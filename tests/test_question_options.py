@@ -0,0 +1,108 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.crud.question import question_crud
+from app.models.option import Option
+from app.models.question import Question
+from app.models.quiz import Quiz
+from app.models.submission import Submission
+from app.models.submission_answer import SubmissionAnswer
+from app.models.user import User
+from app.schemas.question import OptionCreate, OptionUpdate, QuestionCreate, QuestionUpdate
+
+
+def _answered_question(db: Session) -> Question:
+    """
+    선택지 3개짜리 문제와 마지막 선택지를 고른 완료된 제출을 만듭니다.
+    """
+    user = User(email="user@test.local", hashed_password="x")
+    db.add(user)
+    db.flush()
+    quiz = Quiz(title="Quiz", description="", created_by=user.id)
+    db.add(quiz)
+    db.flush()
+    question = question_crud.create_with_quiz(
+        db,
+        obj_in=QuestionCreate(
+            content="Question",
+            quiz_id=quiz.id,
+            options=[
+                OptionCreate(content="A", is_correct=True),
+                OptionCreate(content="B"),
+                OptionCreate(content="C"),
+            ],
+        ),
+        quiz_id=quiz.id,
+    )
+    submission = Submission(user_id=user.id, quiz_id=quiz.id, score=100.0, is_completed=True)
+    db.add(submission)
+    db.flush()
+    db.add(
+        SubmissionAnswer(
+            submission_id=submission.id, question_id=question.id, option_id=question.options[-1].id
+        )
+    )
+    db.commit()
+    return question
+
+
+def test_option_edit_keeps_stored_answers(db: Session) -> None:
+    question = _answered_question(db)
+    option_ids = [option.id for option in question.options]
+
+    question_crud.update_with_options(
+        db,
+        db_obj=question,
+        obj_in=QuestionUpdate(
+            options=[
+                OptionUpdate(content="A (edited)"),
+                OptionUpdate(content="B"),
+                OptionUpdate(content="C"),
+                OptionUpdate(content="D"),
+            ]
+        ),
+    )
+
+    options = db.query(Option).filter(Option.question_id == question.id).order_by(Option.order_index).all()
+    assert [option.id for option in options[:3]] == option_ids
+    assert [option.content for option in options] == ["A (edited)", "B", "C", "D"]
+    assert options[0].is_correct and not options[3].is_correct
+    answer = db.query(SubmissionAnswer).one()
+    assert answer.option_id == option_ids[2]
+
+
+def test_removing_answered_option_is_rejected(db: Session) -> None:
+    question = _answered_question(db)
+
+    with pytest.raises(HTTPException) as exc_info:
+        question_crud.update_with_options(
+            db, db_obj=question, obj_in=QuestionUpdate(options=[OptionUpdate(), OptionUpdate()])
+        )
+    assert exc_info.value.status_code == 400
+    db.rollback()
+    assert db.query(SubmissionAnswer).count() == 1
+    assert db.query(Option).filter(Option.question_id == question.id).count() == 3
+
+
+def test_edit_must_keep_exactly_one_correct_option(db: Session) -> None:
+    question = _answered_question(db)
+
+    with pytest.raises(HTTPException) as exc_info:
+        question_crud.update_with_options(
+            db,
+            db_obj=question,
+            obj_in=QuestionUpdate(options=[OptionUpdate(), OptionUpdate(is_correct=True), OptionUpdate()]),
+        )
+    assert exc_info.value.status_code == 400
+    db.rollback()
+
+    question_crud.update_with_options(
+        db,
+        db_obj=question,
+        obj_in=QuestionUpdate(
+            options=[OptionUpdate(is_correct=False), OptionUpdate(is_correct=True), OptionUpdate()]
+        ),
+    )
+    options = db.query(Option).filter(Option.question_id == question.id).order_by(Option.order_index).all()
+    assert [option.is_correct for option in options] == [False, True, False]
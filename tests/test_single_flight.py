@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from app.services.caching_service import SingleFlight
+
+
+def test_concurrent_calls_share_one_load() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls: List[int] = []
+
+    def load() -> str:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(flight.do, "quiz:1", load)
+        started.wait(5)
+        followers = [pool.submit(flight.do, "quiz:1", load) for _ in range(4)]
+        release.set()
+        results = [leader.result(5)] + [future.result(5) for future in followers]
+
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_follower_gets_stale_value_without_waiting() -> None:
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def load() -> str:
+        started.set()
+        release.wait(5)
+        return "fresh"
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(flight.do, "quiz:1", load)
+        started.wait(5)
+        assert flight.do("quiz:1", lambda: "unused", stale="stale") == "stale"
+        release.set()
+        assert leader.result(5) == "fresh"
+
+
+def test_failed_load_releases_key() -> None:
+    flight = SingleFlight()
+
+    def fail() -> str:
+        raise RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("quiz:1", fail)
+    # 실패한 로딩이 끝나면 다음 호출은 새로 로딩
+    assert flight.do("quiz:1", lambda: "value") == "value"